@@ -1,4 +1,5 @@
 from dotenv import load_dotenv
+from app.constants import CHROME_PATH, HTML_PARSER, AIRBNB_BASE_URL
 import os
 
 ENV_FILE = '.env.dev'
@@ -11,4 +12,7 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_NAME = os.getenv("DB_NAME", "air_connect")
 DB_USER = os.getenv("DB_USER", "air")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "devpassword")
-DB_ROOT_PASSWORD = os.getenv("DB_ROOT_PASSWORD", "devpassword")
\ No newline at end of file
+DB_ROOT_PASSWORD = os.getenv("DB_ROOT_PASSWORD", "devpassword")
+CHROME_PATH = os.getenv("CHROME_PATH", CHROME_PATH)  # 빈 문자열이면 playwright 에 포함된 chromium 사용
+HTML_PARSER = os.getenv("HTML_PARSER", HTML_PARSER)  # 상세 페이지 HTML 파서 ( html.parser, lxml, selectolax )
+AIRBNB_BASE_URL = os.getenv("AIRBNB_BASE_URL", AIRBNB_BASE_URL).rstrip('/')  # ex) http://127.0.0.1:8080 ( script/mock_airbnb_server.py )
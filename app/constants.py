@@ -2,5 +2,48 @@ import os
 
 
 LOG_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/log"
+SEEN_INDEX_DIR = f"{os.path.dirname(os.path.abspath(__file__))}/seen"  # 수집 일자별 listing id 인덱스 파일 경로
+GEOJSON_DIR = f"{os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}/file"
+GEOJSON_FILE_LIST = ['korea.geojson', 'korea_gugun.geojson', 'malaysia.geojson']  # 지역 polygon 을 찾을 geojson 파일 ( 순서대로 탐색 )
+GEOJSON_NAME_FIELD_LIST = ['CTP_KOR_NM', 'CTP_ENG_NM', 'SIG_KOR_NM', 'SIG_ENG_NM', 'name']  # 지역 이름 속성
 CHROME_PATH = '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'
-BASE_AFTER_DAYS = 30 * 2  # 숙소 ID 탐색 시 기준이 되는 날짜( 현재 날짜로 부터 몇일 이후 날짜로 할 것 인지 )
\ No newline at end of file
+AIRBNB_BASE_URL = 'https://www.airbnb.co.kr'  # 검색, 상세 페이지를 요청할 주소 ( 부하 테스트 시 mock 서버 )
+HTML_PARSER = 'html.parser'  # 상세 페이지 HTML 파서 backend ( html.parser, lxml, selectolax )
+BASE_AFTER_DAYS = 30 * 2  # 숙소 ID 탐색 시 기준이 되는 날짜( 현재 날짜로 부터 몇일 이후 날짜로 할 것 인지 )
+DIVIDE_THRESHOLD = 250  # 검색된 숙소 개수가 이 값 이상이면 박스를 분할 ( 한번의 검색 결과는 최대 270개 )
+MAX_CONCURRENCY = 8  # page pool 크기 상한 ( 과도한 동시 요청으로 차단되는 것을 방지 )
+FRONTIER_LEASE_TIMEOUT = 60 * 60  # 워커가 죽은 것으로 보고 박스를 다시 임대할 수 있게 되는 시간(초)
+FRONTIER_LEASE_RENEW_INTERVAL = 5 * 60  # 박스를 탐색하는 동안 임대 시간을 갱신하는 간격(초)
+FRONTIER_POLL_INTERVAL = 10  # 임대할 박스가 없을 때 다른 워커의 분할 결과를 기다리는 간격(초)
+SEARCH_RESULT_LIMIT = 270  # 한번의 검색으로 볼 수 있는 최대 숙소 개수 ( 15 페이지 * 18 개 )
+SPLIT_TARGET_RATIO = 0.6  # 적응형 분할 시 하위 박스 하나에 기대하는 숙소 개수 비율 ( 밀도가 고르지 않으므로 여유를 둠 )
+MAX_SPLIT_FACTOR = 6  # 적응형 분할 시 한 축의 최대 분할 수 ( 6 x 6 )
+MIN_COORDINATES_PER_BOX = 5  # 밀도 기반 분할에 필요한 하위 박스 당 최소 과거 좌표 개수
+MAP_VIEWPORT_WIDTH = 640  # 검색 결과 지도 영역의 너비(px) ( zoom 계산용 )
+MAP_VIEWPORT_HEIGHT = 720  # 검색 결과 지도 영역의 높이(px) ( zoom 계산용 )
+MIN_ZOOM_LEVEL = 1
+MAX_ZOOM_LEVEL = 20
+PLAN_MERGE_RATIO = 0.5  # 형제 리프 박스들의 검색 개수 합이 DIVIDE_THRESHOLD * 비율 미만이면 다음 수집 계획에서 상위 박스로 병합
+REGION_BUFFER_DEGREE = 0.005  # 지역 polygon 경계 여유 ( 약 500m, 단순화된 해안선 근처 숙소가 제외되지 않도록 함 )
+DETAIL_QUEUE_SIZE = 300  # 상세 정보 수집 대기 queue 크기 ( 가득 차면 숙소 탐색이 기다림 )
+WRITER_FLUSH_INTERVAL = 5  # 일괄 저장 버퍼를 비우는 주기(초)
+WRITER_MAX_RETRY = 3  # 일괄 저장 실패 시 다시 시도하는 횟수
+WRITER_RETRY_DELAY = 1  # 일괄 저장을 다시 시도하기 전 대기 시간(초), 시도할 때마다 2배
+MAX_BIND_PARAMETERS = 32767  # PostgreSQL 한 쿼리의 최대 bind parameter 개수
+SEEN_INDEX_CAPACITY = 1 << 23  # listing id 인덱스 슬롯 수 ( 슬롯 당 8byte, 64MB sparse 파일 )
+SEEN_INDEX_MAX_LOAD = 0.7  # 인덱스가 이 비율 이상 차면 나머지 id 는 프로세스 메모리에 저장
+MAX_PAGE_NUM = 15  # 한번의 검색으로 볼 수 있는 최대 페이지 수
+API_PAGINATION_CONCURRENCY = 3  # StaysSearch API 로 다음 페이지를 동시에 요청하는 개수
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) ' \
+             'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+HTTP_TIMEOUT = 20  # 브라우저 없이 보내는 HTTP 요청의 timeout(초)
+REVIEW_API_NAME = 'StaysPdpReviewsQuery'  # 리뷰 모달이 리뷰 페이지를 요청하는 API
+REVIEW_API_CONCURRENCY = 4  # 숙소 하나의 리뷰 페이지를 동시에 요청하는 개수
+REVIEW_CAPTURE_TIMEOUT = 8  # 리뷰 모달을 띄운 뒤 리뷰 API 응답을 기다리는 시간(초)
+BLOCKED_RESOURCE_LIST = ['image', 'media', 'font', 'stylesheet', 'third-party']  # --block-resources 기본 차단 대상
+SCHEDULER_PAGE_SECONDS = 6  # 시간 예산 모드에서 검색 결과 1페이지 수집에 걸리는 것으로 보는 시간(초)
+SCHEDULER_DETAIL_SECONDS = 8  # 시간 예산 모드에서 숙소 상세 정보 1개 수집에 걸리는 것으로 보는 시간(초)
+SCHEDULER_MIN_STALE_RATIO = 0.05  # 이전 수집 숙소를 모두 갱신한 박스도 새 숙소가 있을 수 있으므로 두는 최소 갱신 비율
+BROWSER_SERVER_PORT = 9222  # script/browser_server.py 의 기본 CDP 포트
+MOCK_SERVER_PORT = 8080  # script/mock_airbnb_server.py 의 기본 포트
+ALLOWED_DOMAIN_LIST = ['airbnb.co.kr', 'airbnb.com', 'muscache.com']  # third-party 로 보지 않는 도메인 ( muscache 는 에어비앤비 스크립트 CDN )
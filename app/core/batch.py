@@ -0,0 +1,188 @@
+# third-party package
+from typing import Dict, List
+from dataclasses import replace
+from shapely.geometry import shape
+from playwright.async_api import async_playwright
+from app.logger import get_logger
+import asyncio
+import json
+import time
+
+# core package
+from app.core.list import collect_listing, create_resource_filter, create_browser_launcher
+
+# util module
+from app.util import generate_now_date_to_string, gather_or_cancel
+
+# model module
+from app.lib.model import ListingListRequest, CollectOption, RegionJob, RegionReport
+
+# metrics
+from app.lib import metrics
+
+# database
+from sqlalchemy import select, func
+from app.lib.entity import Listing
+from app.lib.database import session_factory
+
+# constants
+from app.constants import GEOJSON_NAME_FIELD_LIST
+
+"""
+batch.py
+여러 지역을 하나의 브라우저로 우선순위 순서대로 동시에 수집하는 batch
+"""
+
+logger = get_logger('app')
+
+
+def load_job_list(file_path: str, country: str) -> List[RegionJob]:
+    """
+    job 파일 또는 geojson 파일에서 수집할 지역 목록을 불러옵니다.
+    job 파일: [{"country": ..., "sido": ..., "ne_lat": ..., "ne_lng": ..., "sw_lat": ..., "sw_lng": ..., "priority": 1,
+               "region_name": ...}, ...]
+    :param country: geojson 파일 또는 country 가 없는 job 의 국가
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if isinstance(data, dict) and 'features' in data:
+        return load_job_list_from_geojson(data, country)
+    return [
+        RegionJob(
+            request=ListingListRequest(
+                sido=job['sido'],
+                ne_lat=float(job['ne_lat']),
+                ne_lng=float(job['ne_lng']),
+                sw_lat=float(job['sw_lat']),
+                sw_lng=float(job['sw_lng']),
+                country=job.get('country', country)
+            ),
+            priority=int(job.get('priority', 0)),
+            region_name=job.get('region_name')
+        )
+        for job in data
+    ]
+
+
+def load_job_list_from_geojson(geojson_data: Dict, country: str) -> List[RegionJob]:
+    """
+    geojson 의 지역마다 바운딩 박스를 구합니다. ( script/get_bounding_box.py 와 같은 방식, 우선순위는 모두 0 )
+    """
+    result = []
+    for feature in geojson_data['features']:
+        properties = feature['properties']
+        name = next((properties[field] for field in GEOJSON_NAME_FIELD_LIST if properties.get(field)), None)
+        if name is None:
+            logger.warning(f"이름이 없는 지역은 건너뜁니다. - properties: {properties}")
+            continue
+
+        min_lng, min_lat, max_lng, max_lat = shape(feature['geometry']).bounds
+        result.append(RegionJob(request=ListingListRequest(
+            sido=name,
+            ne_lat=max_lat,
+            ne_lng=max_lng,
+            sw_lat=min_lat,
+            sw_lng=min_lng,
+            country=country
+        )))
+    return result
+
+
+async def collect_region_list(job_list: List[RegionJob], option: CollectOption,
+                              region_concurrency: int) -> List[RegionReport]:
+    """
+    우선순위가 높은 지역부터 region_concurrency 개씩 동시에 수집합니다.
+    모든 지역이 하나의 브라우저를 공유하며, option 의 concurrency, detail_concurrency 만큼의 page 를 동시에 수집하는 지역들이 나누어 사용합니다.
+    """
+    region_concurrency = max(min(region_concurrency, option.concurrency, len(job_list)), 1)
+    region_option = split_page_option(option, region_concurrency)
+    if option.region_name is not None:
+        logger.warning("여러 지역 수집에서는 --region-name 대신 job 의 region_name ( 없으면 sido ) 을 사용합니다.")
+
+    queue = asyncio.Queue()
+    for job in sorted(job_list, key=lambda job: -job.priority):  # 우선순위가 같으면 입력 순서
+        queue.put_nowait(job)
+
+    report_list = []
+    async with async_playwright() as playwright:
+        resource_filter = create_resource_filter(option)
+        launcher = create_browser_launcher(playwright, option, resource_filter)
+
+        async def work():
+            while not queue.empty():
+                job = queue.get_nowait()
+                report_list.append(await collect_region(job, region_option, launcher))
+
+        logger.info(f"{len(job_list)}개 지역을 {region_concurrency}개씩 동시에 수집합니다. "
+                    f"- 지역 당 page: {region_option.concurrency}개, 상세 정보 page: {region_option.detail_concurrency}개")
+        await gather_or_cancel(*[work() for _ in range(region_concurrency)])
+
+        if resource_filter is not None:
+            resource_filter.log_summary()
+        await launcher.close()
+
+    write_region_report_log(report_list)
+    return report_list
+
+
+def split_page_option(option: CollectOption, region_concurrency: int) -> CollectOption:
+    """
+    동시에 수집하는 지역들이 사용하는 page 의 합이 option 의 page 개수를 넘지 않도록 지역 당 page 개수를 나눕니다.
+    """
+    return replace(
+        option,
+        concurrency=max(option.concurrency // region_concurrency, 1),
+        detail_concurrency=max(option.detail_concurrency // region_concurrency, 1) if option.detail_concurrency > 0 else 0
+    )
+
+
+async def collect_region(job: RegionJob, option: CollectOption, launcher) -> RegionReport:
+    """
+    한 지역을 수집하고, 수집 시간과 새로 저장된 숙소 개수를 기록합니다.
+    다른 지역의 수집이 계속되도록 실패한 지역은 failed 로 기록합니다.
+    수집 중 로그로 남기는 metrics 는 해당 지역의 값입니다.
+    """
+    request = job.request
+    collect_date = generate_now_date_to_string()
+    logger.info(f"[batch] {request.sido} 수집 시작 - 우선순위: {job.priority}")
+
+    async with session_factory() as session:
+        start_count = await count_collected_listing(session, request.sido, collect_date)
+    started_at = time.monotonic()
+
+    status = 'done'
+    try:
+        with metrics.scope():
+            await collect_listing(request, replace(option, region_name=job.region_name), launcher)
+    except Exception as e:
+        status = 'failed'
+        logger.error(f"[batch] {request.sido} 수집 실패: {e}", exc_info=True)
+
+    duration_seconds = time.monotonic() - started_at
+    async with session_factory() as session:
+        listing_count = await count_collected_listing(session, request.sido, collect_date) - start_count
+
+    report = RegionReport(request.sido, status, duration_seconds, listing_count)
+    logger.info(f"[batch] {request.sido} 수집 {status} - 소요 시간: {duration_seconds / 60:.1f}분, "
+                f"저장된 숙소: {listing_count}개, 분당 {report.listing_per_minute:.1f}개")
+    return report
+
+
+async def count_collected_listing(session, sido: str, collect_date: str) -> int:
+    query = select(func.count()).select_from(Listing).where(
+        Listing.sido == sido,
+        Listing.collect_date == collect_date
+    )
+    return (await session.execute(query)).scalar_one()
+
+
+def write_region_report_log(report_list: List[RegionReport]):
+    logger.info("[batch] 지역별 수집 결과")
+    for report in sorted(report_list, key=lambda report: -report.duration_seconds):
+        logger.info(f"[batch] {report.sido} - 상태: {report.status}, 소요 시간: {report.duration_seconds / 60:.1f}분, "
+                    f"저장된 숙소: {report.listing_count}개, 분당 {report.listing_per_minute:.1f}개")
+
+    total_count = sum(report.listing_count for report in report_list)
+    failed_count = sum(1 for report in report_list if report.status == 'failed')
+    logger.info(f"[batch] 전체 {len(report_list)}개 지역 ( 실패 {failed_count}개 ), 저장된 숙소: {total_count}개")
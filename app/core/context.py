@@ -0,0 +1,59 @@
+# third-party package
+from typing import List
+from dataclasses import replace
+
+# core package
+from app.core.split import BoxSplitter
+from app.core.plan import CrawlPlan, to_box
+from app.core.region import Region
+from app.core.pipeline import DetailPipeline
+
+# writer
+from app.lib.writer import ListingWriter
+
+# http client
+from app.lib.http_client import HttpClient
+
+# model module
+from app.lib.model import ListingListRequest, CollectOption
+
+"""
+context.py
+한번의 수집 실행 동안 traversal 함수들이 공유하는 상태
+"""
+
+
+class CrawlContext:
+    def __init__(self, option: CollectOption, splitter: BoxSplitter, plan: CrawlPlan | None = None,
+                 region: Region | None = None):
+        self.option = option
+        self.splitter = splitter
+        self.plan = plan
+        self.region = region
+        self.pipeline: DetailPipeline | None = None  # 상세 정보 수집을 분리한 경우에만 설정됨
+        self.writer: ListingWriter | None = None  # 일괄 저장하는 경우에만 설정됨
+        self.client: HttpClient | None = None  # 상세 정보를 HTTP 로 수집하는 경우에만 설정됨
+
+    def divide(self, request: ListingListRequest, searched_count: int) -> List[ListingListRequest]:
+        """
+        분할이 필요한 박스의 하위 박스 요청 목록 ( 지역 polygon 과 겹치지 않는 박스는 제외 )
+        """
+        children = [
+            replace(request, ne_lat=ne[0], ne_lng=ne[1], sw_lat=sw[0], sw_lng=sw[1])
+            for ne, sw in self.splitter.divide(request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng,
+                                               searched_count)
+        ]
+        if self.region is not None:
+            children = self.region.filter_request_list(children)
+        if self.plan is not None:
+            self.plan.record_division(to_box(request), [to_box(child) for child in children])
+        return children
+
+    def filter_listing_list(self, listing_list):
+        if self.region is None:
+            return listing_list
+        return self.region.filter_listing_list(listing_list)
+
+    def record_search(self, request: ListingListRequest, searched_count: int):
+        if self.plan is not None:
+            self.plan.record_search(to_box(request), searched_count)
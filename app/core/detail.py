@@ -1,16 +1,38 @@
 # third-party package
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from typing import List, Dict, Tuple, Callable, Awaitable
+from functools import partial
 from app.logger import get_logger
-from playwright.async_api import Page
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from playwright.async_api import Page, APIRequestContext
+import asyncio
+import base64
+import copy
+import json
 import re
-import time
 
 # util module
 from app.util import to_date, add_days
 
 # model module
-from app.lib.model import ListingRequest, Listing
+from app.lib.model import ListingRequest, Listing, ReviewApiTemplate
+
+# http client
+from app.lib.http_client import HttpClient
+
+# html parser
+from app.lib.html_parser import HtmlNode, parse_html
+
+# metrics
+from app.lib import metrics
+
+# parser pool
+from app.lib.parser_pool import parse
+
+# config
+from app.config import HTML_PARSER, AIRBNB_BASE_URL
+
+# constants
+from app.constants import REVIEW_API_NAME, REVIEW_API_CONCURRENCY, REVIEW_CAPTURE_TIMEOUT
 
 """
 info_task.py
@@ -18,17 +40,26 @@ info_task.py
 """
 
 logger = get_logger('app')
+review_api_template: ReviewApiTemplate | None = None  # 브라우저에서 캡처한 리뷰 API 요청 ( HTTP 수집 시 재사용 )
 
 
-async def fetch_listing_info(page: Page, request: ListingRequest) -> Listing | None:
+async def fetch_listing_info(page: Page, request: ListingRequest, client: HttpClient | None = None) -> Listing | None:
     """
     특정 숙소의 정보를 가져옵니다.
+    :param client: 주어지면 먼저 브라우저 없이 HTML 의 내장 데이터로 수집하고, 데이터가 없을 때만 브라우저로 수집합니다.
     :return:
     """
+    if client is not None:
+        listing_info = await fetch_listing_info_by_http(client, request)
+        if listing_info is not None:
+            return listing_info
+        metrics.increase('detail.browser_fallback')
+        logger.info(f"숙소 ID {request.id} 내장 데이터로 수집하지 못하여 브라우저로 수집합니다.")
+
     try:
         html = await _request_listing_info_to_airbnb(page, request)
         base_date = request.base_date  # 추출 기준 일자 (해당 날짜부터 30일치 추출)
-        listing_info_dict = _extract_listing_info(html, base_date)
+        listing_info_dict = await parse(_extract_listing_info, html, base_date)
         foreigner_review_count = 0
 
         # 외국인 댓글 개수 추출
@@ -60,11 +91,8 @@ async def _request_listing_info_to_airbnb(page: Page, request: ListingRequest) -
     https://www.airbnb.co.kr/rooms/1006263284659826158
     """
     try:
-        params = 'translate_ugc=false'  # 원문 요청
-        url = f"https://www.airbnb.co.kr/rooms/{request.id}?{params}"
-
         await page.goto(
-            url
+            _get_listing_url(request.id)
         )
 
         await page.wait_for_load_state('load')  # 추가적인 네트워크 요청이 없을떄 까지 대기
@@ -77,22 +105,193 @@ async def _request_listing_info_to_airbnb(page: Page, request: ListingRequest) -
         return ''
 
 
-def _extract_listing_info(html: str, base_date: str) -> Dict | None:
+def _get_listing_url(listing_id: str) -> str:
+    params = 'translate_ugc=false'  # 원문 요청
+    return f"{AIRBNB_BASE_URL}/rooms/{listing_id}?{params}"
+
+
+async def fetch_listing_info_by_http(client: HttpClient, request: ListingRequest) -> Listing | None:
+    """
+    브라우저 없이 숙소 상세 페이지 HTML 을 받아, 서버가 내려준 data-deferred-state JSON 에서 숙소 정보를 가져옵니다.
+    페이지에 포함되지 않은 리뷰는 리뷰 API 로 요청하며, 리뷰 API 요청 정보를 캡처하기 전에는 브라우저로 수집합니다.
+    ( 브라우저 수집에서 리뷰 API 요청을 캡처하므로, 외국인 리뷰 개수를 일부 리뷰로만 세지 않음 )
+    :return: 내장 데이터가 없거나 필요한 값이 빠져 있거나 모든 리뷰를 가져오지 못하면 None
+    """
+    try:
+        html = await client.get_text(_get_listing_url(request.id))
+        if html is None:
+            return None
+
+        listing_info_dict = await parse(_extract_listing_info_from_html, html, request.base_date)
+        if listing_info_dict is None:
+            return None
+
+        if listing_info_dict['embedded_review_count'] < listing_info_dict['review_count']:
+            if review_api_template is None or review_api_template.listing_id is None:
+                metrics.increase('detail.review_template_missing')
+                return None
+
+            # 페이지에 포함된 일부 리뷰 대신 모든 리뷰를 API 로 요청 ( client 의 동시 요청 개수 제한을 함께 받음 )
+            review_list = await _request_review_list(client.get_json, review_api_template, request.id,
+                                                     0, listing_info_dict['review_count'])
+            if review_list is None:
+                return None
+            listing_info_dict['foreigner_review_count'] = _extract_foreigner_review_count(review_list)
+
+        metrics.increase('detail.http')
+        return Listing(
+            id=request.id,
+            coordinate=request.coordinate,
+            title=listing_info_dict['title'],
+            rating=listing_info_dict['rating'],
+            review_count=listing_info_dict['review_count'],
+            foreigner_review_count=listing_info_dict['foreigner_review_count'],
+            option_list=listing_info_dict['option_list'],
+            reserved_count=listing_info_dict['reserved_count']
+        )
+    except Exception as e:
+        logger.error(f"특정 숙소 정보를 HTTP 로 가져오는데 실패: {e}", exc_info=True)
+        return None
+
+
+def _extract_deferred_state(html: str, parser: str = HTML_PARSER) -> Dict | None:
+    """
+    숙소 상세 페이지의 script#data-deferred-state-0 JSON
+    """
+    try:
+        script_tag_list = parse_html(html, parser).select('script#data-deferred-state-0')
+        if len(script_tag_list) == 0:
+            logger.info("숙소 상세 페이지에서 data-deferred-state script 태그를 찾을 수 없습니다.")
+            return None
+        return json.loads(script_tag_list[0].text)
+    except json.decoder.JSONDecodeError as je:
+        logger.error(f"json으로 파싱하는 데 실패하였습니다: {je}", exc_info=True)
+        return None
+
+
+def _extract_listing_info_from_html(html: str, base_date: str) -> Dict | None:
+    """
+    상세 페이지 HTML 의 내장 데이터에서 숙소 정보 추출 ( parser pool 에서 실행되므로 큰 내장 데이터 대신 결과 dict 만 반환 )
+    :return: 내장 데이터가 없거나 필요한 값이 빠져 있으면 None
+    """
+    deferred_state = _extract_deferred_state(html)
+    if deferred_state is None:
+        return None
+    return _extract_listing_info_from_state(deferred_state, base_date)
+
+
+def _extract_listing_info_from_state(deferred_state: Dict, base_date: str) -> Dict | None:
+    """
+    내장 데이터에서 숙소 정보 추출 ( 섹션 id 는 상세 페이지 DOM 의 data-section-id 와 같음 )
+    예약 개수는 달력 데이터가 없으면 -1, 외국인 리뷰 개수는 페이지에 포함된 리뷰만 셉니다.
+    ( 페이지에 포함된 리뷰가 일부뿐이면 fetch_listing_info_by_http 에서 모든 리뷰로 다시 셉니다. )
+    :return: 타이틀, 평점, 리뷰 개수, 옵션 중 하나라도 없으면 None
+    """
+    sections = _extract_pdp_sections(deferred_state)
+    title_section = sections.get('TITLE_DEFAULT') or {}
+    review_section = sections.get('REVIEWS_DEFAULT') or {}
+    amenity_section = sections.get('AMENITIES_DEFAULT') or {}
+
+    title = title_section.get('title')
+    rating = review_section.get('overallRating')
+    review_count = review_section.get('overallCount')
+    amenity_group_list = amenity_section.get('previewAmenitiesGroups')
+    if title is None or rating is None or review_count is None or amenity_group_list is None:
+        return None
+
+    option_list = {
+        amenity['title'].strip()
+        for amenity_group in amenity_group_list
+        for amenity in amenity_group.get('amenities', [])
+        if amenity.get('available', True) and amenity.get('title')
+    }
+    review_list = [review.get('comments') or '' for review in review_section.get('reviews', [])]
+
+    return {
+        'title': title,
+        'reserved_count': _extract_reserved_count_from_state(deferred_state, base_date),
+        'rating': float(rating),
+        'review_count': int(review_count),
+        'foreigner_review_count': _extract_foreigner_review_count(review_list),
+        'embedded_review_count': len(review_list),
+        'option_list': list(option_list)
+    }
+
+
+def _extract_pdp_sections(deferred_state: Dict) -> Dict[str, Dict]:
+    """
+    :return: { sectionId: section }
+    """
+    result = {}
+    for niobe_data in deferred_state.get('niobeMinimalClientData') or []:
+        try:
+            presentation = niobe_data[1].get('data', {}).get('presentation', {})
+        except (IndexError, AttributeError):
+            continue
+        sections = (presentation.get('stayProductDetailPage') or {}).get('sections', {}).get('sections', [])
+        for section in sections:
+            result[section.get('sectionId')] = section.get('section')
+    return result
+
+
+def _extract_reserved_count_from_state(deferred_state: Dict, base_date: str) -> int:
+    """
+    내장 데이터의 달력(calendarMonths)에서 base_date를 기준으로 30일 동안의 예약 개수 추출
+    :return: 달력 데이터가 없으면 -1
+    """
+    calendar_month_list = _find_value(deferred_state, 'calendarMonths')
+    if not calendar_month_list:
+        return -1
+
+    base_date = to_date(base_date, "%Y-%m-%d")
+    reserved_count = 0
+    for calendar_month in calendar_month_list:
+        for day in calendar_month.get('days', []):
+            date = to_date(day['calendarDate'], "%Y-%m-%d")
+            is_check_date = base_date <= date <= add_days(base_date, 30)
+            if is_check_date and day.get('available') is False:
+                reserved_count += 1
+    return reserved_count
+
+
+def _find_value(data, key: str):
+    """
+    중첩된 dict, list 에서 key 의 첫번째 값을 찾습니다.
+    """
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+
+    for child in children:
+        value = _find_value(child, key)
+        if value is not None:
+            return value
+    return None
+
+
+def _extract_listing_info(html: str, base_date: str, parser: str = HTML_PARSER) -> Dict | None:
     """
     숙소 정보 추출
     :param html:
     html 숙박 상세 페이지
     :param base_date:
     기준 날짜 ex) 2024-11-04
+    :param parser:
+    HTML 파서 backend ( html.parser, lxml, selectolax )
     :return:
     """
     try:
-        soup = BeautifulSoup(html, 'html.parser')
-        title = _extract_title(soup)
-        reserved_count = _extract_reserved_count(soup, base_date)  # 예약된 날짜 개수 가져오기
-        rating = _extract_rating(soup)
-        review_count = _extract_review_count(soup)
-        option_list = _extract_option_list(soup)
+        document = parse_html(html, parser)  # 트리는 한번만 만들고 모든 항목 추출에 재사용
+        title = _extract_title(document)
+        reserved_count = _extract_reserved_count(document, base_date)  # 예약된 날짜 개수 가져오기
+        rating = _extract_rating(document)
+        review_count = _extract_review_count(document)
+        option_list = _extract_option_list(document)
 
         return {
             'title': title,
@@ -106,28 +305,26 @@ def _extract_listing_info(html: str, base_date: str) -> Dict | None:
         return None
 
 
-def _extract_title(soup: BeautifulSoup) -> str:
+def _extract_title(document: HtmlNode) -> str:
     """
     숙박 상세 페이지 타이틀 추출
     """
     try:
-        title_div = soup.find(attrs={
-            'data-section-id': 'TITLE_DEFAULT'
-        })
+        title_div = document.find_by_attr('data-section-id', 'TITLE_DEFAULT')
         return title_div.find('h1').text
     except Exception as e:
         logger.error(f"숙소 타이틀 추출 실패: {e}", exc_info=True)
         return ''
 
 
-def _extract_reserved_count(soup: BeautifulSoup, base_date: str) -> int:
+def _extract_reserved_count(document: HtmlNode, base_date: str) -> int:
     """
     숙박 상세 페이지에서 base_date를 기준으로 30일 동안의 예약 개수 추출
     """
     try:
         base_date = to_date(base_date, "%Y-%m-%d")
         prefix_value = 'calendar-day-'
-        elements = soup.select(f"[data-testid^='{prefix_value}']")
+        elements = document.select(f"[data-testid^='{prefix_value}']")
         reserved_count = 0
         for element in elements:
             date_str = element.get('data-testid').replace(prefix_value, '').rstrip('.')  # 날짜 문자열 값을 추출 ex) 2024.04.17
@@ -144,40 +341,36 @@ def _extract_reserved_count(soup: BeautifulSoup, base_date: str) -> int:
         return -1
 
 
-def _extract_rating(soup: BeautifulSoup) -> float:
+def _extract_rating(document: HtmlNode) -> float:
     """
     숙박 상세 페이지에서 평점 추출
     """
     try:
-        rating_container_div = soup.find(attrs={
-            'data-testid': 'pdp-reviews-highlight-banner-host-rating'
-        })
+        rating_container_div = document.find_by_attr('data-testid', 'pdp-reviews-highlight-banner-host-rating')
         return float(rating_container_div.find('div').text)
     except Exception:
         logger.info(f"숙소 평점 추출 실패 - 재시도")
         try:
             # 선 케이스가 실패할 경우 h2 > [dir="ltr"] 에서 재 추출 필요.
-            rating_and_review_count = soup.select("h2 > [dir='ltr'] > span")[0].text
+            rating_and_review_count = document.select("h2 > [dir='ltr'] > span")[0].text
             return float(rating_and_review_count.split('·')[0].strip())
         except Exception as e:
             logger.error(f"숙소 평점 추출 실패: {e}", exc_info=True)
     return -1.0
 
 
-def _extract_review_count(soup: BeautifulSoup) -> int:
+def _extract_review_count(document: HtmlNode) -> int:
     """
     숙소 상세 페이지에서 리뷰 개수 추출
     """
     try:
-        review_container_div = soup.find(attrs={
-            'data-testid': 'pdp-reviews-highlight-banner-host-review'
-        })
-        return int(review_container_div.find('div').contents[0])
+        review_container_div = document.find_by_attr('data-testid', 'pdp-reviews-highlight-banner-host-review')
+        return int(review_container_div.find('div').first_child_text)
     except Exception:
         logger.info(f"숙소 리뷰 개수 추출 실패 - 재시도")
         try:
             # 선 케이스가 실패할 경우 h2 > [dir="ltr"] 에서 재 추출 필요.
-            rating_and_review_count = soup.select("h2 > [dir='ltr'] > span")[0].text
+            rating_and_review_count = document.select("h2 > [dir='ltr'] > span")[0].text
             match = re.search(r'\d+', rating_and_review_count.split('·')[1])
             return int(match[0])
         except Exception as e:
@@ -185,18 +378,16 @@ def _extract_review_count(soup: BeautifulSoup) -> int:
     return -1
 
 
-def _extract_option_list(soup: BeautifulSoup) -> List:
+def _extract_option_list(document: HtmlNode) -> List:
     """
     숙소 상세 페이지에서 옵션 리스트 추출
     """
     try:
         result = set()
-        option_list_container_div = soup.find(attrs={
-            'data-section-id': 'AMENITIES_DEFAULT'
-        })
+        option_list_container_div = document.find_by_attr('data-section-id', 'AMENITIES_DEFAULT')
 
         section = option_list_container_div.find('section')
-        option_div_list = section.find_all('div', recursive=False)[1].find_all('div', recursive=False)
+        option_div_list = section.child_elements('div')[1].child_elements('div')
 
         for option_div in option_div_list:
             try:
@@ -211,58 +402,158 @@ def _extract_option_list(soup: BeautifulSoup) -> List:
 
 async def _request_all_review(page: Page) -> list[str]:
     """
-    리뷰 모달을 띄우고, 모든 리뷰 정보를 가져옵니다.
+    리뷰 모달을 띄울 때 호출되는 리뷰 API 응답을 캡처하고, 나머지 리뷰 페이지는 offset 만 바꾸어 동시에 요청합니다.
+    ( 모달 스크롤 없이 리뷰 원문을 JSON 으로 가져옵니다. )
+    캡처한 요청은 이후 HTTP 로 수집하는 숙소의 리뷰 요청에 재사용합니다.
     """
+    global review_api_template
+    captured = {}
+    capture_event = asyncio.Event()
+
+    async def handle_response(response):
+        if REVIEW_API_NAME in response.url and 'request' not in captured:
+            captured['request'] = response.request
+            captured['content'] = await response.text()
+            capture_event.set()
+
+    page.on('response', handle_response)
     try:
-        result = []
         await page.wait_for_selector('[data-testid="pdp-show-all-reviews-button"]', timeout=1500)
         await page.click('[data-testid="pdp-show-all-reviews-button"]')  # 모든 리뷰 보기 버튼 클릭
 
-        await page.wait_for_selector('[data-testid="modal-container"]', timeout=1500)
+        await asyncio.wait_for(capture_event.wait(), timeout=REVIEW_CAPTURE_TIMEOUT)
+        template = _create_review_api_template(captured['request'].url, await captured['request'].all_headers())
+        review_list, total_count = _extract_review_page(json.loads(captured['content']))
+        if template is None:
+            return review_list
+        review_api_template = template
+
+        remaining_review_list = await _request_review_list(partial(_get_json, page.request), template,
+                                                           template.listing_id,
+                                                           template.offset + template.limit, total_count,
+                                                           allow_partial=True)
+        return review_list + (remaining_review_list or [])
+    except asyncio.TimeoutError:
+        logger.error(f"리뷰 API 응답을 {REVIEW_CAPTURE_TIMEOUT}초 안에 캡처하지 못함")
+        return []
+    except Exception as e:
+        logger.error(f"모든 리뷰 정보 가져오기 실패: {e}", exc_info=True)
+        return []
+    finally:
+        page.remove_listener('response', handle_response)
 
-        dialog_div = await page.query_selector('div[role="dialog"]')
 
-        scrollable_div = await dialog_div.query_selector('div:last-child')
-        assert scrollable_div is not None, "❌ scrollable div가 존재하지 않음!"
+def _create_review_api_template(url: str, headers: Dict[str, str]) -> ReviewApiTemplate | None:
+    """
+    캡처한 리뷰 API 요청 url 에서 variables 를 분리합니다.
+    :return: variables 에 pdpReviewsRequest 가 없으면 None
+    """
+    try:
+        split_url = urlsplit(url)
+        params = dict(parse_qsl(split_url.query))
+        variables = json.loads(params.pop('variables'))
+        reviews_request = variables['pdpReviewsRequest']
+        return ReviewApiTemplate(
+            url=urlunsplit((split_url.scheme, split_url.netloc, split_url.path, '', '')),
+            params=params,
+            variables=variables,
+            headers={
+                name: value for name, value in headers.items()
+                if name.lower() not in ('content-length', 'cookie', 'host')
+            },
+            listing_id=_decode_listing_id(variables.get('id')),
+            offset=int(reviews_request.get('offset', 0)),
+            limit=int(reviews_request.get('limit', 24))
+        )
+    except Exception as e:
+        logger.error(f"리뷰 API 요청 정보를 분석하지 못함: {e}")
+        return None
 
-        prev_height = 0
 
-        # 스크롤 링
-        while True:
-            # 현재 scrollHeight 측정
-            current_height = await page.evaluate('(el) => el.scrollHeight', scrollable_div)
+def _decode_listing_id(encoded_id: str | None) -> str | None:
+    """
+    리뷰 API 의 숙소 id ( base64 로 인코딩된 'StayListing:<숙소 ID>' )
+    """
+    try:
+        prefix, listing_id = base64.b64decode(encoded_id).decode().split(':', 1)
+        return listing_id if prefix == 'StayListing' else None
+    except Exception:
+        return None
 
-            # 스크롤 맨 아래로 이동
-            await page.evaluate('(el) => el.scrollTo(0, el.scrollHeight)', scrollable_div)
 
-            # 약간 기다려서 로딩 유도
-            time.sleep(1.5)
+def _build_review_url(template: ReviewApiTemplate, listing_id: str | None, offset: int) -> str:
+    """
+    :param listing_id: None 이면 캡처한 요청의 숙소 id 를 그대로 사용
+    """
+    variables = copy.deepcopy(template.variables)
+    if listing_id is not None:
+        variables['id'] = base64.b64encode(f"StayListing:{listing_id}".encode()).decode()
+    reviews_request = variables['pdpReviewsRequest']
+    reviews_request['offset'] = str(offset) if isinstance(reviews_request.get('offset'), str) else offset
+    params = {**template.params, 'variables': json.dumps(variables, separators=(',', ':'))}
+    return f"{template.url}?{urlencode(params)}"
 
-            # scrollHeight 변화 없으면 종료
-            if current_height == prev_height:
-                print("✅ 더 이상 로딩할 리뷰 없음.")
-                break
 
-            prev_height = current_height
+async def _get_json(request_context: APIRequestContext, url: str, headers: Dict | None = None) -> Dict | None:
+    """
+    :return: 응답 JSON, 요청에 실패하거나 2xx 가 아니면 None
+    """
+    try:
+        response = await request_context.get(url, headers=headers)
+        if response.ok is False:
+            logger.error(f"리뷰 API 요청 실패 - status: {response.status}")
+            return None
+        return await response.json()
+    except Exception as e:
+        logger.error(f"리뷰 API 요청 실패: {e}")
+        return None
 
-        review_divs = await page.query_selector_all('div[data-review-id]')
 
-        for review_div in review_divs:
-            # 두 번째 자식 div 선택
-            second_child_div = await review_div.query_selector(':scope > div:nth-child(2)')
+async def _request_review_list(get_json: Callable[[str, Dict], Awaitable[Dict | None]], template: ReviewApiTemplate,
+                               listing_id: str | None, start_offset: int, total_count: int,
+                               allow_partial: bool = False) -> list[str] | None:
+    """
+    start_offset 부터 total_count 까지의 리뷰 페이지를 동시에 요청합니다.
+    :param get_json: (url, headers) 로 요청하여 응답 JSON 을 반환하는 함수 ( 실패하면 None )
+    :param allow_partial: True 이면 일부 페이지가 실패해도 가져온 리뷰만 반환 ( 다른 수집 방법이 없는 브라우저 수집 )
+    :return: 리뷰 원문 리스트, 실패한 페이지가 있으면 None ( allow_partial 이면 모든 요청이 실패한 경우만 None )
+    """
+    semaphore = asyncio.Semaphore(REVIEW_API_CONCURRENCY)
 
-            if second_child_div:
-                # 그 안의 가장 깊은 span 하나 선택 (또는 첫 번째 span)
-                span = await second_child_div.query_selector('span')
+    async def fetch_review_page(offset: int) -> list[str] | None:
+        async with semaphore:
+            review_data = await get_json(_build_review_url(template, listing_id, offset), template.headers)
+            if review_data is None:
+                return None
+            return _extract_review_page(review_data)[0]
 
-                if span:
-                    text = await span.inner_text()
-                    result.append(text)
+    offset_list = range(start_offset, total_count, template.limit)
+    if len(offset_list) == 0:
+        return []
 
-        return result
+    review_page_list = await asyncio.gather(*[fetch_review_page(offset) for offset in offset_list])
+    failed_page_count = sum(1 for review_page in review_page_list if review_page is None)
+    if failed_page_count > 0:
+        metrics.increase('detail.review_page_failed', failed_page_count)
+        if allow_partial is False or failed_page_count == len(review_page_list):
+            return None
+        logger.warning(f"리뷰 페이지 {len(review_page_list)}개 중 {failed_page_count}개를 가져오지 못하여 외국인 리뷰 개수가 적게 집계됩니다.")
+    return [review for review_page in review_page_list if review_page is not None for review in review_page]
+
+
+def _extract_review_page(review_data: Dict | None) -> Tuple[list[str], int]:
+    """
+    리뷰 API 응답에서 리뷰 원문 리스트와 전체 리뷰 개수 추출
+    """
+    try:
+        page_data = review_data.get('data', {}).get('presentation', {}).get('stayProductDetailPage') or {}
+        reviews = page_data.get('reviews') or {}
+        review_list = [review.get('comments') or '' for review in reviews.get('reviews', [])]
+        total_count = (reviews.get('metadata') or {}).get('reviewsCount') or len(review_list)
+        return review_list, int(total_count)
     except Exception as e:
-        logger.error(f"모든 리뷰 정보 가져오기 실패: {e}", exc_info=True)
-        return []
+        logger.error(f"리뷰 API 응답 추출 실패: {e}", exc_info=True)
+        return [], 0
 
 
 def _extract_foreigner_review_count(review_list: list[str]) -> int:
@@ -0,0 +1,165 @@
+# third-party package
+from typing import List, Tuple
+from datetime import timedelta
+from app.logger import get_logger
+
+# util module
+from app.util import generate_now_date
+
+# model module
+from app.lib.model import ListingListRequest, FrontierBox
+
+# database
+from sqlalchemy import select, update, func, or_, and_
+from app.lib.entity import SearchBox, BoxStatus
+
+# constants
+from app.constants import FRONTIER_LEASE_TIMEOUT
+
+"""
+frontier.py
+분할 정복 탐색의 frontier 를 DB 에 저장하여, 중단된 수집을 이어서 하거나 여러 워커가 나누어 수집하도록 합니다.
+"""
+
+logger = get_logger('app')
+
+
+async def seed_frontier(session, request: ListingListRequest, collect_date: str) -> bool:
+    """
+    금일 해당 sido 의 frontier 가 없다면 루트 박스를 추가합니다.
+    :return: 새로 추가했으면 True, 이전 수집을 이어서 진행하면 False
+    """
+    async with session.begin():
+        # 여러 워커가 동시에 시작해도 루트 박스가 한번만 추가되도록 sido, 날짜 단위로 잠금
+        await session.execute(select(func.pg_advisory_xact_lock(func.hashtext(f"{request.sido}:{collect_date}"))))
+        result = await session.execute(
+            select(func.count()).select_from(SearchBox).filter_by(sido=request.sido, collect_date=collect_date)
+        )
+        if result.scalar() > 0:
+            logger.info(f"금일 {request.sido} 탐색 frontier 가 존재하므로 이어서 수집합니다.")
+            return False
+
+        session.add(SearchBox(
+            sido=request.sido,
+            collect_date=collect_date,
+            depth=0,
+            ne_lat=request.ne_lat,
+            ne_lng=request.ne_lng,
+            sw_lat=request.sw_lat,
+            sw_lng=request.sw_lng,
+            status=BoxStatus.PENDING.value
+        ))
+        logger.info(f"금일 {request.sido} 탐색 frontier 를 루트 박스로 초기화합니다.")
+        return True
+
+
+async def lease_search_box(session, sido: str, collect_date: str, worker_id: str) -> FrontierBox | None:
+    """
+    대기 중인 박스( 또는 임대 시간이 만료된 박스 ) 하나를 임대합니다.
+    SKIP LOCKED 로 다른 워커가 잠근 행은 건너뛰므로 워커끼리 같은 박스를 받지 않습니다.
+    """
+    now = generate_now_date()
+    expired_at = now - timedelta(seconds=FRONTIER_LEASE_TIMEOUT)
+    async with session.begin():
+        result = await session.execute(
+            select(SearchBox)
+            .where(
+                SearchBox.sido == sido,
+                SearchBox.collect_date == collect_date,
+                or_(
+                    SearchBox.status == BoxStatus.PENDING.value,
+                    and_(SearchBox.status == BoxStatus.LEASED.value, SearchBox.leased_at < expired_at)
+                )
+            )
+            .order_by(SearchBox.depth.desc(), SearchBox.id)  # 깊은 박스부터 처리하여 frontier 가 커지지 않도록 함.
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        box = result.scalars().first()
+        if box is None:
+            return None
+
+        if box.status == BoxStatus.LEASED.value:
+            logger.info(f"임대 시간이 만료된 박스를 다시 임대합니다. - box: {box.to_dict()}")
+
+        box.status = BoxStatus.LEASED.value
+        box.leased_by = worker_id
+        box.leased_at = now
+
+        return FrontierBox(
+            id=box.id,
+            depth=box.depth,
+            ne_lat=box.ne_lat,
+            ne_lng=box.ne_lng,
+            sw_lat=box.sw_lat,
+            sw_lng=box.sw_lng
+        )
+
+
+async def renew_search_box_lease(session, box: FrontierBox, worker_id: str) -> bool:
+    """
+    탐색 중인 박스의 임대 시간을 갱신합니다.
+    :return: 아직 임대 중이면 True, 만료되어 다른 워커가 다시 임대했으면 False
+    """
+    async with session.begin():
+        result = await session.execute(
+            update(SearchBox)
+            .where(
+                SearchBox.id == box.id,
+                SearchBox.status == BoxStatus.LEASED.value,
+                SearchBox.leased_by == worker_id
+            )
+            .values(leased_at=generate_now_date())
+        )
+        return result.rowcount > 0
+
+
+async def complete_search_box(session, box: FrontierBox, worker_id: str, searched_count: int,
+                              children: List[Tuple[Tuple[float, float], Tuple[float, float]]]) -> bool:
+    """
+    박스 탐색 완료 처리와 하위 박스 추가를 하나의 트랜잭션으로 처리합니다.
+    중간에 프로세스가 죽으면 박스는 임대 상태로 남아 있다가 만료 후 다시 탐색됩니다.
+    임대가 만료되어 다른 워커가 다시 임대한 박스는 완료 처리하지 않습니다. ( 하위 박스가 중복으로 추가되지 않도록 함 )
+    :param children: ((ne_lat, ne_lng), (sw_lat, sw_lng)) 리스트
+    :return: 완료 처리했으면 True, 임대를 잃어 건너뛰었으면 False
+    """
+    async with session.begin():
+        result = await session.execute(
+            select(SearchBox)
+            .where(SearchBox.id == box.id)
+            .with_for_update()
+        )
+        search_box = result.scalars().first()
+        if search_box is None or search_box.status != BoxStatus.LEASED.value or search_box.leased_by != worker_id:
+            logger.warning(f"[{worker_id}] 임대가 만료된 박스이므로 완료 처리하지 않습니다. - box: {box}")
+            return False
+
+        search_box.status = BoxStatus.DONE.value
+        search_box.searched_count = searched_count
+
+        for ne, sw in children:
+            session.add(SearchBox(
+                sido=search_box.sido,
+                collect_date=search_box.collect_date,
+                depth=box.depth + 1,
+                ne_lat=ne[0],
+                ne_lng=ne[1],
+                sw_lat=sw[0],
+                sw_lng=sw[1],
+                status=BoxStatus.PENDING.value
+            ))
+        return True
+
+
+async def has_unfinished_search_box(session, sido: str, collect_date: str) -> bool:
+    """
+    아직 완료되지 않은( 대기 또는 임대 중인 ) 박스가 남아 있는지 여부
+    """
+    result = await session.execute(
+        select(func.count()).select_from(SearchBox).where(
+            SearchBox.sido == sido,
+            SearchBox.collect_date == collect_date,
+            SearchBox.status != BoxStatus.DONE.value
+        )
+    )
+    return result.scalar() > 0
@@ -1,32 +1,70 @@
 # third-party package
-from typing import Dict, List, Callable, Awaitable
+from typing import Dict, List, Tuple, Callable, Awaitable
 from dataclasses import replace
-from bs4 import BeautifulSoup
+from functools import partial
 from app.logger import get_logger
-from urllib.parse import quote, urlencode
+from urllib.parse import quote, urlencode, urlsplit
+from html import unescape
 from playwright.async_api import async_playwright, Page
 import json
 import asyncio
+import socket
+import os
 import re
 
 # core package
 from app.core.detail import fetch_listing_info
+from app.core.frontier import seed_frontier, lease_search_box, renew_search_box_lease, complete_search_box, \
+    has_unfinished_search_box
+from app.core.split import BoxSplitter, load_listing_coordinates
+from app.core.plan import CrawlPlan, load_crawl_plan, save_crawl_plan, to_box
+from app.core.context import CrawlContext
+from app.core.region import load_region
+from app.core.pipeline import DetailPipeline, DetailBatch, PagePoolFactory
+from app.core.scheduler import BoxScheduler, load_listing_history
 
 # util module
-from app.util import divide_into_quadrants, generate_now_date_to_string
+from app.util import generate_now_date_to_string, calculate_zoom_level, is_in_box, gather_or_cancel
+from datetime import date
 
 # model module
-from app.lib.model import ListingListRequest, ListingId
-from app.lib.model import ListingRequest
+from app.lib.model import ListingListRequest, ListingId, FrontierBox
+from app.lib.model import ListingRequest, CollectOption
+
+# browser
+from app.lib.browser import PagePool, BrowserLauncher
+
+# writer
+from app.lib.writer import ListingWriter
+
+# http client
+from app.lib.http_client import HttpClient
+
+# resource filter
+from app.lib.resource_filter import ResourceFilter
+
+# seen index
+from app.lib.seen_index import SeenIndex
+
+# metrics
+from app.lib import metrics
+
+# parser pool
+from app.lib.parser_pool import open_parser_pool, close_parser_pool, parse
 
 # database
-from sqlalchemy import select
+from sqlalchemy import select, any_, bindparam, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
 from app.lib.entity import Listing
-from app.lib.database import get_db
+from app.lib.database import get_db, session_factory
+
+# config
+from app.config import CHROME_PATH, AIRBNB_BASE_URL
 
 # constants
-from app.constants import CHROME_PATH
+from app.constants import MAX_CONCURRENCY, FRONTIER_POLL_INTERVAL, FRONTIER_LEASE_RENEW_INTERVAL, DIVIDE_THRESHOLD, \
+    DETAIL_QUEUE_SIZE, WRITER_FLUSH_INTERVAL, MAX_PAGE_NUM, API_PAGINATION_CONCURRENCY, USER_AGENT, HTTP_TIMEOUT, ALLOWED_DOMAIN_LIST
 
 
 """
@@ -35,79 +73,510 @@ radius_task.py
 """
 
 logger = get_logger('app')
-cache = set()  # 중복 저장을 피하기 위한 listing id 저장용 로컬 캐시
-
+LIST_PAGE_PATTERN = re.compile(
+    r'<script\b[^>]*\bid=["\']data-deferred-state-0["\'][^>]*>(?P<state>.*?)</script\s*>'
+    r'|<(?P<tag>[a-zA-Z][\w-]*)\b[^>]*\bdata-testid=["\']stays-page-heading["\'][^>]*>',
+    re.S | re.I
+)  # 검색 페이지의 내장 데이터 script 와 검색 개수 헤더
+cache = set()  # 중복 저장을 피하기 위한 listing id 저장용 로컬 캐시 ( seen_index 모드에서는 SeenIndex )
+pending_cache = set()  # 다른 task 에서 상세 정보를 수집 중인 listing id
+seen_index_user_count = 0  # SeenIndex 를 사용 중인 수집 개수 ( 여러 지역 동시 수집 )
+
+
+async def collect_listing(request: ListingListRequest, option: CollectOption | None = None,
+                          launcher: BrowserLauncher | None = None):
+    """
+    :param launcher: 주어지면 여러 지역의 수집이 공유하는 브라우저를 사용 ( 브라우저를 띄우거나 종료하지 않음 )
+    """
+    option = option or CollectOption()
+    if launcher is not None:
+        await collect_listing_with_launcher(request, option, launcher)
+        return
 
-async def collect_listing(request: ListingListRequest):
     async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(
-            headless=False,
-            executable_path=CHROME_PATH  # 맥에서는 실제 크롬 경로 기반으로 테스트
-        )
-        context = await browser.new_context(
-            java_script_enabled=True,
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                       'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-        )
-        page = await context.new_page()
+        resource_filter = create_resource_filter(option)
+        launcher = create_browser_launcher(playwright, option, resource_filter)
+        await collect_listing_with_launcher(request, option, launcher)
+        if resource_filter is not None:
+            resource_filter.log_summary()
+        await launcher.close()
 
-        async for session in get_db():
-            is_need_divide = await collect_radius_listing(session, page, request)
 
-            # 4분면으로 나누어 순회할 필요가 있다면
-            if is_need_divide is True:
-                logger.info(f"탐색된 숙소 개수가 250개 이상이므로 4분면으로 분할하여 순회합니다.")
-                await collect_divided_radius_listing(session, page, request)
+def create_resource_filter(option: CollectOption) -> ResourceFilter | None:
+    if option.block_resources is None:
+        return None
+    # 이미지, 폰트 등 수집에 필요 없는 요청 차단 ( HTML, 스크립트, StaysSearch 요청만 받음 )
+    # AIRBNB_BASE_URL 을 mock 서버로 바꾼 경우 mock 서버도 third-party 로 막지 않음
+    return ResourceFilter(option.block_resources, ALLOWED_DOMAIN_LIST + [urlsplit(AIRBNB_BASE_URL).hostname])
+
+
+def create_browser_launcher(playwright, option: CollectOption, resource_filter: ResourceFilter | None) -> BrowserLauncher:
+    return BrowserLauncher(
+        playwright,
+        headless=option.headless,
+        executable_path=CHROME_PATH or None,  # 비어 있으면 playwright 에 포함된 chromium 사용
+        context_options={
+            'java_script_enabled': True,
+            'user_agent': USER_AGENT,
+            'service_workers': 'block' if resource_filter is not None else 'allow'  # service worker 요청은 route 를 거치지 않음
+        },
+        on_context_created=resource_filter.install if resource_filter is not None else None,
+        endpoint=option.browser_endpoint
+    )
+
+
+async def collect_listing_with_launcher(request: ListingListRequest, option: CollectOption, launcher: BrowserLauncher):
+    # HTML 파싱을 별도 프로세스에서 실행 ( parser_processes 가 0 이면 event loop 에서 파싱 )
+    open_parser_pool(option.parser_processes)
+    try:
+        if option.seen_index is False:
+            await crawl_listing(request, option, launcher)
+            return
+
+        # 같은 호스트의 다른 수집 프로세스와 공유되고, 재시작해도 유지되는 listing id 캐시
+        open_seen_index()
+        try:
+            await crawl_listing(request, option, launcher)
+        finally:
+            close_seen_index()
+    finally:
+        close_parser_pool(option.parser_processes)
+
+
+async def crawl_listing(request: ListingListRequest, option: CollectOption, launcher: BrowserLauncher):
+    max_rss_mb = option.max_rss_mb
+    if max_rss_mb > 0 and launcher.endpoint is not None:
+        # 브라우저 서버는 수집 프로세스의 하위 프로세스가 아니므로 메모리를 측정할 수 없음
+        logger.warning("브라우저 서버에 연결하는 경우 --max-rss-mb 는 무시됩니다.")
+        max_rss_mb = 0
+
+    # page 마다 context 를 따로 열고, 교체 기준을 넘은 context 는 새로 만듬
+    create_page_pool = partial(PagePool.create, launcher.new_context,
+                               max_navigation_count=option.max_navigations,
+                               max_rss_bytes=max_rss_mb * 1024 * 1024)
+
+    crawl, start_request_list = await create_crawl_context(request, option)
+
+    if option.preload is True:
+        # 재시작되었거나 다른 프로세스에서 금일 이미 수집한 숙소를 캐시에 미리 올려둠
+        async with session_factory() as session:
+            collected_id_set = await load_collected_listing_ids(session, request.sido, generate_now_date_to_string())
+        cache.update(collected_id_set)
+        logger.info(f"금일 {request.sido} 에서 이미 수집된 숙소 {len(collected_id_set)}개를 캐시에 불러왔습니다.")
+
+    if option.write_batch_size > 0:
+        # 숙소 정보를 모아서 일괄 저장
+        crawl.writer = ListingWriter(option.write_batch_size, WRITER_FLUSH_INTERVAL,
+                                     on_failed=uncache_listing_rows, on_flushed=persist_listing_rows)
+        await crawl.writer.start()
+
+    if option.http_detail_concurrency > 0:
+        # 상세 페이지를 브라우저 없이 요청하고, 내장 데이터가 없는 숙소만 브라우저로 수집
+        crawl.client = await HttpClient.create(launcher.playwright, option.http_detail_concurrency, HTTP_TIMEOUT, USER_AGENT)
+
+    if option.detail_concurrency > 0:
+        # 숙소 탐색과 상세 정보 수집을 별도의 page 에서 동시에 진행
+        crawl.pipeline = DetailPipeline(create_page_pool, min(option.detail_concurrency, MAX_CONCURRENCY),
+                                        DETAIL_QUEUE_SIZE,
+                                        partial(collect_listing_detail, writer=crawl.writer, client=crawl.client,
+                                                check_exists=False))  # 이전 정보 이어받기는 queue 에 넣기 전에 처리
+        await crawl.pipeline.start()
+
+    try:
+        if option.frontier is True:
+            await collect_listing_from_frontier(create_page_pool, request, crawl)
+        elif option.time_budget > 0:
+            await collect_listing_within_budget(create_page_pool, request, start_request_list, crawl)
+        elif option.concurrency > 1 or option.max_navigations > 0 or option.max_rss_mb > 0:
+            # page 는 박스를 수집한 뒤 반납할 때 교체되므로, 교체 기준이 있으면 page 가 하나여도 박스마다 page 를 빌림
+            await collect_listing_concurrently(create_page_pool, start_request_list, crawl)
+        else:
+            page_pool = await create_page_pool(1)
+
+            async with page_pool.acquire() as page:
+                async for session in get_db():
+                    for start_request in start_request_list:
+                        is_need_divide, searched_count = await collect_radius_listing(session, page, start_request,
+                                                                                      crawl)
+
+                        # 4분면으로 나누어 순회할 필요가 있다면
+                        if is_need_divide is True:
+                            logger.info(f"탐색된 숙소 개수가 {DIVIDE_THRESHOLD}개 이상이므로 분할하여 순회합니다.")
+                            await collect_divided_radius_listing(session, page, start_request, crawl,
+                                                                 searched_count)
+            await page_pool.close()
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        if crawl.pipeline is not None:
+            await crawl.pipeline.cancel()
+        raise
+    finally:
+        if crawl.pipeline is not None:
+            await crawl.pipeline.close()  # 탐색이 끝나면 queue 에 남은 숙소를 모두 수집한 뒤 종료
+        if crawl.writer is not None:
+            await crawl.writer.close()  # 버퍼에 남은 숙소 정보 저장
+        if crawl.client is not None:
+            await crawl.client.close()
+
+    crawl.splitter.log_summary()
+    write_out_of_box_summary_log()
 
-        await context.close()
-        await browser.close()
+    if crawl.plan is not None:
+        async with session_factory() as session:
+            await save_crawl_plan(session, request, generate_now_date_to_string(), crawl.plan.get_leaves())
 
 
-async def collect_radius_listing(session, page: Page, request: ListingListRequest):
+def open_seen_index():
+    """
+    여러 지역을 동시에 수집하는 경우 마지막 수집이 끝날 때 닫습니다.
+    """
+    global cache, seen_index_user_count
+    if seen_index_user_count == 0:
+        cache = SeenIndex.open(generate_now_date_to_string())
+    seen_index_user_count += 1
+
+
+def close_seen_index():
+    global cache, seen_index_user_count
+    seen_index_user_count -= 1
+    if seen_index_user_count == 0 and isinstance(cache, SeenIndex):
+        cache.close()
+        cache = set()
+
+
+async def create_crawl_context(request: ListingListRequest,
+                               option: CollectOption) -> Tuple[CrawlContext, List[ListingListRequest]]:
+    """
+    수집 실행 상태를 만들고, 수집을 시작할 박스 목록을 결정합니다.
+    수집 계획 모드에서 이전 수집의 리프 박스가 있으면 루트 박스 대신 리프 박스부터 수집합니다.
+    """
+    splitter = BoxSplitter()
+    if option.adaptive_split is True:
+        # 적응형 분할 모드라면 과거 수집된 좌표를 불러와 밀도 기반 분할에 사용합니다.
+        async with session_factory() as session:
+            coordinates = await load_listing_coordinates(session, request.sido)
+        logger.info(f"적응형 분할에 사용할 {request.sido} 과거 좌표 {len(coordinates)}개를 불러왔습니다.")
+        splitter = BoxSplitter(adaptive=True, coordinates=coordinates)
+
+    region = None
+    if option.prune_region is True:
+        # 지역 polygon 과 겹치지 않는 박스와 polygon 밖의 숙소는 수집하지 않음.
+        region = load_region(option.region_name or request.sido)
+
+    if option.plan is False:
+        return CrawlContext(option, splitter, region=region), [request]
+
+    if option.frontier is True:
+        logger.warning("frontier 모드에서는 수집 계획을 사용하지 않습니다.")
+        return CrawlContext(option, splitter, region=region), [request]
+
+    async with session_factory() as session:
+        plan_box_list = await load_crawl_plan(session, request)
+
+    if len(plan_box_list) == 0:
+        logger.info(f"{request.sido} 수집 계획이 없으므로 루트 박스부터 수집합니다.")
+        return CrawlContext(option, splitter, CrawlPlan(), region), [request]
+
+    logger.info(f"{request.sido} 수집 계획의 리프 박스 {len(plan_box_list)}개부터 수집합니다.")
+    plan = CrawlPlan(parents={box: parent for box, parent, _ in plan_box_list})
+    start_request_list = [
+        replace(request, ne_lat=box[0], ne_lng=box[1], sw_lat=box[2], sw_lng=box[3]) for box, _, _ in plan_box_list
+    ]
+    if region is not None:
+        start_request_list = region.filter_request_list(start_request_list)
+    return CrawlContext(option, splitter, plan, region), start_request_list
+
+
+async def collect_radius_listing(session, page: Page, request: ListingListRequest, crawl: CrawlContext):
     """
     특정 지역 반경의 숙소를 수집합니다.
+    :return: (분할 필요 여부, 헤더에 표시된 검색 개수)
     """
     await asyncio.sleep(3)  # delay
 
     logger.info(f"특정 지역 반경의 숙소를 수집을 시작합니다. - request: {request}")
 
+    return await collect_box_listing(session, page, request, crawl)  # 분할 필요 여부가 true 일 경우 분할하여 재귀 순회 필요.
+
+
+async def collect_divided_radius_listing(session, page: Page, request: ListingListRequest, crawl: CrawlContext,
+                                         searched_count: int):
+    """
+    특정 지역 반경을 분할( 기본 4등분 ) 하여 숙소를 수집합니다.
+    주의: 단위 함수들이 통합된 로직이므로, 복잡함 주의.
+    """
+    await asyncio.sleep(3)  # delay
+
+    logger.info(f"특정 지역 반경을 분할하여 숙소 수집을 시작합니다. - request: {request}")
+    for fetch_request in crawl.divide(request, searched_count):
+        logger.info(f"특정 지역 반경 수집 - ne: {(fetch_request.ne_lat, fetch_request.ne_lng)}, "
+                    f"sw: {(fetch_request.sw_lat, fetch_request.sw_lng)}")
+
+        is_need_divide, box_searched_count = await collect_box_listing(session, page, fetch_request, crawl)
+
+        if is_need_divide is True:  # 수집된 숙소 좌표 정보가 250개 이상인 경우 분할하여 다시 순회
+            logger.info(f"탐색된 숙소 개수가 {DIVIDE_THRESHOLD}개 이상이므로, 분할하여 재귀 순회합니다.")
+            await collect_divided_radius_listing(session, page, fetch_request, crawl, box_searched_count)
+
+
+async def collect_box_listing(session, page: Page, request: ListingListRequest, crawl: CrawlContext,
+                              detail_batch: DetailBatch | None = None) -> Tuple[bool, int]:
+    """
+    하나의 바운딩 박스에 대해 숙소 ID, 좌표를 수집하고 상세 정보를 수집합니다.
+    early_divide 모드에서는 1페이지의 검색 개수만으로 분할 여부를 판단하고,
+    분할될 박스는 하위 박스에서 다시 수집되므로 나머지 페이지와 상세 정보 수집을 건너뜁니다.
+    :param detail_batch: pipeline 으로 상세 정보를 수집하는 경우 이 박스에서 queue 에 넣은 숙소를 기록
+    :return: (분할 필요 여부, 헤더에 표시된 검색 개수)
+    """
+    option = crawl.option
+
     # 페이지 별 숙소 ID, 좌표 수집
-    listing_list, searched_count = await get_listing_list(page, request)
+    listing_list, searched_count = await get_listing_list(page, request, early_divide=option.early_divide,
+                                                          api_pagination=option.api_pagination)
+    crawl.record_search(request, searched_count)
+
+    # 요청한 박스 밖의 숙소 비율 측정
+    write_out_of_box_log(listing_list, request)
+
+    need_divide = should_divide(len(listing_list), searched_count)
+    if need_divide is True and option.early_divide is True:
+        logger.info(f"검색된 숙소 개수 {searched_count}개로 분할될 박스이므로 상세 정보 수집을 건너뜁니다.")
+        return need_divide, searched_count
 
     # 수집 실패 개수 및 비율 측정
     write_failed_count_log(len(listing_list), searched_count)
 
+    # 지역 polygon 밖의 숙소 제외
+    listing_list = crawl.filter_listing_list(listing_list)
+
     # 숙소 상세 정보 수집
-    await collect_listing_detail(session, page, listing_list, request.sido)
+    if crawl.pipeline is not None:
+        await enqueue_listing_detail(session, crawl.pipeline, listing_list, request.sido, detail_batch,
+                                     writer=crawl.writer, refresh_ttl=option.refresh_ttl)
+    else:
+        await collect_listing_detail(session, page, listing_list, request.sido, writer=crawl.writer,
+                                     client=crawl.client, refresh_ttl=option.refresh_ttl)
 
-    return len(listing_list) >= 250 or searched_count >= 250  # true 일 경우 4분면으로 나누어 재귀 순회 필요.
+    return need_divide, searched_count
 
 
-async def collect_divided_radius_listing(session, page: Page, request: ListingListRequest):
+def should_divide(listing_count: int, searched_count: int) -> bool:
     """
-    특정 지역 반경을 4등분 하여 숙소를 수집합니다.
-    주의: 단위 함수들이 통합된 로직이므로, 복잡함 주의.
+    한번의 검색으로 모두 수집할 수 없는 박스인지 여부 ( 분할하여 재귀 순회 필요 )
     """
-    await asyncio.sleep(3)  # delay
+    return listing_count >= DIVIDE_THRESHOLD or searched_count >= DIVIDE_THRESHOLD
 
-    logger.info(f"특정 지역 반경을 4등분하여 숙소 수집을 시작합니다. - request: {request}")
-    for quadrant in divide_into_quadrants(request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng):
-        ne, sw = quadrant
-        logger.info(f"특정 지역 반경 수집 - ne: {ne}, sw: {sw}")
-        fetch_request = replace(request, ne_lat=ne[0], ne_lng=ne[1], sw_lat=sw[0], sw_lng=sw[1])
 
-        # 페이지 별 숙소 ID, 좌표 수집
-        quadrant_listing_list, searched_count = await get_listing_list(page, fetch_request)
+async def collect_listing_concurrently(create_page_pool: PagePoolFactory, start_request_list: List[ListingListRequest],
+                                      crawl: CrawlContext):
+    """
+    page pool 을 만들어 사분면(및 하위 트리)을 동시에 순회합니다.
+    동시에 실행되는 박스 수집은 pool 크기(concurrency)를 넘지 않습니다.
+    """
+    concurrency = min(crawl.option.concurrency, MAX_CONCURRENCY)
+    logger.info(f"{concurrency}개의 page 로 동시 수집을 시작합니다.")
+    page_pool = await create_page_pool(concurrency)
+    try:
+        await gather_or_cancel(*[
+            collect_radius_listing_concurrently(page_pool, start_request, crawl)
+            for start_request in start_request_list
+        ])
+    finally:
+        await page_pool.close()
 
-        # 수집 실패 개수 및 비율 측정
-        write_failed_count_log(len(quadrant_listing_list), searched_count)
 
-        # 숙소 상세 정보 수집
-        await collect_listing_detail(session, page, quadrant_listing_list, request.sido)
+async def collect_radius_listing_concurrently(page_pool: PagePool, request: ListingListRequest, crawl: CrawlContext):
+    """
+    page 를 하나 빌려 특정 지역 반경을 수집하고, 분할이 필요하면 하위 박스들을 동시에 재귀 순회합니다.
+    AsyncSession 은 task 간에 공유할 수 없으므로 박스마다 세션을 새로 엽니다.
+    """
+    async with page_pool.acquire() as page:
+        async with session_factory() as session:
+            is_need_divide, searched_count = await collect_radius_listing(session, page, request, crawl)
+
+    if is_need_divide is True:
+        logger.info(f"탐색된 숙소 개수가 {DIVIDE_THRESHOLD}개 이상이므로, 분할하여 동시에 재귀 순회합니다.")
+        await gather_or_cancel(*[
+            collect_radius_listing_concurrently(page_pool, child_request, crawl)
+            for child_request in crawl.divide(request, searched_count)
+        ])
 
-        if len(quadrant_listing_list) >= 250 or searched_count >= 250:  # 수집된 숙소 좌표 정보가 250개 이상인 경우 4분면으로 분할하여 다시 순회
-            logger.info("탐색된 숙소 개수가 250개 이상이므로, 4분면으로 분할하여 재귀 순회합니다.")
-            await collect_divided_radius_listing(session, page, fetch_request)
+
+async def collect_listing_within_budget(create_page_pool: PagePoolFactory, request: ListingListRequest,
+                                        start_request_list: List[ListingListRequest], crawl: CrawlContext):
+    """
+    시간 예산 안에서 초당 갱신될 것으로 예상되는 숙소가 많은 박스부터 수집합니다.
+    예산이 끝나면 수집 중인 박스와 상세 정보 queue 를 중단하고, 수집하지 못한 범위를 기록합니다.
+    """
+    option = crawl.option
+    collect_date = generate_now_date_to_string()
+    async with session_factory() as session:
+        history_id_list, history_coordinates = await load_listing_history(session, request.sido, collect_date)
+        # 금일 이미 수집된 숙소는 갱신 대상에서 제외
+        cache.update(await load_collected_listing_ids(session, request.sido, collect_date))
+
+    scheduler = BoxScheduler(option.time_budget * 60, history_id_list, history_coordinates,
+                             lambda listing_id: listing_id in cache, option.early_divide)
+    for start_request in start_request_list:
+        scheduler.push_start_request(start_request)
+
+    worker_count = min(option.concurrency, MAX_CONCURRENCY)
+    logger.info(f"{worker_count}개의 page 로 {option.time_budget}분 동안 수집합니다. "
+                f"- 이전 수집 숙소: {len(history_id_list)}개")
+    page_pool = await create_page_pool(worker_count)
+    in_progress = {}  # worker 번호: 수집 중인 박스
+
+    async def work(worker_num: int):
+        while True:
+            box = scheduler.pop()
+            if box is None:
+                if len(in_progress) == 0:
+                    return
+                await asyncio.sleep(1)  # 다른 워커의 분할 결과를 기다림
+                continue
+
+            in_progress[worker_num] = box
+            async with page_pool.acquire() as page:
+                async with session_factory() as session:
+                    need_divide, searched_count = await collect_box_listing(session, page, box.request, crawl)
+            scheduler.record_search(searched_count)
+            if need_divide is True:
+                scheduler.push_children(box.request, searched_count, crawl.divide(box.request, searched_count))
+            del in_progress[worker_num]
+
+    try:
+        await asyncio.wait_for(gather_or_cancel(*[work(worker_num) for worker_num in range(worker_count)]),
+                               timeout=scheduler.remaining_seconds())
+        if crawl.pipeline is not None:
+            # 남은 예산 동안만 queue 에 남은 숙소를 수집
+            await asyncio.wait_for(crawl.pipeline.queue.join(), timeout=scheduler.remaining_seconds())
+    except asyncio.TimeoutError:
+        logger.info("시간 예산이 끝나 수집을 중단합니다.")
+        if crawl.pipeline is not None:
+            await crawl.pipeline.cancel()
+    finally:
+        await page_pool.close()
+
+    unfinished_list = list(in_progress.values())
+    scheduler.log_coverage_report(unfinished_list)
+
+    if crawl.plan is not None:
+        # 수집하지 못한 박스도 계획에 남겨야 다음 수집에서 해당 범위가 빠지지 않음
+        for box in unfinished_list + scheduler.queue:
+            crawl.plan.record_unvisited(to_box(box.request), round(box.expected_count))
+
+
+async def collect_listing_from_frontier(create_page_pool: PagePoolFactory, request: ListingListRequest,
+                                       crawl: CrawlContext):
+    """
+    DB 에 저장된 frontier 로부터 박스를 임대하여 수집합니다.
+    중단된 수집은 남아 있는 박스부터 이어서 진행되며, 여러 프로세스/머신이 같은 지역을 나누어 수집할 수 있습니다.
+    """
+    worker_count = min(crawl.option.concurrency, MAX_CONCURRENCY)
+    collect_date = generate_now_date_to_string()
+    async with session_factory() as session:
+        await seed_frontier(session, request, collect_date)
+
+    logger.info(f"{worker_count}개의 워커로 frontier 기반 수집을 시작합니다.")
+    page_pool = await create_page_pool(worker_count)
+    try:
+        await gather_or_cancel(*[
+            frontier_worker(page_pool, request, crawl, collect_date,
+                            f"{socket.gethostname()}-{os.getpid()}-{worker_num}")
+            for worker_num in range(worker_count)
+        ])
+    finally:
+        await page_pool.close()
+
+
+async def frontier_worker(page_pool: PagePool, request: ListingListRequest, crawl: CrawlContext,
+                          collect_date: str, worker_id: str):
+    """
+    frontier 에서 박스를 하나씩 임대하여 수집하고, 분할이 필요하면 하위 박스를 frontier 에 추가합니다.
+    임대할 박스가 없더라도 다른 워커가 탐색 중인 박스가 있으면 하위 박스가 추가될 수 있으므로 기다립니다.
+    박스의 완료 처리는 상세 정보가 모두 저장된 뒤 별도 task 에서 하며, 그동안 워커는 다음 박스를 탐색합니다.
+    """
+    finishing_tasks = set()
+    try:
+        while True:
+            async with session_factory() as session:
+                box = await lease_search_box(session, request.sido, collect_date, worker_id)
+
+            if box is None:
+                async with session_factory() as session:
+                    if await has_unfinished_search_box(session, request.sido, collect_date) is False:
+                        logger.info(f"[{worker_id}] 모든 박스 탐색 완료.")
+                        break
+                await asyncio.sleep(FRONTIER_POLL_INTERVAL)
+                continue
+
+            logger.info(f"[{worker_id}] 박스 임대 - box: {box}")
+            fetch_request = replace(request, ne_lat=box.ne_lat, ne_lng=box.ne_lng, sw_lat=box.sw_lat, sw_lng=box.sw_lng)
+
+            # 탐색과 상세 정보 저장이 임대 시간보다 오래 걸려도 다른 워커가 다시 임대하지 않도록 주기적으로 갱신
+            renew_task = asyncio.create_task(keep_search_box_lease(box, worker_id))
+            detail_batch = DetailBatch()
+            try:
+                async with page_pool.acquire() as page:
+                    await asyncio.sleep(3)  # delay
+
+                    async with session_factory() as session:
+                        need_divide, searched_count = await collect_box_listing(session, page, fetch_request, crawl,
+                                                                                detail_batch)
+            except BaseException:
+                renew_task.cancel()
+                raise
+
+            children = []
+            if need_divide is True:
+                logger.info(f"[{worker_id}] 탐색된 숙소 개수가 {DIVIDE_THRESHOLD}개 이상이므로, 분할하여 frontier 에 추가합니다.")
+                children = [
+                    ((child.ne_lat, child.ne_lng), (child.sw_lat, child.sw_lng))
+                    for child in crawl.divide(fetch_request, searched_count)
+                ]
+
+            finishing_task = asyncio.create_task(
+                finish_search_box(box, worker_id, crawl, detail_batch, renew_task, searched_count, children)
+            )
+            finishing_tasks.add(finishing_task)
+            finishing_task.add_done_callback(finishing_tasks.discard)
+
+        await asyncio.gather(*finishing_tasks)
+    except BaseException:
+        finishing_task_list = list(finishing_tasks)
+        for finishing_task in finishing_task_list:
+            finishing_task.cancel()
+        await asyncio.gather(*finishing_task_list, return_exceptions=True)
+        raise
+
+
+async def finish_search_box(box: FrontierBox, worker_id: str, crawl: CrawlContext, detail_batch: DetailBatch,
+                            renew_task: asyncio.Task, searched_count: int, children: List):
+    """
+    박스에서 찾은 숙소의 상세 정보가 모두 처리되고 저장된 ( writer flush ) 뒤 박스를 완료 처리합니다.
+    그 전에 프로세스가 종료되면 박스는 임대 상태로 남아, 임대가 만료된 뒤 다음 실행에서 다시 수집됩니다.
+    """
+    try:
+        await detail_batch.wait()
+        if crawl.writer is not None:
+            await crawl.writer.flush()
+        async with session_factory() as session:
+            await complete_search_box(session, box, worker_id, searched_count, children)
+    except Exception as e:
+        logger.error(f"[{worker_id}] 박스 완료 처리 실패, 임대가 만료되면 다시 수집됩니다. - box: {box}: {e}", exc_info=True)
+    finally:
+        renew_task.cancel()
+
+
+async def keep_search_box_lease(box: FrontierBox, worker_id: str):
+    """
+    탐색 중인 박스의 임대 시간을 FRONTIER_LEASE_RENEW_INTERVAL 마다 갱신합니다.
+    """
+    while True:
+        await asyncio.sleep(FRONTIER_LEASE_RENEW_INTERVAL)
+        async with session_factory() as session:
+            if await renew_search_box_lease(session, box, worker_id) is False:
+                logger.warning(f"[{worker_id}] 박스 임대가 만료되어 갱신하지 못했습니다. - box: {box}")
+                return
 
 
 def write_failed_count_log(listing_list_count: int, searched_count: int):
@@ -128,29 +597,69 @@ def write_failed_count_log(listing_list_count: int, searched_count: int):
         logger.error(f"로깅 중 에러 발생: {e}")
 
 
-async def get_listing_list(page, request):
+def write_out_of_box_log(listing_list, request: ListingListRequest):
+    """
+    검색 결과 중 요청한 바운딩 박스 밖에 있는 숙소의 개수와 비율을 측정하기 위한 로깅 함수
+    zoom 이 박스 크기와 맞지 않으면 지도 검색이 박스 밖의 숙소까지 반환함.
+    """
+    outside_count = sum(
+        1 for listing in listing_list
+        if not is_in_box(listing.coordinate, request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng)
+    )
+    metrics.increase('listing.returned', len(listing_list))
+    metrics.increase('listing.outside_box', outside_count)
+
+    if len(listing_list) > 0:
+        logger.info(f"요청한 박스 밖의 숙소 개수: {outside_count}, 비율: {outside_count / len(listing_list) * 100:.2f}%")
+
+
+def write_out_of_box_summary_log():
+    logger.info(f"전체 검색 결과 중 요청한 박스 밖의 숙소 개수: {metrics.get('listing.outside_box')}, "
+                f"비율: {metrics.get_rate('listing.outside_box', 'listing.returned') * 100:.2f}%")
+
+
+async def get_listing_list(page, request, early_divide: bool = False, api_pagination: bool = False):
     """
     페이지 별 숙소 ID, 좌표 수집
+    :param early_divide: True 일 경우 1페이지의 검색 개수가 분할 기준 이상이면 나머지 페이지를 수집하지 않습니다.
+    :param api_pagination: True 일 경우 3페이지부터는 2페이지의 StaysSearch 요청을 재사용하여 API 로 동시에 요청합니다.
     """
     listing_list = set()
     searched_listing_total_count = 0
     try:
-        for page_num in range(1, 16):  # 최대 15페이지 까지 조회
+        for page_num in range(1, MAX_PAGE_NUM + 1):  # 최대 15페이지 까지 조회
+            if page_num == 2 and api_pagination is True:
+                fetched_listing_list, is_completed = await fetch_remaining_listing_list_by_api(page)
+                listing_list.update(set(fetched_listing_list))
+                if is_completed is True:
+                    logger.info(f"특정 지역 반경 2~{MAX_PAGE_NUM} 페이지 API 수집 완료 - 수집된 숙소 개수: {len(fetched_listing_list)}")
+                    break
+                logger.info("StaysSearch 요청 정보나 페이지 cursor 를 얻지 못하여 3페이지부터 버튼 클릭으로 수집합니다.")
+                await asyncio.sleep(3)  # page 마다 5초 딜레이
+                continue
+
             if page_num != 1:
                 fetched_listing_list = await fetch_listing_list_next_page(page)
                 if fetched_listing_list is None:
                     logger.info(f"{page_num} 페이지를 찾을 수 없으므로 숙소 ID 수집 종료.")
                     break
             else:
-                # 1페이지 인 경우 페이지 요청
-                fetched_listing_list = await fetch_listing_list(page, request)
+                # 1페이지 인 경우 페이지 요청 ( HTML 을 한번 훑어 헤더의 검색 개수도 함께 가져옴 )
+                fetched_listing_list, searched_listing_total_count = await fetch_listing_page(page, request)
 
             await asyncio.sleep(3)  # page 마다 5초 딜레이
 
             listing_list.update(set(fetched_listing_list))
             logger.info(f"특정 지역 반경 {page_num} 페이지 수집 완료 - 수집된 숙소 meta 정보: {set(fetched_listing_list)}")
 
-        searched_listing_total_count = get_searched_listing_total_count(await page.content())
+            if page_num == 1 and early_divide is True:
+                if searched_listing_total_count >= DIVIDE_THRESHOLD:
+                    logger.info(f"1페이지 검색된 총 숙소의 개수: {searched_listing_total_count}, 분할 대상이므로 나머지 페이지 수집 생략.")
+                    return listing_list, searched_listing_total_count
+
+        if searched_listing_total_count == 0:
+            # 1페이지에서 헤더를 찾지 못한 경우 현재 페이지에서 다시 찾음
+            searched_listing_total_count = await parse(get_searched_listing_total_count, await page.content())
         logger.info(f"특정 지역 반경 모든 페이지 수집 완료 - 총 수집된 숙소의 개수: {len(listing_list)}, 검색된 총 숙소의 개수: {searched_listing_total_count}")
     except Exception as e:
         logger.error(f"특정 지역 반경 모든 페이지 수집 실패하였으므로, 수집을 임시 중단하고 넘어갑니다. :{e}", exc_info=True)
@@ -164,50 +673,223 @@ def get_searched_listing_total_count(html_content) -> int:
     :param html_content:
     :return: 개수
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
-    heading = soup.find(attrs={'data-testid': 'stays-page-heading'})
-    if heading:
-        text_content = heading.get_text()
-        cleaned_text = text_content.replace(',', '')
-        numbers = re.findall(r'\d+', cleaned_text)
-        number = ''.join(numbers)  # 숫자들을 하나의 문자열로 합침
-        return int(number)
-    else:
-        return 0
+    _, searched_count = scan_listing_page(html_content, include_state=False)
+    return searched_count
 
 
-async def collect_listing_detail(session, page, listing_list, sido: str):
+def scan_listing_page(html: str, include_state: bool = True) -> Tuple[str | None, int]:
+    """
+    검색 페이지 HTML 을 DOM 트리 없이 한번 훑어 data-deferred-state-0 script 내용과 헤더의 검색 개수를 찾습니다.
+    :param include_state: False 이면 헤더만 찾고 script 내용은 None
+    :return: (script 내용, 헤더에 표시된 검색 개수), 찾지 못하면 (None, 0)
+    """
+    state_text, searched_count = None, 0
+    for match in LIST_PAGE_PATTERN.finditer(html):
+        if match.group('state') is not None:
+            state_text = match.group('state')
+        elif searched_count == 0:
+            heading_text = _extract_element_text(html, match.group('tag'), match.end())
+            numbers = re.findall(r'\d+', heading_text.replace(',', ''))
+            searched_count = int(''.join(numbers)) if numbers else 0  # 숫자들을 하나의 문자열로 합침
+        if searched_count > 0 and (state_text is not None or include_state is False):
+            break
+    return state_text, searched_count
+
+
+def _extract_element_text(html: str, tag: str, start: int) -> str:
+    """
+    start 위치에서 열린 tag 가 닫힐 때까지의 text ( 같은 이름의 하위 tag 는 깊이를 세어 건너뜀 )
+    """
+    depth = 1
+    for match in re.compile(rf'<(/?){tag}\b[^>]*?(/?)>', re.I).finditer(html, start):
+        if match.group(1):
+            depth -= 1
+            if depth == 0:
+                return unescape(re.sub(r'<[^>]*>', '', html[start:match.start()]))
+        elif not match.group(2):
+            depth += 1
+    return ''
+
+
+async def collect_listing_detail(session, page, listing_list, sido: str, writer: ListingWriter | None = None,
+                                 client: HttpClient | None = None, check_exists: bool = True, refresh_ttl: int = 0):
+    """
+    :param client: 주어지면 상세 페이지를 먼저 브라우저 없이 요청
+    :param check_exists: False 이면 DB 에 이미 저장되었는지 확인하지 않음 ( queue 에 넣기 전에 확인한 경우 )
+    :param refresh_ttl: 0 보다 크면 검색 결과의 평점, 리뷰 개수가 이전 수집과 같고 상세 정보를 수집한 지 refresh_ttl 일이
+                        지나지 않은 숙소는 상세 페이지를 열지 않고 이전 정보를 이어받아 저장
+    """
     logger.info(f"숙소 상세 정보 수집 시작")
+    collect_date = generate_now_date_to_string()
+    if check_exists is True:
+        await cache_existing_listing(session, listing_list, collect_date)
+
+    if refresh_ttl > 0:
+        listing_list = await carry_forward_unchanged_listing(session, listing_list, sido, writer, collect_date,
+                                                             refresh_ttl)
+
     for listing in listing_list:
-        collect_date = generate_now_date_to_string()
-        if listing.id in cache or await is_listing_exists(session, listing.id, collect_date):
-            logger.info(f"금일 숙소 수집 ID {listing.id} 이미 수집 되었음. 수집 건너뜀.")
+        if listing.id in cache or listing.id in pending_cache:
+            logger.info(f"금일 숙소 수집 ID {listing.id} 이미 수집 되었거나 수집 중임. 수집 건너뜀.")
             continue
 
-        listing_info = await fetch_listing_info(page, ListingRequest(
-            id=listing.id,
-            coordinate=str(listing.coordinate)
-        ))
-        await save_listing(session=session,
-                           id=listing.id,
-                           sido=sido,
-                           coordinate=str(listing.coordinate),
-                           title=listing_info.title,
-                           rating=listing_info.rating,
-                           review_count=listing_info.review_count,
-                           foreigner_review_count=listing_info.foreigner_review_count,
-                           option_list=listing_info.option_list,
-                           reserved_count=listing_info.reserved_count)
-        logger.info(f"숙소 ID {listing.id} 수집 완료")
+        # await 전에 선점해야 동시에 실행 중인 다른 task 가 같은 숙소를 수집하지 않음.
+        pending_cache.add(listing.id)
+        try:
+            listing_info = await fetch_listing_info(page, ListingRequest(
+                id=listing.id,
+                coordinate=str(listing.coordinate)
+            ), client)
+            if listing_info is None:
+                logger.info(f"숙소 ID {listing.id} 상세 정보를 가져오지 못하여 저장을 건너뜀.")
+                continue
+
+            await save_listing(session=session,
+                               writer=writer,
+                               id=listing.id,
+                               sido=sido,
+                               coordinate=str(listing.coordinate),
+                               title=listing_info.title,
+                               rating=listing_info.rating,
+                               review_count=listing_info.review_count,
+                               foreigner_review_count=listing_info.foreigner_review_count,
+                               option_list=listing_info.option_list,
+                               reserved_count=listing_info.reserved_count)
+            logger.info(f"숙소 ID {listing.id} 수집 완료")
+        finally:
+            pending_cache.discard(listing.id)
     logger.info(f"숙소 상세 정보 수집 완료")
 
 
-async def is_listing_exists(session, listing_id, collect_date) -> bool:
+async def carry_forward_unchanged_listing(session, listing_list, sido: str, writer: ListingWriter | None,
+                                          collect_date: str, refresh_ttl: int) -> List[ListingId]:
     """
-    Check if the listing ID already exists in the database
+    검색 결과의 평점, 리뷰 개수가 이전 수집과 같은 숙소는 상세 페이지를 열지 않고 이전 상세 정보를 이어받아 저장합니다.
+    이전 저장 정보는 검색 페이지의 숙소 전체에 대해 한번의 질의로 가져옵니다.
+    :return: 상세 정보를 수집해야 하는 숙소 리스트
     """
-    result = await session.execute(select(Listing).filter_by(id=listing_id, collect_date=collect_date))
-    return result.scalars().first() is not None
+    snapshots = await find_previous_listing_snapshots(
+        session, list({listing.id for listing in listing_list if listing.id not in cache}), collect_date
+    )
+
+    remaining_listing_list = []
+    for listing in listing_list:
+        snapshot = snapshots.get(listing.id)
+        if listing.id in cache or listing.id in pending_cache or snapshot is None \
+                or is_unchanged_listing(listing, snapshot, collect_date, refresh_ttl) is False:
+            remaining_listing_list.append(listing)
+            continue
+
+        pending_cache.add(listing.id)
+        try:
+            await save_listing(session=session,
+                               writer=writer,
+                               id=listing.id,
+                               sido=sido,
+                               coordinate=str(listing.coordinate),
+                               title=snapshot.title,
+                               rating=listing.rating,
+                               review_count=listing.review_count,
+                               foreigner_review_count=snapshot.foreigner_review_count,
+                               option_list=snapshot.option_list,
+                               reserved_count=snapshot.reserved_count,  # detail_collect_date 기준의 예약 개수
+                               detail_collect_date=snapshot.detail_collect_date or snapshot.collect_date)
+            metrics.increase('detail.carried_forward')
+            logger.info(f"숙소 ID {listing.id} 검색 결과가 이전 수집과 같아 이전 상세 정보를 이어받음")
+        finally:
+            pending_cache.discard(listing.id)
+    return remaining_listing_list
+
+
+async def enqueue_listing_detail(session, pipeline: DetailPipeline, listing_list, sido: str,
+                                 batch: DetailBatch | None = None, writer: ListingWriter | None = None,
+                                 refresh_ttl: int = 0):
+    """
+    상세 정보 수집 워커가 처리하도록 queue 에 넣습니다. queue 가 가득 차면 자리가 날 때까지 기다립니다.
+    DB 에 이미 저장된 숙소는 queue 에 넣기 전에 한번의 질의로 걸러냅니다.
+    :param batch: 주어지면 queue 에 넣은 숙소의 처리 완료를 batch 로 기다릴 수 있음
+    :param refresh_ttl: 0 보다 크면 이전 정보를 이어받을 숙소는 queue 에 넣지 않고 바로 저장 ( 이전 저장 정보는 한번에 질의 )
+    """
+    collect_date = generate_now_date_to_string()
+    await cache_existing_listing(session, listing_list, collect_date)
+    if refresh_ttl > 0:
+        listing_list = await carry_forward_unchanged_listing(session, listing_list, sido, writer, collect_date,
+                                                             refresh_ttl)
+    for listing in listing_list:
+        if listing.id in cache:
+            continue
+        await pipeline.put(listing, sido, batch)
+
+
+async def cache_existing_listing(session, listing_list, collect_date: str):
+    """
+    캐시에 없는 숙소 중 DB 에 이미 저장된 숙소를 한번의 질의로 찾아 캐시에 추가합니다.
+    """
+    listing_id_list = list({listing.id for listing in listing_list if listing.id not in cache})
+    if len(listing_id_list) == 0:
+        return
+
+    existing_id_set = await find_existing_listing_ids(session, listing_id_list, collect_date)
+    if len(existing_id_set) > 0:
+        logger.info(f"금일 이미 수집된 숙소 {len(existing_id_set)}개는 수집을 건너뜁니다.")
+        cache.update(existing_id_set)
+
+
+async def find_existing_listing_ids(session, listing_id_list: List[str], collect_date: str) -> set:
+    """
+    해당 날짜에 이미 저장된 listing id 집합 ( id = ANY(:ids) 한번의 질의 )
+    """
+    result = await session.execute(
+        select(Listing.id).where(
+            Listing.collect_date == collect_date,
+            Listing.id == any_(bindparam('ids', listing_id_list, type_=ARRAY(String)))
+        )
+    )
+    return set(result.scalars())
+
+
+async def find_previous_listing_snapshots(session, listing_id_list: List[str], collect_date: str) -> Dict[str, Listing]:
+    """
+    숙소 별 해당 날짜 이전의 가장 최근 저장 정보 ( DISTINCT ON 한번의 질의 )
+    """
+    if len(listing_id_list) == 0:
+        return {}
+
+    result = await session.execute(
+        select(Listing).where(
+            Listing.collect_date < collect_date,
+            Listing.id == any_(bindparam('ids', listing_id_list, type_=ARRAY(String)))
+        ).order_by(Listing.id, Listing.collect_date.desc()).distinct(Listing.id)
+    )
+    return {listing.id: listing for listing in result.scalars()}
+
+
+def is_unchanged_listing(listing: ListingId, snapshot: Listing, collect_date: str, refresh_ttl: int) -> bool:
+    """
+    검색 결과의 평점, 리뷰 개수가 이전 저장 정보와 같고, 상세 정보를 수집한 지 refresh_ttl 일이 지나지 않았는지 여부
+    검색 결과에 평점, 리뷰 개수가 없거나 이전 저장 정보가 상세 수집에 실패한 값이면 변경된 것으로 봄
+    """
+    if listing.rating is None or listing.review_count is None:
+        return False
+    if snapshot.rating is None or snapshot.review_count is None or snapshot.review_count < 0:
+        return False
+    if abs(listing.rating - snapshot.rating) > 0.005 or listing.review_count != snapshot.review_count:
+        return False
+
+    detail_collect_date = snapshot.detail_collect_date or snapshot.collect_date
+    try:
+        elapsed_days = (date.fromisoformat(collect_date) - date.fromisoformat(detail_collect_date)).days
+    except (TypeError, ValueError):
+        return False
+    return elapsed_days < refresh_ttl
+
+
+async def load_collected_listing_ids(session, sido: str, collect_date: str) -> set:
+    """
+    해당 sido 에서 해당 날짜에 이미 저장된 listing id 집합
+    """
+    result = await session.execute(select(Listing.id).filter_by(sido=sido, collect_date=collect_date))
+    return set(result.scalars())
 
 
 async def fetch_listing_list(page: Page, request: ListingListRequest) -> List:
@@ -218,11 +900,22 @@ async def fetch_listing_list(page: Page, request: ListingListRequest) -> List:
         ListingId(id, coordinate)
     ]
     """
+    listing_list, _ = await fetch_listing_page(page, request)
+    return listing_list
+
+
+async def fetch_listing_page(page: Page, request: ListingListRequest) -> Tuple[List[ListingId], int]:
+    """
+    1페이지의 숙소 리스트와 헤더에 표시된 검색 개수 ( 검색 개수는 페이지를 넘겨도 같음 )
+    """
     list_data = await request_listing_list_to_airbnb(page, request)
-    return extract_listing_list(list_data)
+    return await parse(extract_listing_page, list_data)
 
 
-async def fetch_listing_list_next_page(page: Page) -> List[ListingId] | None:
+async def fetch_listing_list_next_page(page: Page, capture_request: Dict | None = None) -> List[ListingId] | None:
+    """
+    :param capture_request: 전달되면 StaysSearch 요청 정보( url, headers, post_data )와 페이지 cursor 목록을 담습니다.
+    """
     next_btn = await page.query_selector("[aria-label='다음']")
 
     if next_btn and await next_btn.get_attribute('disabled') is None:
@@ -233,7 +926,10 @@ async def fetch_listing_list_next_page(page: Page) -> List[ListingId] | None:
             await _next_btn.click()
             await page.wait_for_load_state('load')
 
-        list_data = await get_listing_list_data(page, search_page)
+        list_data = await get_listing_list_data(page, search_page, capture_request)
+
+        if capture_request is not None:
+            capture_request['page_cursors'] = extract_page_cursors(list_data)
 
         return extract_listing_list_for_next_page(list_data)
     else:
@@ -242,6 +938,60 @@ async def fetch_listing_list_next_page(page: Page) -> List[ListingId] | None:
         return None
 
 
+async def fetch_remaining_listing_list_by_api(page: Page) -> Tuple[List[ListingId], bool]:
+    """
+    2페이지는 버튼 클릭으로 이동하면서 StaysSearch 요청을 캡처하고,
+    3페이지부터는 캡처한 요청의 cursor 만 바꾸어 page.request 로 동시에 요청합니다. ( 페이지 렌더링 생략 )
+    :return: (2페이지부터 수집된 숙소 리스트, 마지막 페이지까지 수집 완료 여부)
+    요청 정보나 cursor 를 얻지 못하면 2페이지까지만 수집하고 완료 여부는 False
+    """
+    capture_request = {}
+    listing_list = await fetch_listing_list_next_page(page, capture_request)
+    if listing_list is None:
+        return [], True  # 다음 페이지가 없음
+
+    page_cursors = capture_request.get('page_cursors', [])[2:MAX_PAGE_NUM]  # pageCursors[i] 는 i + 1 페이지의 cursor
+    if 'post_data' not in capture_request or len(page_cursors) == 0:
+        return listing_list, False
+
+    semaphore = asyncio.Semaphore(API_PAGINATION_CONCURRENCY)
+
+    async def fetch_page(cursor: str) -> List[ListingId]:
+        async with semaphore:
+            list_data = await request_listing_list_data_by_cursor(page, capture_request, cursor)
+            return extract_listing_list_for_next_page(list_data)
+
+    result = set(listing_list)
+    for fetched_listing_list in await asyncio.gather(*[fetch_page(cursor) for cursor in page_cursors]):
+        result.update(fetched_listing_list)
+    return list(result), True
+
+
+async def request_listing_list_data_by_cursor(page: Page, capture_request: Dict, cursor: str) -> Dict | None:
+    """
+    캡처한 StaysSearch 요청의 cursor 만 바꾸어 다시 요청합니다.
+    """
+    try:
+        body = json.loads(capture_request['post_data'])
+        variables = body.get('variables', {})
+        for request_name in ['staysSearchRequest', 'staysMapSearchRequestV2']:
+            if request_name in variables:
+                variables[request_name]['cursor'] = cursor
+
+        headers = {
+            name: value for name, value in capture_request['headers'].items()
+            if name.lower() not in ('content-length', 'cookie', 'host')
+        }
+        response = await page.request.post(capture_request['url'], headers=headers, data=json.dumps(body))
+        if response.ok is False:
+            logger.error(f"StaysSearch API 요청 실패 - status: {response.status}")
+            return None
+        return await response.json()
+    except Exception as e:
+        logger.error(f"StaysSearch API 요청 실패: {e}", exc_info=True)
+        return None
+
+
 async def request_listing_list_to_airbnb(page: Page, request: ListingListRequest) -> str:
     """
     sample:
@@ -256,9 +1006,11 @@ async def request_listing_list_to_airbnb(page: Page, request: ListingListRequest
     &price_filter_num_nights=1&zoom_level=12.345531387076726
     &ne_lat=36.41115578705275&ne_lng=127.45687393351176&sw_lat=36.27164403580622&sw_lng=127.28961938990949
     &zoom=12.345531387076726&search_by_map=true
+    zoom 은 박스가 지도에 꼭 맞게 보이도록 박스 크기로 계산합니다. ( 고정 값을 쓰면 작은 박스에서 박스 밖 숙소가 검색됨 )
     """
     try:
-        base_url = f"https://www.airbnb.co.kr/s/{quote(request.country)}-{quote(request.sido)}/homes"
+        zoom_level = calculate_zoom_level(request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng)
+        base_url = f"{AIRBNB_BASE_URL}/s/{quote(request.country)}-{quote(request.sido)}/homes"
         params = {
             'tab_id': 'home_tab',
             'refinement_paths[]': '/homes',
@@ -272,12 +1024,12 @@ async def request_listing_list_to_airbnb(page: Page, request: ListingListRequest
             'search_type': 'user_map_move',
             'query': request.sido,
             'price_filter_num_nights': 1,
-            'zoom_level': 12,
+            'zoom_level': zoom_level,
             'ne_lat': request.ne_lat,
             'ne_lng': request.ne_lng,
             'sw_lat': request.sw_lat,
             'sw_lng': request.sw_lng,
-            'zoom': 12,
+            'zoom': zoom_level,
             'search_by_map': True
         }
 
@@ -299,11 +1051,13 @@ async def request_listing_list_to_airbnb(page: Page, request: ListingListRequest
         return ''
 
 
-async def get_listing_list_data(page: Page, search_page: Callable[[Page], Awaitable[None]]) -> Dict | None:
+async def get_listing_list_data(page: Page, search_page: Callable[[Page], Awaitable[None]],
+                                capture_request: Dict | None = None) -> Dict | None:
     """
     StaysSearch 요청에 대한 응답을 캡처하여 JSON DATA를 리턴합니다.
     :param page: page 객체
     :param search_page: page 탐색을 위한 핸들러
+    :param capture_request: 전달되면 StaysSearch 요청의 url, headers, post_data 를 담습니다.
     :return:
     """
     timeout = 8  # 캡처 타임 아웃
@@ -312,6 +1066,10 @@ async def get_listing_list_data(page: Page, search_page: Callable[[Page], Awaita
 
     async def handle_response(response):
         if "StaysSearch" in response.url:
+            if capture_request is not None and response.request.post_data is not None:
+                capture_request['url'] = response.request.url
+                capture_request['headers'] = await response.request.all_headers()
+                capture_request['post_data'] = response.request.post_data
             capture['content'] = await response.text()
             capture_event.set()  # 응답을 캡처하면 이벤트 설정
 
@@ -339,12 +1097,25 @@ def extract_listing_list(html: str) -> List[ListingId]:
     """
     숙소 리스트 메타 정보 추출
     """
+    return extract_listing_page(html)[0]
+
+
+def extract_listing_page(html: str) -> Tuple[List[ListingId], int]:
+    """
+    검색 페이지 HTML 을 한번 훑어 숙소 리스트 메타 정보와 헤더의 검색 개수를 함께 추출합니다.
+    """
+    state_text, searched_count = scan_listing_page(html)
+    return extract_listing_list_from_state(state_text), searched_count
+
+
+def extract_listing_list_from_state(state_text: str | None) -> List[ListingId]:
+    """
+    data-deferred-state-0 script 의 JSON 에서 숙소 리스트 메타 정보 추출
+    """
     result = set()
-    soup = BeautifulSoup(html, 'html.parser')
-    script_tag = soup.find('script', {'id': 'data-deferred-state-0'})
     try:
-        if script_tag:
-            json_data = json.loads(script_tag.text)
+        if state_text is not None:
+            json_data = json.loads(state_text)
         else:
             logger.error("script 태그를 찾을 수 없습니다.")
             return list(result)
@@ -388,6 +1159,18 @@ def extract_listing_list_for_next_page(listing_data: Dict | None) -> List[Listin
     return list(result)
 
 
+def extract_page_cursors(listing_data: Dict | None) -> List[str]:
+    """
+    StaysSearch 응답의 페이지별 cursor 목록 ( pageCursors[i] 는 i + 1 페이지 )
+    """
+    try:
+        stays_search = listing_data.get('data', {}).get('presentation', {}).get('staysSearch', {})
+        return stays_search.get('results', {}).get('paginationInfo', {}).get('pageCursors', []) or []
+    except Exception as e:
+        logger.error(f"페이지 cursor 추출 실패: {e}")
+        return []
+
+
 def extract_listing_list_from_stays_search(stays_search_data: Dict | None) -> List[ListingId]:
     """
     stays_search data로부터 map search results와 search results를 파싱하여,
@@ -400,7 +1183,9 @@ def extract_listing_list_from_stays_search(stays_search_data: Dict | None) -> Li
     map_results = stays_search_data.get('mapResults', {}).get('mapSearchResults', [])
     search_results = stays_search_data.get('results', {}).get('searchResults', [])
 
-    combined_results = map_results + search_results  # map_results 와 search_results 병합 (리스트)
+    # map_results 와 search_results 병합 (리스트)
+    # 같은 숙소는 먼저 추가된 값이 남으므로, 평점, 리뷰 개수가 있는 search_results 를 먼저 추가
+    combined_results = search_results + map_results
     for search_result in combined_results:
         extract_data = extract_listing_data(search_result)
         if extract_data is not None:
@@ -425,18 +1210,65 @@ def extract_listing_data(search_result: Dict) -> ListingId | None:
         else:
             raise ValueError('Not found coordinate.')
 
+        rating, review_count = extract_rating_and_review_count(search_result)
         return ListingId(
             id=listing_id,
-            coordinate=(coordinate['latitude'], coordinate['longitude'])
+            coordinate=(coordinate['latitude'], coordinate['longitude']),
+            rating=rating,
+            review_count=review_count
         )
     except Exception as e:
         logger.info(f"숙소 상세 정보 추출 실패했으므로 추출을 스킵합니다: {e}")
         return None
 
 
+def extract_rating_and_review_count(search_result: Dict) -> Tuple[float | None, int | None]:
+    """
+    검색 결과에 표시된 평점, 리뷰 개수 ex) avgRatingLocalized: "4.87 (31)"
+    후기가 없는 숙소 ( "신규" 등 ) 는 (None, None)
+    """
+    for key in ('avgRatingLocalized', 'avgRatingA11yLabel'):
+        text = search_result.get(key)
+        if not isinstance(text, str):
+            continue
+        numbers = re.findall(r'\d[\d,.]*', text)  # 평점이 처음, 리뷰 개수가 마지막 숫자
+        if len(numbers) >= 2:
+            return float(numbers[0]), int(numbers[-1].replace(',', '').rstrip('.'))
+    return None, None
+
+
 # repository logic
 async def save_listing(session, id: str, sido: str, coordinate: str, title: str, rating: float, review_count: int,
-                       foreigner_review_count: int, option_list: List, reserved_count: int):
+                       foreigner_review_count: int, option_list: List, reserved_count: int,
+                       writer: ListingWriter | None = None, detail_collect_date: str | None = None):
+    """
+    writer 가 있으면 버퍼에 넣고 일괄 저장되도록 하며, 없으면 바로 저장합니다.
+    :param detail_collect_date: 상세 정보를 수집한 날짜 ( 이전 정보를 이어받은 경우, 없으면 금일 )
+    """
+    if detail_collect_date is None:
+        detail_collect_date = generate_now_date_to_string()
+
+    if writer is not None:
+        await writer.add({
+            'id': id,
+            'collect_date': generate_now_date_to_string(),
+            'sido': sido,
+            'coordinate': str(coordinate),
+            'title': title,
+            'rating': rating,
+            'review_count': review_count,
+            'foreigner_review_count': foreigner_review_count,
+            'option_list': str(option_list),
+            'reserved_count': reserved_count,
+            'detail_collect_date': detail_collect_date
+        })
+        # 버퍼에 넣은 listing id 도 캐시에 저장 ( 저장 실패 시 uncache_listing_rows 에서 제거 )
+        if isinstance(cache, SeenIndex):
+            cache.add_pending(id)  # 저장 전에는 다른 프로세스와 공유하지 않음 ( 저장 후 persist_listing_rows 에서 기록 )
+        else:
+            cache.add(id)
+        return
+
     logger.info('숙소 정보를 저장합니다.')
     try:
         if session.in_transaction() is False:
@@ -452,7 +1284,8 @@ async def save_listing(session, id: str, sido: str, coordinate: str, title: str,
             review_count=review_count,
             foreigner_review_count=foreigner_review_count,
             option_list=str(option_list),
-            reserved_count=reserved_count
+            reserved_count=reserved_count,
+            detail_collect_date=detail_collect_date
         )
         logger.info(f"저장하려는 숙소 정보: {listing.to_dict()}")
         session.add(listing)
@@ -462,4 +1295,22 @@ async def save_listing(session, id: str, sido: str, coordinate: str, title: str,
     except IntegrityError:
         logger.info('숙소 정보를 저장 실패')
         await session.rollback()  # Commit 못한 변화를 롤백합니다.
-        pass
\ No newline at end of file
+        pass
+
+
+def uncache_listing_rows(rows: List[Dict]):
+    """
+    일괄 저장에 실패한 숙소는 다시 수집될 수 있도록 캐시에서 제거합니다.
+    """
+    if isinstance(cache, SeenIndex):
+        cache.discard_pending(row['id'] for row in rows)
+        return
+    cache.difference_update(row['id'] for row in rows)
+
+
+def persist_listing_rows(rows: List[Dict]):
+    """
+    일괄 저장에 성공한 숙소를 SeenIndex 파일에 기록합니다.
+    """
+    if isinstance(cache, SeenIndex):
+        cache.persist(row['id'] for row in rows)
@@ -0,0 +1,131 @@
+# third-party package
+from typing import Callable, Awaitable, List
+from playwright.async_api import Page
+from app.logger import get_logger
+import asyncio
+
+# model module
+from app.lib.model import ListingId
+
+# browser
+from app.lib.browser import PagePool
+
+# database
+from app.lib.database import session_factory
+
+# metrics
+from app.lib import metrics
+
+"""
+pipeline.py
+숙소 탐색( 검색 페이지 )과 상세 정보 수집을 분리하는 producer/consumer pipeline
+탐색 워커는 ListingId 를 bounded queue 에 넣고, 별도의 page 를 가진 상세 정보 워커들이 queue 를 비웁니다.
+"""
+
+logger = get_logger('app')
+
+DetailHandler = Callable[[object, Page, List[ListingId], str], Awaitable[None]]
+PagePoolFactory = Callable[[int], Awaitable[PagePool]]
+
+
+class DetailBatch:
+    """
+    한 박스에서 queue 에 넣은 숙소들의 상세 정보 수집이 모두 끝나기를 기다리기 위한 카운터
+    """
+
+    def __init__(self):
+        self.pending_count = 0
+        self.finished = asyncio.Event()
+        self.finished.set()
+
+    def add(self):
+        self.pending_count += 1
+        self.finished.clear()
+
+    def finish(self):
+        self.pending_count -= 1
+        if self.pending_count == 0:
+            self.finished.set()
+
+    async def wait(self):
+        await self.finished.wait()
+
+
+class DetailPipeline:
+    def __init__(self, create_page_pool: PagePoolFactory, worker_count: int, queue_size: int, handler: DetailHandler):
+        """
+        :param create_page_pool: 크기를 받아 워커들이 사용할 page pool 을 만드는 함수
+        :param handler: (session, page, listing_list, sido) 를 받아 상세 정보를 수집하고 저장하는 함수
+        """
+        self.create_page_pool = create_page_pool
+        self.page_pool: PagePool | None = None
+        self.worker_count = worker_count
+        self.queue = asyncio.Queue(maxsize=queue_size)  # 가득 차면 탐색 워커가 기다림 ( backpressure )
+        self.handler = handler
+        self.workers = []
+
+    async def start(self):
+        logger.info(f"{self.worker_count}개의 상세 정보 수집 워커를 시작합니다. - queue 크기: {self.queue.maxsize}")
+        self.page_pool = await self.create_page_pool(self.worker_count)
+        for worker_num in range(self.worker_count):
+            self.workers.append(asyncio.create_task(self._work(worker_num)))
+
+    async def put(self, listing: ListingId, sido: str, batch: DetailBatch | None = None):
+        """
+        :param batch: 주어지면 숙소 처리가 끝날 때 ( 실패 포함 ) batch 에 알림
+        """
+        if batch is not None:
+            batch.add()
+        await self.queue.put((listing, sido, batch))
+        metrics.increase('detail.enqueued')
+
+    async def close(self):
+        """
+        queue 에 남은 숙소를 모두 처리한 뒤 워커를 종료합니다. ( graceful drain )
+        """
+        logger.info(f"상세 정보 수집 대기 중인 숙소 {self.queue.qsize()}개를 처리한 뒤 워커를 종료합니다.")
+        for _ in self.workers:
+            await self.queue.put(None)  # 워커 종료 신호
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        await self._close_page_pool()
+
+    async def cancel(self):
+        """
+        queue 를 비우지 않고 즉시 워커를 종료합니다.
+        """
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+        await self._close_page_pool()
+
+    async def _close_page_pool(self):
+        if self.page_pool is not None:
+            await self.page_pool.close()
+            self.page_pool = None
+
+    async def _work(self, worker_num: int):
+        """
+        숙소마다 page 를 빌리므로, page 교체 기준을 넘은 page 는 숙소 사이에 교체됩니다.
+        """
+        async with session_factory() as session:
+            while True:
+                item = await self.queue.get()
+                batch = None
+                try:
+                    if item is None:
+                        logger.info(f"[detail-{worker_num}] 상세 정보 수집 워커 종료")
+                        return
+
+                    listing, sido, batch = item
+                    async with self.page_pool.acquire() as page:
+                        await self.handler(session, page, [listing], sido)
+                    metrics.increase('detail.processed')
+                except Exception as e:
+                    logger.error(f"[detail-{worker_num}] 숙소 상세 정보 수집 실패: {e}", exc_info=True)
+                    await session.rollback()
+                finally:
+                    if batch is not None:
+                        batch.finish()
+                    self.queue.task_done()
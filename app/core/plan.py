@@ -0,0 +1,131 @@
+# third-party package
+from typing import Dict, List, Tuple
+from app.logger import get_logger
+
+# model module
+from app.lib.model import ListingListRequest
+
+# database
+from sqlalchemy import select, delete
+from app.lib.entity import CrawlPlanBox
+
+# constants
+from app.constants import DIVIDE_THRESHOLD, PLAN_MERGE_RATIO
+
+"""
+plan.py
+수집 계획 ( 이전 수집의 리프 박스 ) 을 저장하여 다음 수집이 루트 박스부터 다시 분할하지 않도록 합니다.
+box 는 (ne_lat, ne_lng, sw_lat, sw_lng) 튜플로 다룹니다.
+"""
+
+logger = get_logger('app')
+
+Box = Tuple[float, float, float, float]
+
+
+class CrawlPlan:
+    """
+    수집 중 검색한 박스의 검색 개수와 분할 관계를 기록하고, 다음 수집에 사용할 리프 박스를 계산합니다.
+    """
+
+    def __init__(self, parents: Dict[Box, Box | None] | None = None):
+        self.searched_counts: Dict[Box, int] = {}
+        self.parents: Dict[Box, Box | None] = dict(parents or {})
+        self.divided = set()
+
+    def record_search(self, box: Box, searched_count: int):
+        self.searched_counts[box] = searched_count
+
+    def record_unvisited(self, box: Box, expected_count: int):
+        """
+        시간 예산이 끝나 검색하지 못한 박스를 예상 검색 개수로 기록합니다. ( 이미 검색한 박스는 그대로 둠 )
+        """
+        self.searched_counts.setdefault(box, expected_count)
+
+    def record_division(self, parent: Box, children: List[Box]):
+        self.divided.add(parent)
+        for child in children:
+            self.parents[child] = parent
+
+    def get_leaves(self) -> List[Tuple[Box, Box | None, int]]:
+        """
+        분할되지 않은 박스 목록. 형제 리프 박스들의 검색 개수 합이 충분히 작으면 상위 박스로 병합합니다.
+        :return: (box, parent, searched_count) 리스트
+        """
+        leaves = {
+            box: searched_count for box, searched_count in self.searched_counts.items() if box not in self.divided
+        }
+
+        children_by_parent: Dict[Box, List[Box]] = {}
+        for box, parent in self.parents.items():
+            if parent is not None:
+                children_by_parent.setdefault(parent, []).append(box)
+
+        merged = 0
+        for parent, children in children_by_parent.items():
+            # 형제 박스 중 하나라도 더 분할되었다면 병합하지 않음.
+            if any(child not in leaves for child in children):
+                continue
+            searched_count = sum(leaves[child] for child in children)
+            if searched_count >= DIVIDE_THRESHOLD * PLAN_MERGE_RATIO:
+                continue
+            for child in children:
+                del leaves[child]
+            leaves[parent] = searched_count
+            merged += 1
+
+        if merged > 0:
+            logger.info(f"검색 개수가 적은 형제 박스 {merged}쌍을 상위 박스로 병합합니다.")
+
+        return [(box, self.parents.get(box), searched_count) for box, searched_count in leaves.items()]
+
+
+def to_box(request: ListingListRequest) -> Box:
+    return request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng
+
+
+def get_root_key(request: ListingListRequest) -> str:
+    return ','.join(str(value) for value in to_box(request))
+
+
+async def load_crawl_plan(session, request: ListingListRequest) -> List[Tuple[Box, Box | None, int]]:
+    """
+    :return: 이전 수집의 (box, parent, searched_count) 리스트, 계획이 없으면 빈 리스트
+    """
+    result = await session.execute(
+        select(CrawlPlanBox).filter_by(sido=request.sido, root_key=get_root_key(request)).order_by(CrawlPlanBox.id)
+    )
+    plan = []
+    for plan_box in result.scalars():
+        parent = None
+        if plan_box.parent_ne_lat is not None:
+            parent = (plan_box.parent_ne_lat, plan_box.parent_ne_lng, plan_box.parent_sw_lat, plan_box.parent_sw_lng)
+        plan.append(((plan_box.ne_lat, plan_box.ne_lng, plan_box.sw_lat, plan_box.sw_lng), parent,
+                     plan_box.searched_count))
+    return plan
+
+
+async def save_crawl_plan(session, request: ListingListRequest, collect_date: str,
+                          leaves: List[Tuple[Box, Box | None, int]]):
+    """
+    해당 sido, 루트 박스의 수집 계획을 이번 수집의 리프 박스로 교체합니다.
+    """
+    root_key = get_root_key(request)
+    async with session.begin():
+        await session.execute(delete(CrawlPlanBox).filter_by(sido=request.sido, root_key=root_key))
+        for box, parent, searched_count in leaves:
+            session.add(CrawlPlanBox(
+                sido=request.sido,
+                root_key=root_key,
+                collect_date=collect_date,
+                ne_lat=box[0],
+                ne_lng=box[1],
+                sw_lat=box[2],
+                sw_lng=box[3],
+                parent_ne_lat=parent[0] if parent else None,
+                parent_ne_lng=parent[1] if parent else None,
+                parent_sw_lat=parent[2] if parent else None,
+                parent_sw_lng=parent[3] if parent else None,
+                searched_count=searched_count
+            ))
+    logger.info(f"{request.sido} 수집 계획 저장 완료 - 리프 박스 개수: {len(leaves)}")
@@ -0,0 +1,83 @@
+# third-party package
+from typing import List
+from shapely.geometry import shape, box, Point
+from shapely.prepared import prep, PreparedGeometry
+from app.logger import get_logger
+import json
+import os
+
+# model module
+from app.lib.model import ListingListRequest, ListingId
+
+# metrics
+from app.lib import metrics
+
+# constants
+from app.constants import GEOJSON_DIR, GEOJSON_FILE_LIST, GEOJSON_NAME_FIELD_LIST, REGION_BUFFER_DEGREE
+
+"""
+region.py
+geojson 의 실제 지역 polygon 으로 바운딩 박스와 숙소를 걸러냅니다.
+바운딩 박스만으로 수집하면 바다, 산, 인접 지역까지 검색하게 됨.
+"""
+
+logger = get_logger('app')
+
+
+class Region:
+    def __init__(self, name: str, geometry: PreparedGeometry):
+        self.name = name
+        self.geometry = geometry
+
+    def intersects(self, request: ListingListRequest) -> bool:
+        return self.geometry.intersects(box(request.sw_lng, request.sw_lat, request.ne_lng, request.ne_lat))
+
+    def contains(self, listing: ListingId) -> bool:
+        lat, lng = listing.coordinate
+        return self.geometry.contains(Point(lng, lat))
+
+    def filter_request_list(self, request_list: List[ListingListRequest]) -> List[ListingListRequest]:
+        """
+        지역 polygon 과 겹치지 않는 박스를 제외합니다.
+        """
+        result = [request for request in request_list if self.intersects(request)]
+        pruned_count = len(request_list) - len(result)
+        if pruned_count > 0:
+            metrics.increase('box.outside_region', pruned_count)
+            logger.info(f"{self.name} 지역과 겹치지 않는 박스 {pruned_count}개를 탐색하지 않습니다.")
+        return result
+
+    def filter_listing_list(self, listing_list) -> List[ListingId]:
+        """
+        지역 polygon 밖의 숙소를 제외합니다.
+        """
+        result = [listing for listing in listing_list if self.contains(listing)]
+        dropped_count = len(listing_list) - len(result)
+        if dropped_count > 0:
+            metrics.increase('listing.outside_region', dropped_count)
+            logger.info(f"{self.name} 지역 밖의 숙소 {dropped_count}개는 상세 정보를 수집하지 않습니다.")
+        return result
+
+
+def load_region(name: str) -> Region | None:
+    """
+    GEOJSON_FILE_LIST 에서 이름이 일치하는 지역의 polygon 을 찾습니다.
+    :param name: ex) 서울특별시, 춘천시, kulsgr
+    """
+    for file_name in GEOJSON_FILE_LIST:
+        file_path = os.path.join(GEOJSON_DIR, file_name)
+        if not os.path.exists(file_path):
+            continue
+
+        with open(file_path, 'r', encoding='utf-8') as f:
+            geojson_data = json.load(f)
+
+        for feature in geojson_data['features']:
+            properties = feature['properties']
+            if any(properties.get(field) == name for field in GEOJSON_NAME_FIELD_LIST):
+                geometry = shape(feature['geometry']).buffer(REGION_BUFFER_DEGREE)
+                logger.info(f"{file_name} 에서 {name} 지역 polygon 을 불러왔습니다.")
+                return Region(name, prep(geometry))
+
+    logger.warning(f"{name} 지역 polygon 을 찾을 수 없습니다.")
+    return None
@@ -0,0 +1,184 @@
+# third-party package
+from typing import List, Tuple, Callable
+from dataclasses import dataclass, field
+from app.logger import get_logger
+import heapq
+import itertools
+import math
+import time
+import numpy as np
+
+# model module
+from app.lib.model import ListingListRequest
+
+# database
+from sqlalchemy import select, func
+from app.lib.entity import Listing
+
+# constants
+from app.constants import DIVIDE_THRESHOLD, SEARCH_RESULT_LIMIT, SCHEDULER_PAGE_SECONDS, SCHEDULER_DETAIL_SECONDS, \
+    SCHEDULER_MIN_STALE_RATIO, MAX_PAGE_NUM
+
+"""
+scheduler.py
+정해진 시간 안에 가장 많은 숙소를 갱신하도록, 새로 수집될 것으로 기대되는 숙소 개수 / 예상 소요 시간이 큰 박스부터 수집합니다.
+"""
+
+logger = get_logger('app')
+
+LISTING_PER_PAGE = 18  # 검색 결과 1페이지의 숙소 개수
+
+
+@dataclass(order=True)
+class ScheduledBox:
+    priority: float  # -점수 ( heapq 는 작은 값부터 꺼냄 )
+    sequence: int
+    request: ListingListRequest = field(compare=False)
+    expected_count: float = field(compare=False)  # 박스에서 검색될 것으로 예상되는 숙소 개수
+    stale_ratio: float = field(compare=False)  # 이전 수집 숙소 중 금일 아직 수집되지 않은 비율
+
+
+class BoxScheduler:
+    """
+    박스의 점수 = 예상 갱신 숙소 개수 / 예상 소요 시간
+    - 예상 숙소 개수: 검색된 상위 박스의 검색 개수를 이전 수집 좌표 밀도 비율로 나눈 값 ( 이전 수집이 없으면 면적 비율 )
+    - 갱신 비율: 박스 안의 이전 수집 숙소 중 금일 아직 수집되지 않은 비율
+    - 예상 소요 시간: 검색 페이지 수 * SCHEDULER_PAGE_SECONDS + 예상 갱신 숙소 개수 * SCHEDULER_DETAIL_SECONDS
+    """
+
+    def __init__(self, budget_seconds: float, history_id_list: List[str], history_coordinates: List[Tuple[float, float]],
+                 is_collected: Callable[[str], bool], early_divide: bool = False):
+        """
+        :param history_id_list: 이전 수집의 숙소 ID 목록 ( history_coordinates 와 같은 순서 )
+        :param is_collected: 금일 이미 수집된 숙소인지 확인하는 함수
+        :param early_divide: True 이면 분할될 박스는 1페이지만 수집하는 것으로 계산
+        """
+        self.divide_page_count = 1 if early_divide else MAX_PAGE_NUM
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + budget_seconds
+        self.history_id_list = history_id_list
+        self.history_lat = np.array([coordinate[0] for coordinate in history_coordinates], dtype=float)
+        self.history_lng = np.array([coordinate[1] for coordinate in history_coordinates], dtype=float)
+        self.is_collected = is_collected
+        self.queue: List[ScheduledBox] = []
+        self.sequence = itertools.count()
+        self.searched_box_count = 0
+        self.searched_listing_count = 0
+
+    def remaining_seconds(self) -> float:
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def is_expired(self) -> bool:
+        return time.monotonic() >= self.deadline
+
+    def push_start_request(self, request: ListingListRequest):
+        """
+        검색 개수를 모르는 시작 박스 ( 이전 수집 좌표 개수, 없으면 분할 기준 개수로 추정 )
+        """
+        history_count = int(self._get_history_mask(request).sum())
+        self._push(request, history_count if history_count > 0 else DIVIDE_THRESHOLD)
+
+    def push_children(self, parent: ListingListRequest, searched_count: int, children: List[ListingListRequest]):
+        """
+        상위 박스의 검색 개수를 하위 박스들의 이전 수집 좌표 개수 비율로 나눕니다.
+        """
+        history_count_list = [int(self._get_history_mask(child).sum()) for child in children]
+        total_history_count = sum(history_count_list)
+        total_area = sum(_get_area(child) for child in children) or 1.0
+        for child, history_count in zip(children, history_count_list):
+            if total_history_count > 0:
+                share = history_count / total_history_count
+            else:
+                share = _get_area(child) / total_area
+            self._push(child, searched_count * share)
+
+    def pop(self) -> ScheduledBox | None:
+        if len(self.queue) == 0:
+            return None
+        return heapq.heappop(self.queue)
+
+    def record_search(self, searched_count: int):
+        self.searched_box_count += 1
+        self.searched_listing_count += min(searched_count, SEARCH_RESULT_LIMIT)
+
+    def _push(self, request: ListingListRequest, expected_count: float):
+        stale_ratio = self._get_stale_ratio(request)
+        scheduled_box = ScheduledBox(
+            priority=-get_score(expected_count, stale_ratio, self.divide_page_count),
+            sequence=next(self.sequence),
+            request=request,
+            expected_count=expected_count,
+            stale_ratio=stale_ratio
+        )
+        heapq.heappush(self.queue, scheduled_box)
+
+    def _get_history_mask(self, request: ListingListRequest) -> np.ndarray:
+        return ((self.history_lat >= request.sw_lat) & (self.history_lat <= request.ne_lat) &
+                (self.history_lng >= request.sw_lng) & (self.history_lng <= request.ne_lng))
+
+    def _get_stale_ratio(self, request: ListingListRequest) -> float:
+        index_list = np.flatnonzero(self._get_history_mask(request))
+        if len(index_list) == 0:
+            return 1.0  # 이전 수집 정보가 없으면 모두 새로 수집될 것으로 봄
+        stale_count = sum(1 for index in index_list if not self.is_collected(self.history_id_list[index]))
+        return max(stale_count / len(index_list), SCHEDULER_MIN_STALE_RATIO)  # 이전 수집에 없던 새 숙소가 있을 수 있음
+
+    def log_coverage_report(self, unfinished_list: List[ScheduledBox]):
+        """
+        :param unfinished_list: 시간 안에 수집을 마치지 못한 박스 ( 수집 중이던 박스 포함 )
+        """
+        remaining_list = unfinished_list + self.queue
+        remaining_count = sum(min(box.expected_count, SEARCH_RESULT_LIMIT) * box.stale_ratio for box in remaining_list)
+        history_total = len(self.history_id_list)
+        history_collected = sum(1 for listing_id in self.history_id_list if self.is_collected(listing_id))
+        elapsed_seconds = time.monotonic() - self.started_at
+
+        logger.info(f"[scheduler] 수집 시간: {elapsed_seconds / 60:.1f}분, 탐색한 박스: {self.searched_box_count}개, "
+                    f"탐색한 박스의 검색 숙소: {self.searched_listing_count}개")
+        logger.info(f"[scheduler] 수집하지 못한 박스: {len(remaining_list)}개, "
+                    f"갱신되지 않은 것으로 예상되는 숙소: {remaining_count:.0f}개")
+        if history_total > 0:
+            logger.info(f"[scheduler] 이전 수집 숙소 중 금일 수집된 숙소: {history_collected}/{history_total}개 "
+                        f"({history_collected / history_total * 100:.1f}%)")
+
+
+def get_score(expected_count: float, stale_ratio: float, divide_page_count: int = MAX_PAGE_NUM) -> float:
+    """
+    초당 갱신될 것으로 예상되는 숙소 개수
+    분할될 박스는 직접 갱신하는 숙소가 적더라도 하위 박스에서 수집될 숙소를 기대값으로 둡니다.
+    """
+    expected_new_count = min(expected_count, SEARCH_RESULT_LIMIT) * stale_ratio
+    if expected_count >= DIVIDE_THRESHOLD:
+        page_count = divide_page_count
+    else:
+        page_count = max(math.ceil(expected_count / LISTING_PER_PAGE), 1)
+    expected_seconds = page_count * SCHEDULER_PAGE_SECONDS + expected_new_count * SCHEDULER_DETAIL_SECONDS
+    return expected_new_count / expected_seconds
+
+
+def _get_area(request: ListingListRequest) -> float:
+    return abs(request.ne_lat - request.sw_lat) * abs(request.ne_lng - request.sw_lng)
+
+
+async def load_listing_history(session, sido: str, collect_date: str) -> Tuple[List[str], List[Tuple[float, float]]]:
+    """
+    해당 sido 의 금일 이전 가장 최근 수집일 숙소 ID, 좌표 목록
+    coordinate 는 "(lat, lng)" 형태의 문자열로 저장되어 있음.
+    """
+    previous_collect_date = select(func.max(Listing.collect_date)).filter(
+        Listing.sido == sido,
+        Listing.collect_date < collect_date
+    ).scalar_subquery()
+    result = await session.execute(
+        select(Listing.id, Listing.coordinate).filter_by(sido=sido).filter(Listing.collect_date == previous_collect_date)
+    )
+
+    id_list, coordinates = [], []
+    for listing_id, coordinate in result:
+        try:
+            lat, lng = coordinate.strip('()').split(',')
+            coordinates.append((float(lat), float(lng)))
+            id_list.append(listing_id)
+        except (AttributeError, ValueError):
+            continue
+    return id_list, coordinates
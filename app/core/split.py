@@ -0,0 +1,113 @@
+# third-party package
+from typing import List, Tuple
+from app.logger import get_logger
+import math
+
+# util module
+from app.util import divide_into_quadrants, divide_into_grid, divide_by_density
+
+# database
+from sqlalchemy import select, func
+from app.lib.entity import Listing
+
+# constants
+from app.constants import DIVIDE_THRESHOLD, SEARCH_RESULT_LIMIT, SPLIT_TARGET_RATIO, MAX_SPLIT_FACTOR, \
+    MIN_COORDINATES_PER_BOX
+
+"""
+split.py
+분할이 필요한 바운딩 박스를 하위 박스로 나누는 방법
+"""
+
+logger = get_logger('app')
+
+
+class BoxSplitter:
+    """
+    adaptive 가 False 이면 기존과 같이 4분면으로 분할합니다.
+    adaptive 가 True 이면 검색 개수로 분할 수( 2x2, 3x3 ... )를 정하고,
+    과거 수집된 좌표가 충분하면 중앙점 대신 좌표 분포를 기준으로 분할합니다.
+    """
+
+    def __init__(self, adaptive: bool = False, coordinates: List[Tuple[float, float]] | None = None):
+        self.adaptive = adaptive
+        self.coordinates = coordinates or []
+        self.split_count = 0  # 분할한 박스 개수
+        self.searched_box_count = 0  # 분할로 생성된 하위 박스 개수 ( 검색 요청 횟수 )
+        self.quadtree_box_count = 0  # 4분면 분할이었다면 필요했을 것으로 추정되는 검색 요청 횟수
+        self.child_boxes = set()  # 분할로 생성된 하위 박스 ( 4분면 분할 추정은 최상위 박스에서 하위 트리 전체를 한번만 셈 )
+
+    def divide(self, ne_lat, ne_lng, sw_lat, sw_lng, searched_count: int):
+        """
+        :return: ((ne_lat, ne_lng), (sw_lat, sw_lng)) 리스트
+        """
+        if self.adaptive is False:
+            return list(divide_into_quadrants(ne_lat, ne_lng, sw_lat, sw_lng))
+
+        factor = get_split_factor(searched_count)
+        box_coordinates = [
+            (lat, lng) for lat, lng in self.coordinates
+            if sw_lat <= lat <= ne_lat and sw_lng <= lng <= ne_lng
+        ]
+        if len(box_coordinates) >= factor * factor * MIN_COORDINATES_PER_BOX:
+            logger.info(f"과거 좌표 {len(box_coordinates)}개의 분포를 기준으로 {factor}x{factor} 분할합니다.")
+            boxes = divide_by_density(ne_lat, ne_lng, sw_lat, sw_lng, box_coordinates, factor)
+        else:
+            logger.info(f"검색 개수 {searched_count}개를 기준으로 {factor}x{factor} 등분합니다.")
+            boxes = divide_into_grid(ne_lat, ne_lng, sw_lat, sw_lng, factor)
+
+        self.split_count += 1
+        self.searched_box_count += len(boxes)
+        if (ne_lat, ne_lng, sw_lat, sw_lng) not in self.child_boxes:
+            self.quadtree_box_count += estimate_quadtree_search_count(searched_count)
+        self.child_boxes.update((ne[0], ne[1], sw[0], sw[1]) for ne, sw in boxes)
+        return boxes
+
+    def log_summary(self):
+        if self.adaptive is False or self.split_count == 0:
+            return
+        saved_count = self.quadtree_box_count - self.searched_box_count
+        logger.info(f"적응형 분할 결과 - 분할 횟수: {self.split_count}, 하위 박스 검색 요청: {self.searched_box_count}, "
+                    f"4분면 분할 추정 검색 요청: {self.quadtree_box_count}, 절약된 검색 요청 추정: {saved_count}")
+
+
+def get_split_factor(searched_count: int) -> int:
+    """
+    하위 박스 하나에 SEARCH_RESULT_LIMIT * SPLIT_TARGET_RATIO 개 이하의 숙소가 들어가도록 하는 한 축의 분할 수
+    """
+    target_count = SEARCH_RESULT_LIMIT * SPLIT_TARGET_RATIO
+    factor = math.ceil(math.sqrt(searched_count / target_count))
+    return min(max(factor, 2), MAX_SPLIT_FACTOR)
+
+
+def estimate_quadtree_search_count(searched_count: int) -> int:
+    """
+    숙소가 고르게 분포한다고 가정했을 때 4분면 분할로 모든 하위 박스가 분할 기준 미만이 될 때까지 필요한 검색 요청 횟수
+    ex) 4000개 -> 4 + 16 + 64 = 84
+    """
+    total = 0
+    box_count = 1
+    while searched_count / box_count >= DIVIDE_THRESHOLD:
+        box_count *= 4
+        total += box_count
+    return total
+
+
+async def load_listing_coordinates(session, sido: str) -> List[Tuple[float, float]]:
+    """
+    해당 sido 의 가장 최근 수집일 숙소 좌표 목록
+    coordinate 는 "(lat, lng)" 형태의 문자열로 저장되어 있음.
+    """
+    latest_collect_date = select(func.max(Listing.collect_date)).filter_by(sido=sido).scalar_subquery()
+    result = await session.execute(
+        select(Listing.coordinate).filter_by(sido=sido).filter(Listing.collect_date == latest_collect_date)
+    )
+
+    coordinates = []
+    for coordinate in result.scalars():
+        try:
+            lat, lng = coordinate.strip('()').split(',')
+            coordinates.append((float(lat), float(lng)))
+        except (AttributeError, ValueError):
+            continue
+    return coordinates
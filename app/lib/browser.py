@@ -0,0 +1,303 @@
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Tuple
+from playwright.async_api import Playwright, Browser, BrowserContext, Page
+from app.lib import metrics
+from app.logger import get_logger
+import asyncio
+import os
+import time
+
+
+"""
+browser.py
+수집 task 들이 공유하는 브라우저 page pool
+"""
+
+logger = get_logger('app')
+
+ContextFactory = Callable[[], Awaitable[BrowserContext]]
+
+HEALTH_CHECK_TIMEOUT = 10  # page 가 응답하지 않는 것으로 보는 시간(초)
+RSS_CHECK_INTERVAL = 30  # 브라우저 메모리 사용량을 다시 측정하는 간격(초)
+PLAYWRIGHT_DRIVER_ARG = 'run-driver'  # 브라우저를 띄우는 playwright driver 프로세스의 실행 인자
+
+
+class BrowserLauncher:
+    """
+    브라우저를 띄우고 수집용 context 를 만듭니다.
+    브라우저가 죽은 경우 다음 context 를 만들 때 다시 띄웁니다.
+    endpoint 가 주어지면 브라우저를 띄우지 않고 떠 있는 브라우저 서버에 연결하며, 연결에 실패하면 직접 띄웁니다.
+    """
+
+    def __init__(self, playwright: Playwright, headless: bool, executable_path: str | None, context_options: Dict,
+                 on_context_created: Callable[[BrowserContext], Awaitable[None]] | None = None,
+                 endpoint: str | None = None):
+        """
+        :param executable_path: None 이면 playwright 에 포함된 chromium 사용
+        :param on_context_created: 새로 만든 context 마다 호출 ( route 설치 등 )
+        :param endpoint: 브라우저 서버의 CDP endpoint ex) http://127.0.0.1:9222
+        """
+        self.playwright = playwright
+        self.headless = headless
+        self.executable_path = executable_path
+        self.context_options = context_options
+        self.endpoint = endpoint
+        self.on_context_created = on_context_created
+        self.browser: Browser | None = None
+        self.launch_lock = asyncio.Lock()
+
+    async def new_context(self) -> BrowserContext:
+        browser = await self._get_browser()
+        context = await browser.new_context(**self.context_options)
+        if self.on_context_created is not None:
+            await self.on_context_created(context)
+        return context
+
+    async def _get_browser(self) -> Browser:
+        async with self.launch_lock:
+            if self.browser is None or self.browser.is_connected() is False:
+                if self.browser is not None:
+                    logger.warning("브라우저 연결이 끊어져 다시 연결합니다.")
+                self.browser = await self._connect() if self.endpoint is not None else None
+                if self.browser is None:
+                    self.browser = await self.playwright.chromium.launch(
+                        headless=self.headless,
+                        executable_path=self.executable_path
+                    )
+                    metrics.increase('browser.launched')
+            return self.browser
+
+    async def _connect(self) -> Browser | None:
+        try:
+            browser = await self.playwright.chromium.connect_over_cdp(self.endpoint)
+            metrics.increase('browser.connected')
+            logger.info(f"브라우저 서버에 연결하였습니다. - endpoint: {self.endpoint}")
+            return browser
+        except Exception as e:
+            logger.warning(f"브라우저 서버 ({self.endpoint}) 에 연결하지 못하여 브라우저를 직접 띄웁니다: {e}")
+            return None
+
+    async def close(self):
+        """
+        브라우저 서버에 연결한 경우 이번 실행에서 만든 context 만 닫고 연결을 끊습니다. ( 서버의 브라우저는 유지 )
+        """
+        if self.browser is not None and self.browser.is_connected():
+            await self.browser.close()
+
+
+async def serve_browser(playwright: Playwright, port: int, headless: bool, executable_path: str | None):
+    """
+    CDP 포트를 연 브라우저를 띄워 두고, 브라우저가 죽으면 다시 띄웁니다. ( 취소될 때 까지 실행 )
+    수집 실행들은 BrowserLauncher 의 endpoint 로 연결하여 각자 context 를 만들어 사용합니다.
+    """
+    while True:
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            executable_path=executable_path,
+            args=[f"--remote-debugging-port={port}", '--remote-debugging-address=127.0.0.1']
+        )
+        logger.info(f"브라우저 서버 시작 - endpoint: http://127.0.0.1:{port}")
+        disconnected = asyncio.Event()
+        browser.on('disconnected', lambda _: disconnected.set())
+        try:
+            await disconnected.wait()
+        finally:
+            if browser.is_connected():
+                await browser.close()
+        logger.warning("브라우저 서버의 브라우저가 종료되어 다시 띄웁니다.")
+        await asyncio.sleep(1)
+
+
+class PooledPage:
+    """
+    pool 의 한 자리 ( context 하나와 그 위의 page 하나 )
+    교체에 실패하면 context, page 가 None 으로 남으며, 다음에 빌려줄 때 다시 엽니다.
+    """
+
+    def __init__(self):
+        self.context: BrowserContext | None = None
+        self.page: Page | None = None
+        self.navigation_count = 0
+
+    async def open(self, new_context: ContextFactory):
+        self.context = await new_context()
+        self.page = await self.context.new_page()
+        self.navigation_count = 0
+        self.page.on('framenavigated', self._handle_frame_navigated)
+
+    def _handle_frame_navigated(self, frame):
+        if frame == self.page.main_frame:
+            self.navigation_count += 1
+
+    async def close(self):
+        if self.context is not None:
+            try:
+                await self.context.close()
+            except Exception as e:
+                logger.warning(f"context 종료 실패: {e}")
+        self.context = None
+        self.page = None
+
+
+class PagePool:
+    """
+    page 마다 별도의 context 를 열어 두고, task 들이 빌려 쓰도록 합니다.
+    pool 크기가 곧 전역 동시 실행 개수의 상한이 됩니다.
+    반납된 page 가 max_navigation_count 번 이동했거나 브라우저 메모리가 max_rss_bytes 를 넘으면 context 를 새로 만들고,
+    빌려줄 때 응답하지 않는 page 도 새로 만듭니다. ( 0 이면 해당 기준으로 교체하지 않음 )
+    """
+
+    def __init__(self, new_context: ContextFactory, pages: List[PooledPage], max_navigation_count: int = 0,
+                 max_rss_bytes: int = 0):
+        self.new_context = new_context
+        self.pages = pages
+        self.max_navigation_count = max_navigation_count
+        self.max_rss_bytes = max_rss_bytes
+        self.idle_pages = asyncio.Queue()
+        for page in pages:
+            self.idle_pages.put_nowait(page)
+        self.rss_bytes = 0
+        self.rss_checked_at = 0.0
+        self.measure_rss = get_browser_rss
+
+    @classmethod
+    async def create(cls, new_context: ContextFactory, size: int, max_navigation_count: int = 0,
+                     max_rss_bytes: int = 0):
+        pages = [await _create_pooled_page(new_context) for _ in range(size)]
+        return cls(new_context, pages, max_navigation_count, max_rss_bytes)
+
+    @property
+    def size(self) -> int:
+        return len(self.pages)
+
+    @asynccontextmanager
+    async def acquire(self):
+        pooled_page = await self.idle_pages.get()
+        try:
+            if await self._is_healthy(pooled_page) is False:
+                await self._recycle(pooled_page, 'unhealthy')
+            yield pooled_page.page
+        finally:
+            reason = self._get_recycle_reason(pooled_page)
+            if reason is not None:
+                try:
+                    await self._recycle(pooled_page, reason)
+                except Exception as e:
+                    logger.error(f"page 교체 실패, 다음에 빌려줄 때 다시 엽니다: {e}", exc_info=True)
+            self.idle_pages.put_nowait(pooled_page)
+
+    async def _is_healthy(self, pooled_page: PooledPage) -> bool:
+        if pooled_page.page is None or pooled_page.page.is_closed():
+            return False
+        try:
+            await asyncio.wait_for(pooled_page.page.evaluate('1'), timeout=HEALTH_CHECK_TIMEOUT)
+            return True
+        except Exception as e:
+            logger.warning(f"page 가 응답하지 않음: {e}")
+            return False
+
+    def _get_recycle_reason(self, pooled_page: PooledPage) -> str | None:
+        if pooled_page.page is None:
+            return None  # 교체에 실패한 page 는 빌려줄 때 다시 만듬
+        if 0 < self.max_navigation_count <= pooled_page.navigation_count:
+            return 'navigation'
+        if self.max_rss_bytes > 0 and pooled_page.navigation_count > 0 and self._get_rss_bytes() > self.max_rss_bytes:
+            return 'memory'
+        return None
+
+    def _get_rss_bytes(self) -> int:
+        if time.monotonic() - self.rss_checked_at >= RSS_CHECK_INTERVAL:
+            self._refresh_rss_bytes()
+        return self.rss_bytes
+
+    def _refresh_rss_bytes(self):
+        self.rss_bytes = self.measure_rss()
+        self.rss_checked_at = time.monotonic()
+
+    async def _recycle(self, pooled_page: PooledPage, reason: str):
+        logger.info(f"page 교체 - 사유: {reason}, 페이지 이동 횟수: {pooled_page.navigation_count}, "
+                    f"브라우저 메모리: {self.rss_bytes / 1024 / 1024:.0f}MB")
+        metrics.increase(f"browser.recycled.{reason}")
+        await pooled_page.close()
+        if reason == 'memory':
+            # 닫은 context 만큼 줄어든 값으로 갱신하여, 측정 주기 동안 반납되는 page 가 모두 교체되지 않도록 함
+            self._refresh_rss_bytes()
+        await pooled_page.open(self.new_context)
+
+    async def close(self):
+        for pooled_page in self.pages:
+            await pooled_page.close()
+
+
+async def _create_pooled_page(new_context: ContextFactory) -> PooledPage:
+    pooled_page = PooledPage()
+    await pooled_page.open(new_context)
+    return pooled_page
+
+
+def get_process_tree_rss(pid: int) -> int:
+    """
+    pid 와 모든 하위 프로세스 ( playwright driver, 브라우저, parser pool ) 의 RSS 합(byte)
+    /proc 이 없는 OS 에서는 0
+    """
+    if not os.path.isdir('/proc'):
+        return 0
+
+    children, rss_pages = _read_process_table()
+    return _sum_tree_rss_pages(pid, children, rss_pages) * os.sysconf('SC_PAGE_SIZE')
+
+
+def get_browser_rss(pid: int | None = None) -> int:
+    """
+    pid 가 띄운 playwright driver 아래의 브라우저 프로세스들의 RSS 합(byte)
+    parser pool 등 수집 프로세스의 다른 하위 프로세스는 제외합니다. /proc 이 없는 OS 에서는 0
+    """
+    if not os.path.isdir('/proc'):
+        return 0
+
+    children, rss_pages = _read_process_table()
+    total_pages = 0
+    for child_pid in children[pid or os.getpid()]:
+        if PLAYWRIGHT_DRIVER_ARG not in _read_cmdline(child_pid):
+            continue
+        for browser_pid in children[child_pid]:  # driver 자신은 제외
+            total_pages += _sum_tree_rss_pages(browser_pid, children, rss_pages)
+    return total_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _read_process_table() -> Tuple[Dict[int, List[int]], Dict[int, int]]:
+    """
+    :return: ({ 부모 pid: 자식 pid 리스트 }, { pid: RSS page 개수 })
+    """
+    children = defaultdict(list)
+    rss_pages = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat_file:
+                fields = stat_file.read().rsplit(')', 1)[1].split()  # 프로세스 이름에 공백이 있을 수 있음
+        except (OSError, IndexError):
+            continue  # 이미 종료된 프로세스
+        children[int(fields[1])].append(int(entry))
+        rss_pages[int(entry)] = int(fields[21])
+    return children, rss_pages
+
+
+def _sum_tree_rss_pages(pid: int, children: Dict[int, List[int]], rss_pages: Dict[int, int]) -> int:
+    total_pages = 0
+    stack = [pid]
+    while stack:
+        current_pid = stack.pop()
+        total_pages += rss_pages.get(current_pid, 0)
+        stack.extend(children[current_pid])
+    return total_pages
+
+
+def _read_cmdline(pid: int) -> List[str]:
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as cmdline_file:
+            return cmdline_file.read().decode(errors='replace').split('\0')
+    except OSError:
+        return []
@@ -24,5 +24,4 @@ Base = declarative_base()
 async def get_db():
     async with Session() as session:  # async 세션을 사용
         yield session
-    await Session.remove()
-    await async_engine.dispose()
\ No newline at end of file
+    await Session.remove()  # engine 은 여러 지역, task 가 공유하므로 수집이 모두 끝난 뒤 main.py 에서 정리
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Integer, Text, PrimaryKeyConstraint
+from sqlalchemy import Column, String, Float, Integer, Text, DateTime, PrimaryKeyConstraint, Index, text
 from enum import Enum as PyEnum
 from app.lib.database import Base, async_engine
 
@@ -16,6 +16,7 @@ class Listing(Base):
     foreigner_review_count = Column(Integer)
     option_list = Column(Text, nullable=True)
     reserved_count = Column(Integer)
+    detail_collect_date = Column(String(255), nullable=True)  # 상세 페이지를 마지막으로 수집한 날짜 ( 이전 정보를 이어받은 경우 )
 
     __table_args__ = (
         PrimaryKeyConstraint('id', 'collect_date'),
@@ -33,7 +34,8 @@ class Listing(Base):
             "review_count": self.review_count,
             "foreigner_review_count": self.foreigner_review_count,
             "option_list": self.option_list,
-            "reserved_count": self.reserved_count
+            "reserved_count": self.reserved_count,
+            "detail_collect_date": self.detail_collect_date
         }
 
 
@@ -43,8 +45,81 @@ class Status(PyEnum):
     FAIL = 'F'
 
 
+class BoxStatus(PyEnum):
+    PENDING = 'P'  # 탐색 대기
+    LEASED = 'L'  # 워커가 탐색 중
+    DONE = 'D'  # 탐색 완료
+
+
+class SearchBox(Base):
+    """
+    분할 정복 탐색의 frontier ( 탐색해야 할 바운딩 박스 )
+    sido, collect_date 단위로 하나의 탐색 트리를 구성합니다.
+    """
+    __tablename__ = 'search_box'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    sido = Column(String(255), nullable=False)
+    collect_date = Column(String(255), nullable=False)
+    depth = Column(Integer, default=0)
+    ne_lat = Column(Float, nullable=False)
+    ne_lng = Column(Float, nullable=False)
+    sw_lat = Column(Float, nullable=False)
+    sw_lng = Column(Float, nullable=False)
+    status = Column(String(1), default=BoxStatus.PENDING.value)
+    searched_count = Column(Integer, nullable=True)
+    leased_by = Column(String(255), nullable=True)
+    leased_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_search_box_frontier', 'sido', 'collect_date', 'status'),
+    )
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "sido": self.sido,
+            "collect_date": self.collect_date,
+            "depth": self.depth,
+            "ne_lat": self.ne_lat,
+            "ne_lng": self.ne_lng,
+            "sw_lat": self.sw_lat,
+            "sw_lng": self.sw_lng,
+            "status": self.status,
+            "searched_count": self.searched_count,
+            "leased_by": self.leased_by,
+            "leased_at": self.leased_at
+        }
+
+
+class CrawlPlanBox(Base):
+    """
+    이전 수집에서 더 이상 분할되지 않은 리프 박스 ( 다음 수집의 시작 박스 )
+    sido, root_key( 루트 바운딩 박스 ) 단위로 가장 최근 수집의 리프 박스만 유지합니다.
+    """
+    __tablename__ = 'crawl_plan_box'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    sido = Column(String(255), nullable=False)
+    root_key = Column(String(255), nullable=False)
+    collect_date = Column(String(255), nullable=False)
+    ne_lat = Column(Float, nullable=False)
+    ne_lng = Column(Float, nullable=False)
+    sw_lat = Column(Float, nullable=False)
+    sw_lng = Column(Float, nullable=False)
+    parent_ne_lat = Column(Float, nullable=True)  # 병합 판단을 위한 상위 박스 ( 루트 박스인 경우 null )
+    parent_ne_lng = Column(Float, nullable=True)
+    parent_sw_lat = Column(Float, nullable=True)
+    parent_sw_lng = Column(Float, nullable=True)
+    searched_count = Column(Integer)
+
+    __table_args__ = (
+        Index('ix_crawl_plan_box_root', 'sido', 'root_key'),
+    )
+
+
 async def create_tables():
     async with async_engine.begin() as conn:
         await conn.run_sync(
             Base.metadata.create_all
         )
+        # create_all 은 기존 테이블에 컬럼을 추가하지 않음
+        await conn.execute(text("ALTER TABLE listing ADD COLUMN IF NOT EXISTS detail_collect_date VARCHAR(255)"))
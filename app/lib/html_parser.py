@@ -0,0 +1,170 @@
+from typing import List
+from abc import ABC, abstractmethod
+from bs4 import BeautifulSoup, Tag, NavigableString
+
+
+"""
+html_parser.py
+상세 페이지 추출기가 사용하는 HTML 파서 backend
+- html.parser: BeautifulSoup + 파이썬 내장 파서 ( 기본값 )
+- lxml: BeautifulSoup + lxml 파서 ( 추출 코드는 같고 파싱만 빠름, lxml 설치 필요 )
+- selectolax: lexbor 파서 ( 트리 탐색까지 C 로 실행, selectolax 설치 필요 )
+페이지마다 parse_html 로 트리를 한번만 만들고, 모든 항목 추출에 재사용합니다.
+"""
+
+PARSER_LIST = ['html.parser', 'lxml', 'selectolax']
+
+
+class HtmlNode(ABC):
+    """
+    추출기가 사용하는 탐색 연산만 모은 공통 인터페이스
+    """
+
+    @abstractmethod
+    def find_by_attr(self, name: str, value: str) -> 'HtmlNode | None':
+        """
+        속성 값이 일치하는 첫번째 하위 element
+        """
+        pass
+
+    @abstractmethod
+    def find(self, tag: str) -> 'HtmlNode | None':
+        """
+        tag 이름이 일치하는 첫번째 하위 element
+        """
+        pass
+
+    @abstractmethod
+    def select(self, selector: str) -> List['HtmlNode']:
+        pass
+
+    @abstractmethod
+    def child_elements(self, tag: str) -> List['HtmlNode']:
+        """
+        tag 이름이 일치하는 직계 자식 element ( find_all(tag, recursive=False) )
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def parent(self) -> 'HtmlNode | None':
+        pass
+
+    @property
+    @abstractmethod
+    def text(self) -> str:
+        """
+        모든 하위 text 를 이어 붙인 문자열
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def first_child_text(self) -> str | None:
+        """
+        첫번째 자식 노드가 text 이면 그 값, element 이면 None ( contents[0] )
+        """
+        pass
+
+    @abstractmethod
+    def get(self, name: str) -> str | None:
+        pass
+
+
+class SoupNode(HtmlNode):
+
+    def __init__(self, tag: Tag):
+        self.tag = tag
+
+    def find_by_attr(self, name: str, value: str) -> HtmlNode | None:
+        return _wrap_soup(self.tag.find(attrs={name: value}))
+
+    def find(self, tag: str) -> HtmlNode | None:
+        return _wrap_soup(self.tag.find(tag))
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        return [SoupNode(tag) for tag in self.tag.select(selector)]
+
+    def child_elements(self, tag: str) -> List[HtmlNode]:
+        return [SoupNode(child) for child in self.tag.find_all(tag, recursive=False)]
+
+    @property
+    def parent(self) -> HtmlNode | None:
+        return _wrap_soup(self.tag.parent)
+
+    @property
+    def text(self) -> str:
+        return self.tag.text
+
+    @property
+    def first_child_text(self) -> str | None:
+        if len(self.tag.contents) == 0 or not isinstance(self.tag.contents[0], NavigableString):
+            return None
+        return str(self.tag.contents[0])
+
+    def get(self, name: str) -> str | None:
+        return self.tag.get(name)
+
+
+class LexborNode(HtmlNode):
+
+    def __init__(self, node):
+        self.node = node
+
+    def find_by_attr(self, name: str, value: str) -> HtmlNode | None:
+        return self._css_first(f"[{name}=\"{value}\"]")
+
+    def find(self, tag: str) -> HtmlNode | None:
+        return self._css_first(tag)
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        # lexbor 의 css 는 자기 자신도 포함하므로 자식마다 탐색 ( 문서 순서 유지 )
+        return [LexborNode(node) for child in self.node.iter() for node in child.css(selector)]
+
+    def child_elements(self, tag: str) -> List[HtmlNode]:
+        return [LexborNode(child) for child in self.node.iter() if child.tag == tag]
+
+    @property
+    def parent(self) -> HtmlNode | None:
+        return _wrap_lexbor(self.node.parent)
+
+    @property
+    def text(self) -> str:
+        return self.node.text(deep=True)
+
+    @property
+    def first_child_text(self) -> str | None:
+        child = self.node.child
+        if child is None or child.tag != '-text':
+            return None
+        return child.text(deep=False)
+
+    def get(self, name: str) -> str | None:
+        return self.node.attributes.get(name)
+
+    def _css_first(self, selector: str) -> HtmlNode | None:
+        for child in self.node.iter():
+            node = child.css_first(selector)
+            if node is not None:
+                return LexborNode(node)
+        return None
+
+
+def parse_html(html: str, parser: str = 'html.parser') -> HtmlNode:
+    """
+    :param parser: PARSER_LIST 중 하나
+    """
+    if parser == 'selectolax':
+        from selectolax.lexbor import LexborHTMLParser  # 선택 설치 패키지
+        return LexborNode(LexborHTMLParser(html).root)
+    if parser in ('html.parser', 'lxml'):
+        return SoupNode(BeautifulSoup(html, parser))
+    raise ValueError(f"지원하지 않는 HTML 파서입니다: {parser} ( {', '.join(PARSER_LIST)} 중 하나 )")
+
+
+def _wrap_soup(tag) -> HtmlNode | None:
+    return SoupNode(tag) if isinstance(tag, Tag) else None
+
+
+def _wrap_lexbor(node) -> HtmlNode | None:
+    return LexborNode(node) if node is not None else None
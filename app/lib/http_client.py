@@ -0,0 +1,90 @@
+from typing import Dict
+from playwright.async_api import Playwright, APIRequestContext, APIResponse
+from app.lib import metrics
+from app.logger import get_logger
+import asyncio
+import json
+
+
+"""
+http_client.py
+브라우저 렌더링 없이 에어비앤비 페이지를 가져오는 HTTP client
+"""
+
+logger = get_logger('app')
+
+
+class HttpClient:
+    """
+    하나의 APIRequestContext 를 모든 task 가 공유하므로 연결이 재사용됩니다. ( keep-alive )
+    동시 요청 개수는 semaphore 로 제한합니다.
+    """
+
+    def __init__(self, request_context: APIRequestContext, concurrency: int, timeout: float):
+        self.request_context = request_context
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.timeout = timeout
+
+    @classmethod
+    async def create(cls, playwright: Playwright, concurrency: int, timeout: float, user_agent: str):
+        request_context = await playwright.request.new_context(
+            extra_http_headers={
+                'User-Agent': user_agent,
+                'Accept-Language': 'ko-KR,ko;q=0.9'
+            }
+        )
+        return cls(request_context, concurrency, timeout)
+
+    async def get_text(self, url: str) -> str | None:
+        """
+        :return: 응답 본문, 요청에 실패하거나 2xx 가 아니면 None
+        """
+        async with self.semaphore:
+            response = await self._get(url)
+            if response is None:
+                return None
+
+            body = await response.body()
+            metrics.increase('http.received_bytes', len(body))
+            return body.decode('utf-8', errors='replace')
+
+    async def get_json(self, url: str, headers: Dict | None = None) -> Dict | None:
+        """
+        페이지 요청과 같은 semaphore 로 동시 요청 개수를 제한합니다. ( 리뷰 API 등 )
+        :return: 응답 JSON, 요청에 실패하거나 2xx 가 아니면 None
+        """
+        async with self.semaphore:
+            response = await self._get(url, headers)
+            if response is None:
+                return None
+
+            try:
+                body = await response.body()
+                metrics.increase('http.received_bytes', len(body))
+                return json.loads(body)
+            except Exception as e:
+                metrics.increase('http.failed')
+                logger.error(f"HTTP 응답 JSON 파싱 실패 ({url}): {e}")
+                return None
+
+    async def _get(self, url: str, headers: Dict | None = None) -> APIResponse | None:
+        """
+        semaphore 를 잡은 상태에서 호출
+        :return: 2xx 응답, 요청에 실패하거나 2xx 가 아니면 None
+        """
+        metrics.increase('http.requested')
+        try:
+            response = await self.request_context.get(url, headers=headers, timeout=self.timeout * 1000)
+        except Exception as e:
+            metrics.increase('http.failed')
+            logger.error(f"HTTP 요청 실패 ({url}): {e}")
+            return None
+
+        if not response.ok:
+            metrics.increase('http.failed')
+            logger.error(f"HTTP 요청 실패 ({url}): status {response.status}")
+            return None
+        return response
+
+    async def close(self):
+        await self.request_context.dispose()
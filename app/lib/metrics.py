@@ -0,0 +1,59 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from app.logger import get_logger
+
+
+"""
+metrics.py
+수집 중 누적되는 카운터 ( 프로세스 단위 )
+scope 안에서는 프로세스 전체 값과 별도로 해당 범위의 값을 셉니다. ( 여러 지역을 동시에 수집할 때 지역별 값 )
+"""
+
+logger = get_logger('app')
+counter = Counter()
+scoped_counter: ContextVar[Counter | None] = ContextVar('scoped_counter', default=None)
+
+
+def increase(name: str, value: int | float = 1):
+    counter[name] += value
+    current = scoped_counter.get()
+    if current is not None:
+        current[name] += value
+
+
+def get(name: str) -> int | float:
+    return _get_counter()[name]
+
+
+@contextmanager
+def scope():
+    """
+    with 블록과 그 안에서 만든 task 에서 증가한 값을 따로 셉니다. 블록 안의 get, get_rate 는 해당 범위의 값을 반환합니다.
+    """
+    token = scoped_counter.set(Counter())
+    try:
+        yield
+    finally:
+        scoped_counter.reset(token)
+
+
+def _get_counter() -> Counter:
+    current = scoped_counter.get()
+    return current if current is not None else counter
+
+
+def get_rate(numerator: str, denominator: str) -> float:
+    """
+    :return: numerator / denominator 비율 ( 0 ~ 1 ), 분모가 0 이면 0
+    """
+    current = _get_counter()
+    if current[denominator] == 0:
+        return 0.0
+    return current[numerator] / current[denominator]
+
+
+def write_metrics_log():
+    current = _get_counter()
+    for name in sorted(current):
+        logger.info(f"[metrics] {name}: {current[name]}")
@@ -0,0 +1,395 @@
+from dataclasses import dataclass
+from datetime import timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from html import escape
+from typing import Dict, List, Tuple
+from collections import Counter
+from urllib.parse import urlsplit, parse_qsl, unquote
+from app.logger import get_logger
+from app.util import generate_now_date
+import base64
+import json
+import math
+import random
+import time
+import numpy as np
+
+# constants
+from app.constants import MAX_PAGE_NUM, SEARCH_RESULT_LIMIT, REVIEW_API_NAME
+
+"""
+mock_airbnb.py
+부하 테스트용 로컬 에어비앤비 서버
+밀도 맵으로 만든 가상의 숙소를 검색 페이지 ( data-deferred-state-0 ), StaysSearch API ( 최대 15페이지 * 18개 ),
+숙소 상세 페이지, 리뷰 API 로 제공합니다. 수집기는 AIRBNB_BASE_URL 을 이 서버로 지정하여 사용합니다.
+"""
+
+logger = get_logger('app')
+
+LISTING_PER_PAGE = SEARCH_RESULT_LIMIT // MAX_PAGE_NUM
+REVIEW_PAGE_LIMIT = 24  # 리뷰 모달이 한번에 요청하는 리뷰 개수
+PREVIEW_REVIEW_COUNT = 6  # 상세 페이지 내장 데이터에 포함되는 리뷰 개수
+CALENDAR_DAYS = 90  # 상세 페이지 달력의 일수 ( 오늘부터 )
+AMENITY_LIST = ['무선 인터넷', '주방', '세탁기', '에어컨', '난방', '헤어드라이어', '건물 내 무료 주차', 'TV', '엘리베이터', '바다 전망']
+KOREAN_REVIEW_LIST = ['위치가 정말 좋고 깨끗했어요.', '호스트분이 친절하시고 체크인이 편했습니다.', '사진과 똑같아요. 또 올게요!']
+FOREIGN_REVIEW_LIST = ['Great location and very clean.', 'The host was super responsive.', '駅から近くて便利でした。']
+
+# 대전광역시 ( README 의 수집 예시 지역 ) 의 도심이 밀집된 밀도 맵
+DEFAULT_DENSITY_MAP = {
+    'seed': 42,
+    'cells': [
+        {'sw_lat': 36.197, 'sw_lng': 127.259, 'ne_lat': 36.492, 'ne_lng': 127.56, 'count': 600},
+        {'sw_lat': 36.30, 'sw_lng': 127.35, 'ne_lat': 36.38, 'ne_lng': 127.45, 'count': 1800},
+        {'sw_lat': 36.32, 'sw_lng': 127.41, 'ne_lat': 36.34, 'ne_lng': 127.44, 'count': 900}
+    ]
+}
+
+
+@dataclass
+class MockListing:
+    id: str
+    lat: float
+    lng: float
+    title: str
+    rating: float
+    review_count: int
+    amenity_list: List[str]
+    seed: int  # 리뷰, 달력을 만들 때 쓰는 숙소별 seed
+
+
+class MockAirbnb:
+    """
+    숙소 목록과 요청별 응답 생성 ( HTTP 처리는 MockAirbnbHandler )
+    검색 결과는 박스 안의 숙소를 숙소별 순위 순으로 최대 SEARCH_RESULT_LIMIT 개까지 보여주고, 헤더에는 전체 개수를 표시합니다.
+    """
+
+    def __init__(self, listing_list: List[MockListing], latency: float = 0.0, jitter: float = 0.0):
+        """
+        :param latency: 모든 응답을 늦추는 시간(초)
+        :param jitter: latency 에 더하는 0 ~ jitter 초의 무작위 지연
+        """
+        self.listing_list = listing_list
+        self.listing_by_id = {listing.id: listing for listing in listing_list}
+        self.lat = np.array([listing.lat for listing in listing_list], dtype=float)
+        self.lng = np.array([listing.lng for listing in listing_list], dtype=float)
+        self.latency = latency
+        self.jitter = jitter
+        self.request_counter = Counter()  # 요청 종류별 처리 개수
+
+    @classmethod
+    def from_density_map(cls, density_map: Dict, latency: float = 0.0, jitter: float = 0.0):
+        """
+        :param density_map: {"seed": 42, "cells": [{"sw_lat", "sw_lng", "ne_lat", "ne_lng", "count"}, ...]}
+        셀마다 count 개의 숙소를 셀 안에 균등하게 흩뿌리며, 셀이 겹치면 겹친 영역의 밀도가 높아집니다.
+        """
+        rng = random.Random(density_map.get('seed', 0))
+        listing_list = []
+        for cell in density_map['cells']:
+            for _ in range(int(cell['count'])):
+                listing_id = str(rng.randrange(10 ** 17, 10 ** 18))
+                review_count = rng.choice([0, rng.randint(1, 30), rng.randint(30, 400)])
+                listing_list.append(MockListing(
+                    id=listing_id,
+                    lat=round(rng.uniform(cell['sw_lat'], cell['ne_lat']), 6),
+                    lng=round(rng.uniform(cell['sw_lng'], cell['ne_lng']), 6),
+                    title=f"가상 숙소 {listing_id[-6:]}",
+                    rating=round(rng.uniform(4.0, 5.0), 2) if review_count > 0 else 0.0,
+                    review_count=review_count,
+                    amenity_list=rng.sample(AMENITY_LIST, rng.randint(3, len(AMENITY_LIST))),
+                    seed=rng.randrange(2 ** 32)
+                ))
+        return cls(listing_list, latency, jitter)
+
+    def wait_latency(self):
+        if self.latency > 0 or self.jitter > 0:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def search(self, ne_lat: float, ne_lng: float, sw_lat: float, sw_lng: float) -> Tuple[List[MockListing], int]:
+        """
+        :return: (검색 결과로 볼 수 있는 최대 SEARCH_RESULT_LIMIT 개의 숙소, 박스 안의 전체 숙소 개수)
+        """
+        mask = (self.lat >= sw_lat) & (self.lat <= ne_lat) & (self.lng >= sw_lng) & (self.lng <= ne_lng)
+        matched_list = [self.listing_list[index] for index in np.flatnonzero(mask)]
+        matched_list.sort(key=lambda listing: listing.seed)  # 숙소별 고정 순위
+        return matched_list[:SEARCH_RESULT_LIMIT], len(matched_list)
+
+    def render_search_page(self, params: Dict[str, str]) -> str:
+        box = _get_box(params)
+        visible_list, total_count = self.search(*box)
+        page_count = max(min(math.ceil(len(visible_list) / LISTING_PER_PAGE), MAX_PAGE_NUM), 1)
+        cursor_list = [_encode_cursor(page_num * LISTING_PER_PAGE) for page_num in range(page_count)]
+        raw_params = [{'filterName': name, 'filterValues': [str(value)]}
+                      for name, value in zip(('ne_lat', 'ne_lng', 'sw_lat', 'sw_lng'), box)]
+        state = {'niobeMinimalClientData': [
+            [f"StaysSearch:{json.dumps(raw_params)}", self._build_stays_search(visible_list, 0, cursor_list)]
+        ]}
+        heading = '숙소 1,000개 이상' if total_count >= 1000 else f"숙소 {total_count:,}개"
+        card_list = ''.join(
+            f'<div itemprop="itemListElement"><a href="/rooms/{listing.id}">{escape(listing.title)}</a></div>'
+            for listing in visible_list[:LISTING_PER_PAGE]
+        )
+        search_state = json.dumps({'cursors': cursor_list, 'rawParams': raw_params})
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{escape(params.get('query', ''))} · 숙소</title></head>
+<body>
+<main id="site-content">
+<h1><span data-testid="stays-page-heading">{heading}</span></h1>
+<div>{card_list}</div>
+<nav><button type="button" aria-label="다음"{' disabled' if page_count <= 1 else ''}>다음</button></nav>
+</main>
+<script>
+(function () {{
+  var state = {search_state};
+  var page = 0;
+  var button = document.querySelector("[aria-label='다음']");
+  button.addEventListener('click', function () {{
+    page += 1;
+    if (page >= state.cursors.length - 1) button.setAttribute('disabled', '');
+    var request = {{cursor: state.cursors[page], rawParams: state.rawParams}};
+    fetch('/api/v3/StaysSearch/mock?operationName=StaysSearch&locale=ko&currency=KRW', {{
+      method: 'POST',
+      headers: {{'content-type': 'application/json'}},
+      body: JSON.stringify({{operationName: 'StaysSearch', variables: {{staysSearchRequest: request, staysMapSearchRequestV2: request}}}})
+    }});
+  }});
+}})();
+</script>
+<script id="data-deferred-state-0" type="application/json">{_to_script_json(state)}</script>
+</body></html>"""
+
+    def respond_stays_search(self, body: Dict) -> Dict:
+        """
+        검색 페이지의 다음 버튼, 또는 수집기가 cursor 만 바꾸어 다시 보내는 StaysSearch 요청의 응답
+        """
+        request = body.get('variables', {}).get('staysSearchRequest', {})
+        params = {raw_param['filterName']: raw_param['filterValues'][0] for raw_param in request.get('rawParams', [])}
+        visible_list, _ = self.search(*_get_box(params))
+        page_count = max(min(math.ceil(len(visible_list) / LISTING_PER_PAGE), MAX_PAGE_NUM), 1)
+        cursor_list = [_encode_cursor(page_num * LISTING_PER_PAGE) for page_num in range(page_count)]
+        return self._build_stays_search(visible_list, _decode_cursor(request.get('cursor')), cursor_list)
+
+    def _build_stays_search(self, visible_list: List[MockListing], offset: int, cursor_list: List[str]) -> Dict:
+        page_list = visible_list[offset:offset + LISTING_PER_PAGE]
+        search_result_list = [{
+            '__typename': 'StaySearchResult',
+            'listing': {
+                'id': listing.id,
+                'coordinate': {'latitude': listing.lat, 'longitude': listing.lng},
+                'title': listing.title
+            },
+            'avgRatingLocalized': f"{listing.rating} ({listing.review_count})" if listing.review_count > 0 else '신규',
+            'avgRatingA11yLabel': f"평균 평점 {listing.rating}점(5점 만점), 후기 {listing.review_count}개"
+            if listing.review_count > 0 else '신규 숙소'
+        } for listing in page_list]
+        map_result_list = [{
+            'listing': {'id': listing.id},
+            'demandStayListing': {'location': {'coordinate': {'latitude': listing.lat, 'longitude': listing.lng}}}
+        } for listing in page_list]
+        return {'data': {'presentation': {'staysSearch': {
+            'results': {'searchResults': search_result_list, 'paginationInfo': {'pageCursors': cursor_list}},
+            'mapResults': {'mapSearchResults': map_result_list}
+        }}}}
+
+    def render_room_page(self, listing: MockListing) -> str:
+        calendar_day_list = self._get_calendar_days(listing)
+        review_list = self._get_review_list(listing, 0, PREVIEW_REVIEW_COUNT)
+        state = {'niobeMinimalClientData': [
+            [f"StaysPdpSections:{listing.id}", {'data': {'presentation': {'stayProductDetailPage': {'sections': {
+                'sections': [
+                    {'sectionId': 'TITLE_DEFAULT', 'section': {'title': listing.title}},
+                    {'sectionId': 'REVIEWS_DEFAULT', 'section': {
+                        'overallRating': listing.rating,
+                        'overallCount': listing.review_count,
+                        'reviews': [{'comments': comments} for comments in review_list]
+                    }},
+                    {'sectionId': 'AMENITIES_DEFAULT', 'section': {'previewAmenitiesGroups': [{'amenities': [
+                        {'title': amenity, 'available': True} for amenity in listing.amenity_list
+                    ]}]}}
+                ]
+            }}}}}],
+            [f"PdpAvailabilityCalendar:{listing.id}", {'data': {'merlin': {'pdpAvailabilityCalendar': {
+                'calendarMonths': [{'days': [
+                    {'calendarDate': day.strftime('%Y-%m-%d'), 'available': available}
+                    for day, available in calendar_day_list
+                ]}]
+            }}}}]
+        ]}
+        amenity_div_list = ''.join(f'<div><div><div>{escape(amenity)}</div></div></div>' for amenity in listing.amenity_list)
+        calendar_td_list = ''.join(
+            f'<td aria-label="{day.year}년 {day.month}월 {day.day}일, '
+            f'{"체크인 날짜로 선택할 수 있습니다." if available else "예약 불가능합니다"}">'
+            f'<div data-testid="calendar-day-{day.strftime("%Y.%m.%d")}.">{day.day}</div></td>'
+            for day, available in calendar_day_list
+        )
+        review_section = ''
+        if listing.review_count > 0:
+            review_section = f"""<div>
+<div data-testid="pdp-reviews-highlight-banner-host-rating"><div aria-hidden="true">{listing.rating}</div></div>
+<div data-testid="pdp-reviews-highlight-banner-host-review"><div>{listing.review_count}</div><div>후기</div></div>
+<button type="button" data-testid="pdp-show-all-reviews-button">후기 {listing.review_count}개 모두 보기</button>
+</div>"""
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{escape(listing.title)}</title></head>
+<body>
+<div id="site-content">
+<div data-section-id="TITLE_DEFAULT"><div><section><div><span><h1>{escape(listing.title)}</h1></span></div></section></div></div>
+{review_section}
+<div data-section-id="AMENITIES_DEFAULT"><div><section><div><h2>숙소 편의시설</h2></div><div>{amenity_div_list}</div></section></div></div>
+<div data-section-id="AVAILABILITY_CALENDAR_INLINE"><table><tbody><tr>{calendar_td_list}</tr></tbody></table></div>
+</div>
+<script>
+(function () {{
+  var button = document.querySelector('[data-testid="pdp-show-all-reviews-button"]');
+  if (button === null) return;
+  button.addEventListener('click', function () {{
+    var variables = {{id: btoa('StayListing:{listing.id}'), pdpReviewsRequest: {{
+      fieldSelector: 'for_p3_translation_only', forPreview: false, limit: {REVIEW_PAGE_LIMIT}, offset: '0',
+      showingTranslationButton: false, first: {REVIEW_PAGE_LIMIT}, sortingPreference: 'MOST_RECENT'
+    }}}};
+    fetch('/api/v3/{REVIEW_API_NAME}/mock?operationName={REVIEW_API_NAME}&locale=ko&currency=KRW&variables='
+      + encodeURIComponent(JSON.stringify(variables)));
+  }});
+}})();
+</script>
+<script id="data-deferred-state-0" type="application/json">{_to_script_json(state)}</script>
+</body></html>"""
+
+    def respond_review_page(self, variables: Dict) -> Dict | None:
+        """
+        :return: 숙소를 찾을 수 없으면 None
+        """
+        try:
+            prefix, listing_id = base64.b64decode(variables['id']).decode().split(':', 1)
+        except Exception:
+            return None
+        listing = self.listing_by_id.get(listing_id)
+        if prefix != 'StayListing' or listing is None:
+            return None
+
+        reviews_request = variables.get('pdpReviewsRequest', {})
+        offset = int(reviews_request.get('offset', 0))
+        limit = int(reviews_request.get('limit', REVIEW_PAGE_LIMIT))
+        return {'data': {'presentation': {'stayProductDetailPage': {'reviews': {
+            'reviews': [{'comments': comments} for comments in self._get_review_list(listing, offset, limit)],
+            'metadata': {'reviewsCount': listing.review_count}
+        }}}}}
+
+    def _get_review_list(self, listing: MockListing, offset: int, limit: int) -> List[str]:
+        """
+        숙소의 review_count 개 리뷰 중 offset 부터 limit 개 ( 같은 숙소는 항상 같은 리뷰 )
+        """
+        review_list = []
+        for index in range(offset, min(offset + limit, listing.review_count)):
+            rng = random.Random(listing.seed + index)
+            review_list.append(rng.choice(KOREAN_REVIEW_LIST if rng.random() < 0.7 else FOREIGN_REVIEW_LIST))
+        return review_list
+
+    def _get_calendar_days(self, listing: MockListing) -> List[Tuple]:
+        rng = random.Random(listing.seed)
+        reserved_ratio = rng.random()
+        today = generate_now_date().date()
+        return [(today + timedelta(days), rng.random() >= reserved_ratio) for days in range(CALENDAR_DAYS)]
+
+
+class MockAirbnbHandler(BaseHTTPRequestHandler):
+    server: 'MockAirbnbServer'
+
+    def do_GET(self):
+        mock = self.server.mock
+        mock.wait_latency()
+        split_url = urlsplit(self.path)
+        params = dict(parse_qsl(split_url.query))
+
+        if split_url.path.startswith('/s/'):
+            mock.request_counter['search'] += 1
+            self._send_html(mock.render_search_page({**params, 'query': unquote(split_url.path.split('/')[2])}))
+        elif split_url.path.startswith('/rooms/'):
+            listing = mock.listing_by_id.get(split_url.path.split('/')[2])
+            if listing is None:
+                self.send_error(404)
+                return
+            mock.request_counter['detail'] += 1
+            self._send_html(mock.render_room_page(listing))
+        elif REVIEW_API_NAME in split_url.path:
+            mock.request_counter['review'] += 1
+            review_data = mock.respond_review_page(json.loads(params.get('variables', '{}')))
+            if review_data is None:
+                self.send_error(404)
+                return
+            self._send_json(review_data)
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        mock = self.server.mock
+        mock.wait_latency()
+        if 'StaysSearch' not in self.path:
+            self.send_error(404)
+            return
+        mock.request_counter['stays_search'] += 1
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        self._send_json(mock.respond_stays_search(json.loads(body or b'{}')))
+
+    def _send_html(self, html: str):
+        self._send(html.encode('utf-8'), 'text/html; charset=utf-8')
+
+    def _send_json(self, data: Dict):
+        self._send(json.dumps(data, ensure_ascii=False).encode('utf-8'), 'application/json; charset=utf-8')
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr 에 출력하지 않음 ( 요청 종류별 개수는 request_counter )
+
+
+class MockAirbnbServer(ThreadingHTTPServer):
+    """
+    요청마다 thread 를 띄우므로 latency 를 주어도 동시 요청이 함께 지연됩니다.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], mock: MockAirbnb):
+        super().__init__(address, MockAirbnbHandler)
+        self.mock = mock
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def load_density_map(path: str | None) -> Dict:
+    """
+    :param path: None 이면 DEFAULT_DENSITY_MAP
+    """
+    if path is None:
+        return DEFAULT_DENSITY_MAP
+    with open(path, encoding='utf-8') as density_map_file:
+        return json.load(density_map_file)
+
+
+def _get_box(params: Dict[str, str]) -> Tuple[float, float, float, float]:
+    return float(params['ne_lat']), float(params['ne_lng']), float(params['sw_lat']), float(params['sw_lng'])
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.b64encode(json.dumps({'section_offset': 0, 'items_offset': offset, 'version': 1}).encode()).decode()
+
+
+def _decode_cursor(cursor: str | None) -> int:
+    try:
+        return int(json.loads(base64.b64decode(cursor))['items_offset'])
+    except Exception:
+        return 0
+
+
+def _to_script_json(data: Dict) -> str:
+    """
+    script 안에 넣을 JSON ( '</script>' 로 script 가 닫히지 않도록 '<' 를 escape )
+    """
+    return json.dumps(data, ensure_ascii=False).replace('<', '\\u003c')
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Dict
 from dataclasses import dataclass, field
 from app.util import generate_checkin_date, generate_checkout_date, generate_now_date_to_string
 import json
@@ -31,6 +31,8 @@ class ListingListRequest:
 class ListingId:
     id: str
     coordinate: tuple
+    rating: float | None = field(default=None, compare=False)  # 검색 결과에 표시된 평점 ( 없으면 None )
+    review_count: int | None = field(default=None, compare=False)  # 검색 결과에 표시된 리뷰 개수 ( 없으면 None )
 
 
 @dataclass
@@ -53,3 +55,71 @@ class Listing:
     reserved_count: int = 0
     foreigner_review_count: int = 0
     collect_date: str = field(default_factory=generate_now_date_to_string)
+
+
+@dataclass
+@terse_str
+class CollectOption:
+    concurrency: int = 1  # 동시에 탐색할 바운딩 박스 개수 (page pool 크기)
+    frontier: bool = False  # DB 에 저장된 frontier 기반으로 수집 ( 이어서 수집, 다중 워커 )
+    early_divide: bool = False  # 1페이지의 검색 개수로 분할 여부를 판단하고, 리프 박스만 모든 페이지 수집
+    adaptive_split: bool = False  # 검색 개수와 과거 좌표 밀도를 기준으로 분할 수와 경계를 결정
+    plan: bool = False  # 이전 수집의 리프 박스부터 수집하고, 이번 수집의 리프 박스를 저장
+    prune_region: bool = False  # 지역 polygon 과 겹치지 않는 박스, polygon 밖의 숙소를 수집하지 않음
+    region_name: str | None = None  # geojson 의 지역 이름 ( 없으면 sido 사용 ) ex) kulsgr
+    detail_concurrency: int = 0  # 상세 정보 수집 워커 개수 ( 0 이면 박스 탐색 중 같은 page 에서 수집 )
+    write_batch_size: int = 0  # 한번에 저장할 숙소 개수 ( 0 이면 숙소마다 바로 저장 )
+    preload: bool = False  # 시작 시 금일 이미 수집된 sido 의 listing id 를 캐시에 불러옴
+    seen_index: bool = False  # listing id 캐시를 수집 일자별 memory-mapped 파일로 저장 ( 프로세스 간 공유 )
+    api_pagination: bool = False  # 3페이지부터 버튼 클릭 대신 StaysSearch API 를 cursor 로 직접 요청
+    http_detail_concurrency: int = 0  # 상세 정보를 브라우저 없이 HTTP 로 동시에 요청하는 개수 ( 0 이면 브라우저로만 수집 )
+    block_resources: List[str] | None = None  # 차단할 resource type 또는 third-party ( 빈 리스트면 측정만, None 이면 사용 안함 )
+    headless: bool = False  # 브라우저 창 없이 실행 ( 리눅스 서버 )
+    max_navigations: int = 0  # page 가 이 횟수만큼 이동하면 context 를 새로 만듬 ( 0 이면 교체하지 않음 )
+    max_rss_mb: int = 0  # 브라우저 메모리(RSS)가 이 값(MB)을 넘으면 반납되는 page 의 context 를 새로 만듬 ( 0 이면 교체하지 않음 )
+    browser_endpoint: str | None = None  # 떠 있는 브라우저 서버의 CDP endpoint ( 없으면 브라우저를 직접 띄움 )
+    time_budget: int = 0  # 수집 시간 예산(분), 점수가 높은 박스부터 수집하고 예산이 끝나면 중단 ( 0 이면 끝까지 수집 )
+    refresh_ttl: int = 0  # 검색 결과의 평점, 리뷰 개수가 이전과 같으면 이 일수 동안 상세 정보를 다시 수집하지 않음 ( 0 이면 매번 수집 )
+    parser_processes: int = 0  # HTML 파싱을 실행할 프로세스 개수 ( 0 이면 event loop 에서 파싱 )
+
+
+@dataclass
+@terse_str
+class RegionJob:
+    request: ListingListRequest
+    priority: int = 0  # 클수록 먼저 수집
+    region_name: str | None = None  # geojson 의 지역 이름 ( 없으면 sido 사용 )
+
+
+@dataclass
+class RegionReport:
+    sido: str
+    status: str  # 'done', 'failed'
+    duration_seconds: float
+    listing_count: int  # 이번 수집으로 새로 저장된 숙소 개수
+
+    @property
+    def listing_per_minute(self) -> float:
+        return self.listing_count / self.duration_seconds * 60 if self.duration_seconds > 0 else 0.0
+
+
+@dataclass
+class ReviewApiTemplate:
+    url: str  # query string 을 제외한 리뷰 API url
+    params: Dict[str, str]  # variables 를 제외한 query string ( operationName, extensions 등 )
+    variables: Dict
+    headers: Dict[str, str]
+    listing_id: str | None  # 캡처한 요청의 숙소 ID
+    offset: int
+    limit: int  # 한번에 가져오는 리뷰 개수
+
+
+@dataclass
+@terse_str
+class FrontierBox:
+    id: int
+    depth: int
+    ne_lat: float
+    ne_lng: float
+    sw_lat: float
+    sw_lng: float
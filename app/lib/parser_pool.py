@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, TypeVar
+from app.lib import metrics
+from app.logger import get_logger
+import asyncio
+import multiprocessing
+
+
+"""
+parser_pool.py
+HTML 파싱을 별도 프로세스에서 실행하여, 파싱 중에도 event loop 의 다른 page, DB task 가 진행되도록 하는 process pool
+"""
+
+logger = get_logger('app')
+
+T = TypeVar('T')
+
+executor: ProcessPoolExecutor | None = None
+user_count = 0  # pool 을 사용 중인 수집 개수 ( 여러 지역 동시 수집 )
+
+
+def open_parser_pool(process_count: int):
+    """
+    process_count 가 0 이면 pool 을 만들지 않고 event loop 에서 바로 파싱합니다.
+    여러 수집이 함께 열면 처음 연 수집의 process_count 로 하나의 pool 을 공유합니다.
+    """
+    global executor, user_count
+    if process_count <= 0:
+        return
+    user_count += 1
+    if executor is None:
+        # 브라우저, DB 연결을 가진 프로세스를 fork 하지 않도록 spawn 으로 띄움
+        executor = ProcessPoolExecutor(max_workers=process_count, mp_context=multiprocessing.get_context('spawn'))
+        logger.info(f"HTML 파싱 process pool 시작 - 프로세스 개수: {process_count}")
+
+
+def close_parser_pool(process_count: int):
+    global executor, user_count
+    if process_count <= 0:
+        return
+    user_count -= 1
+    if user_count == 0 and executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+        executor = None
+        logger.info("HTML 파싱 process pool 종료")
+
+
+async def parse(func: Callable[..., T], *args) -> T:
+    """
+    pool 이 열려 있으면 func(*args) 를 다른 프로세스에서 실행합니다.
+    func 는 모듈 최상위 함수여야 하고, 인자와 반환값은 pickle 가능해야 합니다. ( raw HTML 을 넘기고 dict, ListingId 를 받음 )
+    """
+    if executor is None:
+        return func(*args)
+    metrics.increase('parser.offloaded')
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
@@ -0,0 +1,97 @@
+from typing import List
+from urllib.parse import urlsplit
+from playwright.async_api import BrowserContext, Route, Request
+from app.lib import metrics
+from app.logger import get_logger
+
+
+"""
+resource_filter.py
+수집에 필요 없는 리소스 요청을 막고, 페이지 종류별로 막은 요청과 받은 바이트를 기록하는 context route
+"""
+
+logger = get_logger('app')
+
+THIRD_PARTY = 'third-party'  # 허용 도메인이 아닌 모든 요청
+PAGE_TYPE_LIST = ['search', 'detail', 'other']
+
+
+class ResourceFilter:
+    """
+    blocked_list 는 playwright resource type ( image, media, font, stylesheet ... ) 또는 third-party 입니다.
+    blocked_list 가 비어 있으면 요청을 막지 않고 측정만 합니다. ( 차단 전후 비교용 )
+    """
+
+    def __init__(self, blocked_list: List[str], allowed_domain_list: List[str]):
+        self.blocked_type_set = {blocked for blocked in blocked_list if blocked != THIRD_PARTY}
+        self.block_third_party = THIRD_PARTY in blocked_list
+        self.allowed_domain_list = allowed_domain_list
+
+    async def install(self, context: BrowserContext):
+        await context.route('**/*', self._handle_route)
+        context.on('requestfinished', self._handle_request_finished)
+
+    async def _handle_route(self, route: Route):
+        request = route.request
+        page_type = get_page_type(request)
+        reason = self._get_block_reason(request)
+        if reason is None:
+            await route.continue_()
+            return
+
+        metrics.increase(f"resource.{page_type}.blocked")
+        metrics.increase(f"resource.{page_type}.blocked.{reason}")
+        await route.abort('blockedbyclient')
+
+    def _get_block_reason(self, request: Request) -> str | None:
+        if request.is_navigation_request():
+            return None  # 페이지 이동은 막지 않음
+        if request.resource_type in self.blocked_type_set:
+            return request.resource_type
+        if self.block_third_party and not self.is_allowed_domain(request.url):
+            return THIRD_PARTY
+        return None
+
+    def is_allowed_domain(self, url: str) -> bool:
+        host = urlsplit(url).hostname or ''
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.allowed_domain_list)
+
+    async def _handle_request_finished(self, request: Request):
+        page_type = get_page_type(request)
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return  # page 가 닫힌 경우
+        if request.is_navigation_request() and request.resource_type == 'document':
+            metrics.increase(f"resource.{page_type}.navigations")
+        metrics.increase(f"resource.{page_type}.loaded")
+        metrics.increase(f"resource.{page_type}.loaded_bytes", sizes['responseBodySize'] + sizes['responseHeadersSize'])
+
+    def log_summary(self):
+        for page_type in PAGE_TYPE_LIST:
+            navigation_count = metrics.get(f"resource.{page_type}.navigations")
+            loaded_bytes = metrics.get(f"resource.{page_type}.loaded_bytes")
+            if navigation_count == 0 and loaded_bytes == 0:
+                continue
+            bytes_per_navigation = loaded_bytes / navigation_count if navigation_count > 0 else 0
+            logger.info(f"[resource] {page_type} - 페이지 이동: {navigation_count}, "
+                        f"받은 요청: {metrics.get(f'resource.{page_type}.loaded')}, "
+                        f"막은 요청: {metrics.get(f'resource.{page_type}.blocked')}, "
+                        f"받은 용량: {loaded_bytes / 1024 / 1024:.1f}MB, "
+                        f"페이지 이동 당 {bytes_per_navigation / 1024:.0f}KB")
+
+
+def get_page_type(request: Request) -> str:
+    """
+    요청을 보낸 페이지의 종류 ( 검색 결과 페이지, 숙소 상세 페이지 )
+    """
+    try:
+        url = request.url if request.is_navigation_request() else request.frame.url  # 이동 중에는 frame url 이 이전 페이지
+        path = urlsplit(url).path
+    except Exception:
+        return 'other'  # service worker 요청 등 frame 이 없는 경우
+    if path.startswith('/rooms/'):
+        return 'detail'
+    if path.startswith('/s/'):
+        return 'search'
+    return 'other'
@@ -0,0 +1,206 @@
+from typing import Iterable
+from app.logger import get_logger
+from app.constants import SEEN_INDEX_DIR, SEEN_INDEX_CAPACITY, SEEN_INDEX_MAX_LOAD
+import numpy as np
+import fcntl
+import os
+
+
+"""
+seen_index.py
+수집 일자별로 이미 수집한 listing id 를 저장하는 memory-mapped 해시 테이블
+같은 호스트의 여러 수집 프로세스가 공유하며, 프로세스가 재시작되어도 유지됩니다.
+"""
+
+logger = get_logger('app')
+
+EMPTY = 0
+DELETED = np.uint64(0xFFFFFFFFFFFFFFFF)
+HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+class SeenIndex:
+    """
+    listing id( 최대 19자리 숫자 ) 를 uint64 로 저장하는 open addressing( linear probing ) 해시 테이블
+    set 과 같은 방식( in, add, update, discard )으로 사용합니다.
+    쓰기는 파일 잠금(flock)으로 프로세스 간 직렬화하고, 읽기는 잠금 없이 수행합니다.
+    숫자가 아닌 id 나 테이블이 가득 찬 이후의 id 는 프로세스 메모리의 set 에 저장합니다.
+    아직 DB 에 저장되지 않은 id 는 add_pending 으로 프로세스 메모리에만 두었다가, 저장 후 persist 로 파일에 기록합니다.
+    파일의 첫 word 는 저장된 id 개수( 헤더 )이며, 여러 프로세스가 잠금 안에서 함께 갱신합니다.
+    """
+
+    def __init__(self, file_path: str, capacity: int = SEEN_INDEX_CAPACITY):
+        if not os.path.exists(file_path):
+            with open(file_path, 'wb') as f:
+                f.truncate((capacity + 1) * 8)  # sparse 파일로 생성되므로 실제 사용한 슬롯만큼만 디스크를 차지함.
+
+        self.file_path = file_path
+        self.file = open(file_path, 'r+b')
+        self.mmap = np.memmap(self.file, dtype=np.uint64, mode='r+')
+        self.header = self.mmap[:1]
+        self.table = self.mmap[1:]
+        self.capacity = len(self.table)
+        self.fallback = set()
+        self.pending = set()
+
+    @classmethod
+    def open(cls, collect_date: str, directory: str = SEEN_INDEX_DIR, capacity: int = SEEN_INDEX_CAPACITY):
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        remove_stale_index_files(collect_date, directory)
+        index = cls(os.path.join(directory, f"seen-{collect_date}.bin"), capacity)
+        logger.info(f"{collect_date} 수집 listing id 인덱스를 열었습니다. - 저장된 id: {index.size}개")
+        return index
+
+    @property
+    def size(self) -> int:
+        """
+        파일에 저장된 id 개수 ( 다른 프로세스가 추가한 id 포함 )
+        """
+        return int(self.header[0])
+
+    def __contains__(self, listing_id) -> bool:
+        if listing_id in self.pending or listing_id in self.fallback:
+            return True
+        key = _to_key(listing_id)
+        return key is not None and self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self.size + len(self.fallback) + len(self.pending)
+
+    def add(self, listing_id):
+        self.pending.discard(listing_id)
+        key = _to_key(listing_id)
+        if key is None:
+            self.fallback.add(listing_id)
+            return
+
+        with self._lock():
+            slot = self._find_slot(key) if self.size < self.capacity * SEEN_INDEX_MAX_LOAD else None
+            if slot is None:
+                self.fallback.add(listing_id)  # 최대 적재율을 넘었거나 빈 슬롯이 없는 경우
+                return
+            if self.table[slot] != np.uint64(key):
+                self.table[slot] = np.uint64(key)
+                self.header[0] += np.uint64(1)
+
+    def add_pending(self, listing_id):
+        """
+        저장 대기 중인 id 는 다른 프로세스와 재시작 후에 보이지 않도록 프로세스 메모리에만 둡니다.
+        """
+        self.pending.add(listing_id)
+
+    def persist(self, listing_ids: Iterable):
+        """
+        저장이 끝난 대기 id 를 파일에 기록합니다.
+        """
+        self.update(listing_ids)
+
+    def discard_pending(self, listing_ids: Iterable):
+        """
+        저장에 실패한 대기 id 를 제거합니다. ( 다른 프로세스가 저장한 id 는 파일에 남겨둠 )
+        """
+        self.pending.difference_update(listing_ids)
+
+    def update(self, listing_ids: Iterable):
+        for listing_id in listing_ids:
+            self.add(listing_id)
+
+    def discard(self, listing_id):
+        self.pending.discard(listing_id)
+        self.fallback.discard(listing_id)
+        key = _to_key(listing_id)
+        if key is None:
+            return
+
+        with self._lock():
+            slot = self._find(key)
+            if slot is not None:
+                self.table[slot] = DELETED  # 탐색이 끊기지 않도록 빈 슬롯 대신 삭제 표시
+                self.header[0] -= np.uint64(1)
+
+    def difference_update(self, listing_ids: Iterable):
+        for listing_id in listing_ids:
+            self.discard(listing_id)
+
+    def close(self):
+        self.mmap.flush()
+        del self.header, self.table, self.mmap
+        self.file.close()
+
+    def _find(self, key: int) -> int | None:
+        """
+        key 가 저장된 슬롯 번호
+        """
+        key = np.uint64(key)  # python int 와 비교하면 float64 로 변환되어 19자리 id 의 정밀도가 손실됨.
+        for slot in self._probe(key):
+            value = self.table[slot]
+            if value == EMPTY:
+                return None
+            if value == key:
+                return slot
+        return None
+
+    def _find_slot(self, key: int) -> int | None:
+        """
+        key 가 저장된 슬롯 또는 key 를 저장할 슬롯 번호
+        """
+        key = np.uint64(key)
+        deleted_slot = None
+        for slot in self._probe(key):
+            value = self.table[slot]
+            if value == key:
+                return slot
+            if value == DELETED and deleted_slot is None:
+                deleted_slot = slot
+            if value == EMPTY:
+                return deleted_slot if deleted_slot is not None else slot
+        return deleted_slot
+
+    def _probe(self, key: int):
+        start = ((int(key) * HASH_MULTIPLIER) & UINT64_MASK) % self.capacity
+        for offset in range(self.capacity):
+            yield (start + offset) % self.capacity
+
+    def _lock(self):
+        return _FileLock(self.file)
+
+
+class _FileLock:
+    def __init__(self, file):
+        self.file = file
+
+    def __enter__(self):
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+
+
+def remove_stale_index_files(collect_date: str, directory: str = SEEN_INDEX_DIR):
+    """
+    이전 수집 일자의 인덱스 파일을 삭제합니다.
+    아직 파일을 열고 있는 프로세스는 삭제 후에도 기존 매핑을 그대로 사용합니다.
+    """
+    for file_name in os.listdir(directory):
+        if not file_name.startswith('seen-') or not file_name.endswith('.bin') or file_name == f"seen-{collect_date}.bin":
+            continue
+        try:
+            os.remove(os.path.join(directory, file_name))
+            logger.info(f"이전 수집 일자의 listing id 인덱스를 삭제했습니다. - {file_name}")
+        except FileNotFoundError:
+            pass  # 다른 프로세스가 먼저 삭제함
+
+
+def _to_key(listing_id) -> int | None:
+    """
+    uint64 로 저장할 수 있는 숫자 id 인 경우에만 key 로 변환 ( 0 과 최대값은 빈 슬롯, 삭제 표시로 사용 )
+    """
+    listing_id = str(listing_id)
+    if not listing_id.isdigit():
+        return None
+    key = int(listing_id)
+    if key == EMPTY or key >= int(DELETED):
+        return None
+    return key
@@ -0,0 +1,131 @@
+from typing import Callable, Dict, List
+from sqlalchemy.dialects.postgresql import insert
+from app.lib.database import session_factory
+from app.lib.entity import Listing
+from app.lib import metrics
+from app.logger import get_logger
+from app.constants import WRITER_MAX_RETRY, WRITER_RETRY_DELAY, MAX_BIND_PARAMETERS
+import asyncio
+import time
+
+
+"""
+writer.py
+listing 행을 모아 두었다가 한번의 multi-row INSERT 로 저장하는 write-behind buffer
+"""
+
+logger = get_logger('app')
+
+
+class ListingWriter:
+    """
+    batch_size 개가 쌓이거나 flush_interval 초가 지나면 저장합니다.
+    이미 저장된 (id, collect_date) 는 ON CONFLICT DO NOTHING 으로 무시합니다.
+    저장에 실패하면 max_retry 번 다시 시도하고, 그래도 실패하면 저장하지 못한 숙소 ID 를 로그로 남깁니다.
+    """
+
+    def __init__(self, batch_size: int, flush_interval: float, on_failed: Callable[[List[Dict]], None] | None = None,
+                 on_flushed: Callable[[List[Dict]], None] | None = None,
+                 max_retry: int = WRITER_MAX_RETRY, retry_delay: float = WRITER_RETRY_DELAY):
+        """
+        :param on_failed: 저장에 실패한 행 리스트를 받는 함수
+        :param on_flushed: 저장에 성공한 행 리스트를 받는 함수
+        """
+        # 한 INSERT 의 bind parameter 개수( 행 개수 * 컬럼 개수 )가 PostgreSQL 한도를 넘지 않도록 제한
+        max_batch_size = MAX_BIND_PARAMETERS // len(Listing.__table__.columns)
+        if batch_size > max_batch_size:
+            logger.warning(f"일괄 저장 개수 {batch_size}개가 bind parameter 한도를 넘으므로 {max_batch_size}개로 제한합니다.")
+            batch_size = max_batch_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_failed = on_failed
+        self.on_flushed = on_flushed
+        self.max_retry = max_retry
+        self.retry_delay = retry_delay
+        self.buffer: List[Dict] = []
+        self.flush_lock = asyncio.Lock()
+        self.flush_task = None
+        self.closing = asyncio.Event()  # 주기적 저장 중단 신호 ( 진행 중인 flush 는 취소하지 않음 )
+
+    async def start(self):
+        self.flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def add(self, row: Dict):
+        self.buffer.append(row)
+        metrics.increase('writer.rows_buffered')
+        if len(self.buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        async with self.flush_lock:
+            rows, self.buffer = self.buffer, []
+            if len(rows) == 0:
+                return
+
+            started_at = time.perf_counter()
+            try:
+                for attempt in range(self.max_retry + 1):
+                    try:
+                        inserted_count = await self._insert(rows)
+                        break
+                    except Exception as e:
+                        if attempt < self.max_retry:
+                            delay = self.retry_delay * 2 ** attempt
+                            metrics.increase('writer.flush_retried')
+                            logger.warning(f"숙소 정보 {len(rows)}건 일괄 저장 실패, {delay}초 후 다시 시도합니다: {e}")
+                            await asyncio.sleep(delay)
+                            continue
+
+                        metrics.increase('writer.rows_failed', len(rows))
+                        logger.error(f"숙소 정보 {len(rows)}건 일괄 저장 실패: {e}", exc_info=True)
+                        logger.error(f"저장하지 못한 숙소 ID: {[row['id'] for row in rows]}")
+                        if self.on_failed is not None:
+                            self.on_failed(rows)
+                        return
+            except asyncio.CancelledError:
+                # 저장 또는 재시도 대기 중에 취소되면 행을 버퍼로 되돌려 다음 flush 에서 저장
+                self.buffer = rows + self.buffer
+                raise
+
+            elapsed = time.perf_counter() - started_at
+            metrics.increase('writer.flush_count')
+            metrics.increase('writer.flush_seconds', elapsed)
+            metrics.increase('writer.rows_inserted', inserted_count)
+            logger.info(f"숙소 정보 일괄 저장 - 요청: {len(rows)}건, 저장: {inserted_count}건, 소요 시간: {elapsed * 1000:.1f}ms")
+            if self.on_flushed is not None:
+                self.on_flushed(rows)
+
+    async def close(self):
+        """
+        주기적 저장을 멈추고 남은 행을 모두 저장합니다.
+        진행 중인 flush 는 취소하지 않고 끝날 때까지 기다립니다.
+        """
+        if self.flush_task is not None:
+            self.closing.set()
+            await self.flush_task
+            self.flush_task = None
+        await self.flush()
+
+        flush_count = metrics.get('writer.flush_count')
+        if flush_count > 0:
+            logger.info(f"숙소 정보 일괄 저장 완료 - 저장: {metrics.get('writer.rows_inserted')}건, "
+                        f"실패: {metrics.get('writer.rows_failed')}건, flush 횟수: {flush_count}, "
+                        f"평균 flush 시간: {metrics.get('writer.flush_seconds') / flush_count * 1000:.1f}ms")
+
+    async def _insert(self, rows: List[Dict]) -> int:
+        """
+        :return: 새로 저장된 행 개수
+        """
+        async with session_factory() as session:
+            async with session.begin():
+                result = await session.execute(
+                    insert(Listing).values(rows).on_conflict_do_nothing(index_elements=['id', 'collect_date'])
+                )
+                return result.rowcount
+
+    async def _flush_periodically(self):
+        while self.closing.is_set() is False:
+            try:
+                await asyncio.wait_for(self.closing.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                await self.flush()
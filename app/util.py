@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-from app.constants import BASE_AFTER_DAYS
+from app.constants import BASE_AFTER_DAYS, MAP_VIEWPORT_WIDTH, MAP_VIEWPORT_HEIGHT, MIN_ZOOM_LEVEL, MAX_ZOOM_LEVEL
+import asyncio
+import math
 
 
 def to_date(date_str, format_str):
@@ -58,3 +60,102 @@ def divide_into_quadrants(ne_lat, ne_lng, sw_lat, sw_lng):
     quadrant_4 = ((center_lat, ne_lng), (sw_lat, center_lng))  # 4사분면
 
     return quadrant_1, quadrant_2, quadrant_3, quadrant_4
+
+
+def calculate_zoom_level(ne_lat, ne_lng, sw_lat, sw_lng, width=MAP_VIEWPORT_WIDTH, height=MAP_VIEWPORT_HEIGHT):
+    """
+    바운딩 박스가 지도 영역(width x height px)에 꼭 맞게 보이는 web mercator zoom 레벨
+    zoom 0 에서 전 세계는 256px 이며, zoom 이 1 오를 때마다 2배가 됩니다.
+    """
+    lng_span = ne_lng - sw_lng if ne_lng >= sw_lng else ne_lng - sw_lng + 360  # 날짜 변경선을 넘는 박스
+    lat_span = _mercator_y(ne_lat) - _mercator_y(sw_lat)
+
+    zoom_lng = math.log2(width * 360 / (256 * lng_span)) if lng_span > 0 else MAX_ZOOM_LEVEL
+    zoom_lat = math.log2(height * 2 * math.pi / (256 * lat_span)) if lat_span > 0 else MAX_ZOOM_LEVEL
+
+    return min(max(min(zoom_lng, zoom_lat), MIN_ZOOM_LEVEL), MAX_ZOOM_LEVEL)
+
+
+def _mercator_y(lat):
+    lat = max(min(lat, 85.05112878), -85.05112878)  # web mercator 위도 한계
+    radian = math.radians(lat)
+    return math.log(math.tan(math.pi / 4 + radian / 2))
+
+
+def is_in_box(coordinate, ne_lat, ne_lng, sw_lat, sw_lng):
+    """
+    :param coordinate: (lat, lng)
+    """
+    lat, lng = coordinate
+    return sw_lat <= lat <= ne_lat and sw_lng <= lng <= ne_lng
+
+
+def divide_into_grid(ne_lat, ne_lng, sw_lat, sw_lng, factor):
+    """
+    바운딩 박스를 factor x factor 개의 동일한 크기의 박스로 분할합니다.
+    :param factor: 한 축을 몇 등분 할 것인지 ex) 2 일 경우 4분면
+    :return: ((ne_lat, ne_lng), (sw_lat, sw_lng)) 리스트 ( 북쪽 행부터, 각 행은 동쪽부터 )
+    """
+    lat_cuts = [ne_lat - (ne_lat - sw_lat) * i / factor for i in range(factor + 1)]
+    lng_cuts = [ne_lng - (ne_lng - sw_lng) * i / factor for i in range(factor + 1)]
+    lat_cuts[-1], lng_cuts[-1] = sw_lat, sw_lng  # 부동소수점 오차로 원래 경계를 벗어나지 않도록 고정
+
+    return [
+        ((lat_cuts[row], lng_cuts[col]), (lat_cuts[row + 1], lng_cuts[col + 1]))
+        for row in range(factor)
+        for col in range(factor)
+    ]
+
+
+def divide_by_density(ne_lat, ne_lng, sw_lat, sw_lng, coordinates, factor):
+    """
+    좌표 분포를 기준으로 바운딩 박스를 factor x factor 개로 분할합니다.
+    위도 분위수로 행을 나누고, 각 행 안에서 경도 분위수로 열을 나누므로 박스마다 비슷한 개수의 좌표가 포함됩니다.
+    :param coordinates: 바운딩 박스 안의 (lat, lng) 리스트
+    :return: ((ne_lat, ne_lng), (sw_lat, sw_lng)) 리스트
+    """
+    result = []
+    lat_cuts = _get_quantile_cuts([coordinate[0] for coordinate in coordinates], ne_lat, sw_lat, factor)
+    for row in range(factor):
+        row_ne_lat, row_sw_lat = lat_cuts[row], lat_cuts[row + 1]
+        row_lngs = [lng for lat, lng in coordinates if row_sw_lat <= lat <= row_ne_lat]
+        lng_cuts = _get_quantile_cuts(row_lngs, ne_lng, sw_lng, factor)
+        for col in range(factor):
+            result.append(((row_ne_lat, lng_cuts[col]), (row_sw_lat, lng_cuts[col + 1])))
+    return result
+
+
+def _get_quantile_cuts(values, high, low, factor):
+    """
+    high 에서 low 방향으로 값을 factor 등분하는 분위수 경계 리스트 ( 양 끝 포함 )
+    분위수 경계가 겹치거나 값이 부족하면 등간격 경계를 사용합니다.
+    """
+    even_cuts = [high - (high - low) * i / factor for i in range(factor + 1)]
+    even_cuts[-1] = low
+    values = sorted((value for value in values if low < value < high), reverse=True)
+    if len(values) < factor:
+        return even_cuts
+
+    cuts = [high]
+    for i in range(1, factor):
+        cuts.append(values[len(values) * i // factor])
+    cuts.append(low)
+
+    if any(cuts[i] <= cuts[i + 1] for i in range(factor)):  # 같은 좌표가 몰려 있어 경계가 겹치는 경우
+        return even_cuts
+    return cuts
+
+
+async def gather_or_cancel(*coroutines):
+    """
+    asyncio.gather 와 같지만, 하나가 실패하면 나머지 task 를 취소하고 끝날 때까지 기다린 뒤 예외를 전달합니다.
+    ( 호출한 쪽의 정리 작업이 아직 실행 중인 task 와 겹치지 않도록 함 )
+    """
+    task_list = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*task_list)
+    except BaseException:
+        for task in task_list:
+            task.cancel()
+        await asyncio.gather(*task_list, return_exceptions=True)
+        raise
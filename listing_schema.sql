@@ -34,7 +34,8 @@ CREATE TABLE public.listing (
     rating double precision,
     review_count integer,
     option_list text,
-    reserved_count integer
+    reserved_count integer,
+    detail_collect_date character varying(255)
 );
 
 
@@ -48,6 +49,63 @@ ALTER TABLE ONLY public.listing
     ADD CONSTRAINT listing_pkey PRIMARY KEY (id, collect_date);
 
 
+--
+-- Name: search_box; Type: TABLE; Schema: public; Owner: air
+--
+
+CREATE TABLE public.search_box (
+    id integer NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+    sido character varying(255) NOT NULL,
+    collect_date character varying(255) NOT NULL,
+    depth integer,
+    ne_lat double precision NOT NULL,
+    ne_lng double precision NOT NULL,
+    sw_lat double precision NOT NULL,
+    sw_lng double precision NOT NULL,
+    status character varying(1),
+    searched_count integer,
+    leased_by character varying(255),
+    leased_at timestamp without time zone
+);
+
+
+ALTER TABLE public.search_box OWNER TO air;
+
+ALTER TABLE ONLY public.search_box
+    ADD CONSTRAINT search_box_pkey PRIMARY KEY (id);
+
+CREATE INDEX ix_search_box_frontier ON public.search_box USING btree (sido, collect_date, status);
+
+
+--
+-- Name: crawl_plan_box; Type: TABLE; Schema: public; Owner: air
+--
+
+CREATE TABLE public.crawl_plan_box (
+    id integer NOT NULL GENERATED BY DEFAULT AS IDENTITY,
+    sido character varying(255) NOT NULL,
+    root_key character varying(255) NOT NULL,
+    collect_date character varying(255) NOT NULL,
+    ne_lat double precision NOT NULL,
+    ne_lng double precision NOT NULL,
+    sw_lat double precision NOT NULL,
+    sw_lng double precision NOT NULL,
+    parent_ne_lat double precision,
+    parent_ne_lng double precision,
+    parent_sw_lat double precision,
+    parent_sw_lng double precision,
+    searched_count integer
+);
+
+
+ALTER TABLE public.crawl_plan_box OWNER TO air;
+
+ALTER TABLE ONLY public.crawl_plan_box
+    ADD CONSTRAINT crawl_plan_box_pkey PRIMARY KEY (id);
+
+CREATE INDEX ix_crawl_plan_box_root ON public.crawl_plan_box USING btree (sido, root_key);
+
+
 --
 -- PostgreSQL database dump complete
 --
@@ -1,8 +1,11 @@
-from typing import Dict
+from typing import Dict, List
 from asyncio import new_event_loop, set_event_loop
 from app.lib.entity import create_tables
-from app.core.list import collect_listing, ListingListRequest
+from app.lib.database import async_engine
+from app.core.list import collect_listing, ListingListRequest, CollectOption
+from app.core.batch import load_job_list, collect_region_list
 from app.logger import get_logger, init_logger
+from app.constants import BLOCKED_RESOURCE_LIST
 import argparse
 import json
 
@@ -11,7 +14,7 @@ init_logger()  # logger 초기화
 logger = get_logger('app')
 
 
-async def collect(request: Dict):
+async def collect(request: Dict, option: CollectOption):
     try:
         logger.info('숙박 정보 저장용 테이블 생성 시작')
         await create_tables()  # 숙박 정보 저장용 table 생성
@@ -26,24 +29,132 @@ async def collect(request: Dict):
             sw_lat=float(request['sw_lat']),
             sw_lng=float(request['sw_lng']),
             country=request['country']
-        ))
+        ), option)
         logger.info('숙박 정보 수집 완료')
     except Exception as e:
         logger.error(f"숙박 정보 수집 중 에러 발생: {e}", exc_info=True)
+    finally:
+        await async_engine.dispose()  # 수집이 모두 끝난 뒤 DB 연결 정리
+
+
+async def collect_batch(job_path: str, country: str, option: CollectOption, region_concurrency: int):
+    try:
+        logger.info('숙박 정보 저장용 테이블 생성 시작')
+        await create_tables()  # 숙박 정보 저장용 table 생성
+        logger.info('숙박 정보 저장용 테이블 생성 완료')
+
+        logger.info(f"여러 지역 숙박 정보 수집 시작 - job 파일: {job_path}")
+        await collect_region_list(load_job_list(job_path, country), option, region_concurrency)
+        logger.info('여러 지역 숙박 정보 수집 완료')
+    except Exception as e:
+        logger.error(f"여러 지역 숙박 정보 수집 중 에러 발생: {e}", exc_info=True)
+    finally:
+        await async_engine.dispose()  # 모든 지역이 같은 engine 을 공유하므로 batch 가 끝난 뒤 정리
+
+
+def parse_block_resources(value: str | None) -> List[str] | None:
+    """
+    --block-resources 값 ( 'none' 이면 차단하지 않고 측정만 )
+    """
+    if value is None:
+        return None
+    if value == 'none':
+        return []
+    return [resource.strip() for resource in value.split(',') if resource.strip()]
 
 
 if __name__ == '__main__':
     """
     python main.py --request '{"country": "your_country", "sido": "your_sido", "ne_lat": "your_ne_lat",
      "ne_lng": "your_ne_lng", "sw_lat": "your_sw_lat", "sw_lng": "your_sw_lng"}'
+    python main.py --jobs jobs.json --region-concurrency 2
     """
     parser = argparse.ArgumentParser(description="Process command line arguments.")
-    parser.add_argument("--request", required=True, help="request dict as a json string")
+    target_group = parser.add_mutually_exclusive_group(required=True)
+    target_group.add_argument("--request", help="request dict as a json string")
+    target_group.add_argument("--jobs", help="json list of requests with an optional priority, or a geojson file")
+    parser.add_argument("--region-concurrency", type=int, default=1,
+                        help="number of regions from --jobs collected at once on a shared browser, "
+                             "splitting the --concurrency and --detail-concurrency pages between them")
+    parser.add_argument("--country", default="대한민국", help="country of --jobs regions that do not specify one")
+    parser.add_argument("--concurrency", type=int, default=1, help="number of pages crawling bounding boxes at once")
+    parser.add_argument("--frontier", action="store_true",
+                        help="lease bounding boxes from the frontier table (resumable, shareable across workers)")
+    parser.add_argument("--early-divide", action="store_true",
+                        help="divide dense boxes right after the first result page, only leaf boxes are fully paged")
+    parser.add_argument("--adaptive-split", action="store_true",
+                        help="choose the grid size from the searched count and cut along historical listing density")
+    parser.add_argument("--plan", action="store_true",
+                        help="start from the leaf boxes saved by the previous run and save this run's leaf boxes")
+    parser.add_argument("--prune-region", action="store_true",
+                        help="skip boxes and listings outside the region polygon from the bundled geojson")
+    parser.add_argument("--region-name", default=None,
+                        help="geojson feature name of the region, defaults to sido (ex. kulsgr)")
+    parser.add_argument("--detail-concurrency", type=int, default=0,
+                        help="number of pages fetching listing details from a queue, 0 fetches inline")
+    parser.add_argument("--write-batch-size", type=int, default=0,
+                        help="buffer listing rows and insert them in batches of this size, 0 saves one by one")
+    parser.add_argument("--preload", action="store_true",
+                        help="load listing ids already collected today for the sido before crawling")
+    parser.add_argument("--seen-index", action="store_true",
+                        help="keep collected listing ids in a memory-mapped file shared by processes on this host")
+    parser.add_argument("--api-pagination", action="store_true",
+                        help="request result pages 3-15 directly through the StaysSearch API instead of clicking next")
+    parser.add_argument("--http-detail-concurrency", type=int, default=0,
+                        help="fetch listing pages over plain HTTP with this many requests at once, "
+                             "falling back to the browser when the embedded data is missing, 0 uses the browser only")
+    parser.add_argument("--block-resources", nargs="?", default=None, const=','.join(BLOCKED_RESOURCE_LIST),
+                        help="abort these resource types on crawl pages, comma separated "
+                             f"(default {','.join(BLOCKED_RESOURCE_LIST)}), 'none' only measures loaded bytes")
+
+    parser.add_argument("--headless", action="store_true", help="run the browser without a window (linux servers)")
+    parser.add_argument("--max-navigations", type=int, default=0,
+                        help="recycle a pooled page's browser context after this many navigations, 0 never recycles")
+    parser.add_argument("--max-rss-mb", type=int, default=0,
+                        help="recycle returned pages' browser contexts while the browser RSS exceeds this many MB, "
+                             "0 never recycles")
+    parser.add_argument("--browser-endpoint", default=None,
+                        help="connect to a browser started by script/browser_server.py (ex. http://127.0.0.1:9222) "
+                             "instead of launching one")
+    parser.add_argument("--time-budget", type=int, default=0,
+                        help="minutes to crawl, visiting boxes with the most expected refreshed listings per second "
+                             "first and stopping at the deadline with a coverage report, 0 crawls until done")
+    parser.add_argument("--refresh-ttl", type=int, default=0,
+                        help="days to reuse the previous detail snapshot of listings whose search rating and review "
+                             "count are unchanged, skipping their detail page, 0 scrapes every listing")
+    parser.add_argument("--parser-processes", type=int, default=0,
+                        help="number of worker processes parsing search and detail HTML off the event loop, "
+                             "0 parses inline")
 
     args = parser.parse_args()
-    request = json.loads(args.request)
+    option = CollectOption(
+        concurrency=args.concurrency,
+        frontier=args.frontier,
+        early_divide=args.early_divide,
+        adaptive_split=args.adaptive_split,
+        plan=args.plan,
+        prune_region=args.prune_region,
+        region_name=args.region_name,
+        detail_concurrency=args.detail_concurrency,
+        write_batch_size=args.write_batch_size,
+        preload=args.preload,
+        seen_index=args.seen_index,
+        api_pagination=args.api_pagination,
+        http_detail_concurrency=args.http_detail_concurrency,
+        block_resources=parse_block_resources(args.block_resources),
+        headless=args.headless,
+        max_navigations=args.max_navigations,
+        max_rss_mb=args.max_rss_mb,
+        browser_endpoint=args.browser_endpoint,
+        time_budget=args.time_budget,
+        refresh_ttl=args.refresh_ttl,
+        parser_processes=args.parser_processes
+    )
 
     loop = new_event_loop()
     set_event_loop(loop)
-    loop.run_until_complete(collect(request))
+    if args.jobs is not None:
+        loop.run_until_complete(collect_batch(args.jobs, args.country, option, args.region_concurrency))
+    else:
+        loop.run_until_complete(collect(json.loads(args.request), option))
     loop.close()
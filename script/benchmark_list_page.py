@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import re
+import timeit
+from bs4 import BeautifulSoup
+from config import parent_dir  # 상위 디렉터리를 sys.path 에 추가
+from app.core.list import extract_listing_page, extract_listing_list_from_stays_search
+
+"""
+검색 페이지 추출 micro-benchmark
+DOM 트리를 만드는 기존 방식 ( BeautifulSoup 으로 2번 파싱 ) 과 HTML 을 한번 훑는 방식의 시간을 비교합니다.
+실제 검색 페이지 크기 ( 수 MB ) 에 맞추도록 기록된 검색 페이지에 숙소 카드 markup 을 덧붙입니다.
+python ./script/benchmark_list_page.py --size-mb 2
+"""
+
+SEARCH_PAGE_PATH = os.path.join(parent_dir, 'tests', 'core', 'data', 'search_page.html')
+
+
+def extract_with_soup(html: str):
+    """
+    기존 방식: 숙소 리스트와 헤더의 검색 개수를 각각 BeautifulSoup 트리로 파싱
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    json_data = json.loads(soup.find('script', {'id': 'data-deferred-state-0'}).text)
+    stays_search = json_data['niobeMinimalClientData'][0][1]['data']['presentation']['staysSearch']
+    listing_list = extract_listing_list_from_stays_search(stays_search)
+
+    heading = BeautifulSoup(html, 'html.parser').find(attrs={'data-testid': 'stays-page-heading'})
+    searched_count = int(''.join(re.findall(r'\d+', heading.get_text().replace(',', ''))))
+    return listing_list, searched_count
+
+
+def inflate(html: str, size_mb: float) -> str:
+    """
+    숙소 카드 영역을 반복하여 size_mb 크기의 페이지를 만듭니다.
+    """
+    start = html.index('<div class="gsgwcjk">')
+    end = html.index('</main>')
+    cards = html[start:end]
+    repeat = max(int(size_mb * 1024 * 1024 / len(cards.encode('utf-8'))), 1)
+    return html[:end] + cards * repeat + html[end:]
+
+
+def main(size_mb: float, number: int):
+    with open(SEARCH_PAGE_PATH, encoding='utf-8') as page_file:
+        html = inflate(page_file.read(), size_mb)
+
+    soup_listing_list, soup_count = extract_with_soup(html)
+    scan_listing_list, scan_count = extract_listing_page(html)
+    assert set(soup_listing_list) == set(scan_listing_list) and soup_count == scan_count, '두 방식의 추출 결과가 다름'
+
+    page_mb = len(html.encode('utf-8')) / 1024 / 1024
+    soup_seconds = timeit.timeit(lambda: extract_with_soup(html), number=number) / number
+    scan_seconds = timeit.timeit(lambda: extract_listing_page(html), number=number) / number
+    print(f"페이지 크기: {page_mb:.2f}MB, 숙소: {len(scan_listing_list)}개, 검색 개수: {scan_count}")
+    print(f"BeautifulSoup 2회 파싱: {soup_seconds * 1000:.1f}ms")
+    print(f"한번 훑기:              {scan_seconds * 1000:.1f}ms ( {soup_seconds / scan_seconds:.0f}배 )")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compare tree-based and single-pass search page extraction.")
+    parser.add_argument("--size-mb", type=float, default=2, help="size of the inflated search page in MB")
+    parser.add_argument("--number", type=int, default=5, help="number of runs to average")
+    args = parser.parse_args()
+    main(args.size_mb, args.number)
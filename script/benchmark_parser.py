@@ -0,0 +1,217 @@
+import argparse
+import json
+import logging
+import os
+import platform
+import re
+import sys
+import timeit
+from bs4 import BeautifulSoup
+from config import parent_dir  # 상위 디렉터리를 sys.path 에 추가
+from app.config import HTML_PARSER
+from app.core.list import extract_listing_list, extract_listing_list_for_next_page, get_searched_listing_total_count
+from app.core.detail import _extract_listing_info, _extract_foreigner_review_count
+
+"""
+기록된 에어비앤비 페이지 ( tests/core/data ) 로 추출 함수의 페이지 당, MB 당 시간을 측정합니다.
+기록된 페이지는 추출에 필요한 부분만 남기고 익명화한 것이므로, 측정 전에 실제 페이지와 비슷한 크기로 늘립니다.
+( 추출과 관계없는 markup, 스크립트, 사진 정보, 리뷰를 덧붙이며 검색 결과와 상세 정보의 추출 결과는 같음 )
+
+기계마다 속도가 다르므로, 같은 실행에서 측정한 기준 작업 ( BeautifulSoup 파싱, json 파싱, 정규식 ) 시간에 대한
+상대 시간으로 기준값과 비교합니다. 같은 기계에서 반복 측정한 상대 시간의 차이는 보통 10% 이내이므로 기본 허용치는 25% 입니다.
+--output 으로 측정 결과를 기준값(JSON)으로 저장하고, --baseline 으로 기준값과 비교하여 느려진 항목이 있으면 1 로 종료합니다.
+python ./script/benchmark_parser.py --output ./script/benchmark_baseline.json
+python ./script/benchmark_parser.py --baseline ./script/benchmark_baseline.json --tolerance 0.25
+"""
+
+DATA_DIR = os.path.join(parent_dir, 'tests', 'core', 'data')
+BASE_DATE = '2024-05-01'  # 기록된 상세 페이지의 달력 기준 날짜
+
+# 측정에 사용할 페이지 크기(KB) ( 에어비앤비 검색, 상세 페이지는 대부분 inline 스크립트와 스타일 )
+PAGE_SIZE_KB = {
+    'search_page.html': 1536,
+    'stays_search.json': 400,
+    'rooms_banner.html': 900,
+    'rooms_heading.html': 900,
+    'reviews.json': 64  # 리뷰 약 150개
+}
+
+FILLER_MARKUP = (
+    '<div class="c1l1h97y dir dir-ltr"><div class="g1qv1ctd atm_u80d3j_1li1fea dir dir-ltr">'
+    '<span class="t1jojoys atm_g3ik46_1bnbyu5">숙소 추천</span><div class="_1a8f9sh">'
+    '<svg viewBox="0 0 32 32" aria-hidden="true" style="display:block;height:24px;width:24px;fill:currentcolor">'
+    '<path d="M16 1c8.2 0 15 6.8 15 15s-6.8 15-15 15S1 24.2 1 16 7.8 1 16 1z"></path></svg></div>'
+    '<button type="button" class="l1ovpqvx atm_1he2i46_1k8pnbi dir dir-ltr" aria-label="위시리스트에 저장">'
+    '<span class="_14tkmhr">저장</span></button></div></div>\n'
+)
+FILLER_SCRIPT = (
+    '<script>(self.__LOADABLE_LOADED_CHUNKS__=self.__LOADABLE_LOADED_CHUNKS__||[]).push([[4171],{'
+    + ','.join(f'"{chunk}":function(e,t,n){{"use strict";n.d(t,{{A:function(){{return r}}}});var r=n({chunk})}}'
+               for chunk in range(40000, 40040))
+    + '}]);</script>\n'
+)
+FILLER_PICTURE = {
+    '__typename': 'ContextualPicture',
+    'id': '1234567890',
+    'picture': 'https://a0.muscache.com/im/pictures/miso/Hosting-1000000000000000000/original/00000000-0000-0000.jpeg',
+    'caption': {'kind': 'REGULAR', 'messages': ['게스트 선호']}
+}
+
+
+def inflate_html(text: str, size_bytes: int) -> str:
+    """
+    <body> 바로 뒤에 추출과 관계없는 markup 과 inline 스크립트를 넣습니다.
+    """
+    block = FILLER_MARKUP * 8 + FILLER_SCRIPT
+    repeat = max((size_bytes - len(text.encode('utf-8'))) // len(block.encode('utf-8')), 0)
+    index = text.index('<body>') + len('<body>')
+    return text[:index] + block * repeat + text[index:]
+
+
+def inflate_stays_search(text: str, size_bytes: int) -> str:
+    """
+    검색 결과마다 사진 정보를 덧붙입니다. ( 숙소 ID, 좌표, 평점은 그대로 )
+    """
+    data = json.loads(text)
+    stays_search = data['data']['presentation']['staysSearch']
+    result_list = stays_search['results']['searchResults'] + stays_search['mapResults']['mapSearchResults']
+    picture_size = len(json.dumps(FILLER_PICTURE, ensure_ascii=False).encode('utf-8'))
+    picture_count = max((size_bytes - len(text.encode('utf-8'))) // picture_size // len(result_list), 0)
+    for search_result in result_list:
+        search_result['contextualPictures'] = [FILLER_PICTURE] * picture_count
+    return json.dumps(data, ensure_ascii=False)
+
+
+def inflate_review_list(text: str, size_bytes: int) -> str:
+    """
+    기록된 리뷰를 반복하여 리뷰가 많은 숙소의 모든 리뷰 목록을 만듭니다.
+    """
+    review_list = json.loads(text)
+    repeat = max(size_bytes // len(text.encode('utf-8')), 1)
+    return json.dumps(review_list * repeat, ensure_ascii=False)
+
+
+def _extract_listing_list_from_response(text: str):
+    """
+    StaysSearch 응답 본문의 json 파싱부터 측정
+    """
+    return extract_listing_list_for_next_page(json.loads(text))
+
+
+def _extract_foreigner_review_count_from_response(text: str):
+    return _extract_foreigner_review_count(json.loads(text))
+
+
+# (측정 이름, 함수, 기록된 파일, 파일 내용을 함수 인자로 바꾸는 함수, 측정 크기로 늘리는 함수)
+BENCHMARK_LIST = [
+    ('extract_listing_list', extract_listing_list, 'search_page.html', lambda text: (text,), inflate_html),
+    ('get_searched_listing_total_count', get_searched_listing_total_count, 'search_page.html', lambda text: (text,),
+     inflate_html),
+    ('extract_listing_list_for_next_page', _extract_listing_list_from_response, 'stays_search.json',
+     lambda text: (text,), inflate_stays_search),
+    ('_extract_listing_info', _extract_listing_info, 'rooms_banner.html', lambda text: (text, BASE_DATE), inflate_html),
+    ('_extract_listing_info', _extract_listing_info, 'rooms_heading.html', lambda text: (text, BASE_DATE), inflate_html),
+    ('_extract_foreigner_review_count', _extract_foreigner_review_count_from_response, 'reviews.json',
+     lambda text: (text,), inflate_review_list)
+]
+
+
+def measure(func, args, min_seconds: float) -> float:
+    """
+    :return: 한번 실행하는 데 걸린 시간(초) 중 가장 빠른 측정 ( 다른 부하 제외 )
+    """
+    timer = timeit.Timer(lambda: func(*args))
+    number, _ = timer.autorange()  # 한번 측정에 0.2초 이상 걸리는 반복 횟수
+    repeat = max(int(min_seconds / 0.2), 1)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_reference_workload():
+    """
+    기계 속도의 기준이 되는 작업 ( 추출 코드와 관계없이 항상 같음 )
+    """
+    html = ''.join(f'<div class="c{index}"><span data-id="{index}">숙소 {index}</span></div>' for index in range(2000))
+    BeautifulSoup(html, 'html.parser').find_all('span')
+    json.loads(json.dumps([{'id': index, 'title': f'숙소 {index}'} for index in range(2000)]))
+    len(re.findall(r'data-id="(\d+)"', html))
+
+
+def run(min_seconds: float) -> dict:
+    reference_seconds = measure(run_reference_workload, (), min_seconds)
+    results = {}
+    for name, func, file_name, to_args, inflate in BENCHMARK_LIST:
+        with open(os.path.join(DATA_DIR, file_name), encoding='utf-8') as data_file:
+            recorded_text = data_file.read()
+        text = inflate(recorded_text, PAGE_SIZE_KB[file_name] * 1024)
+        if inflate is not inflate_review_list:
+            assert func(*to_args(text)) == func(*to_args(recorded_text)), f"{file_name} 를 늘린 뒤 추출 결과가 다름"
+
+        size_mb = len(text.encode('utf-8')) / 1024 / 1024
+        seconds_per_page = measure(func, to_args(text), min_seconds)
+        results[f"{name}/{file_name}"] = {
+            'size_bytes': len(text.encode('utf-8')),
+            'ms_per_page': round(seconds_per_page * 1000, 4),
+            'ms_per_mb': round(seconds_per_page * 1000 / size_mb, 4),
+            'relative': round(seconds_per_page / reference_seconds, 4)  # 기준 작업 대비 시간
+        }
+    return {'reference_ms': round(reference_seconds * 1000, 4), 'results': results}
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """
+    기준 작업 대비 시간( relative )으로 비교하여 기계 속도의 차이를 제외합니다.
+    :return: 모든 항목이 기준값 * (1 + tolerance) 이하이면 True
+    """
+    is_passed = True
+    for key, result in results.items():
+        base = baseline['results'].get(key)
+        if base is None or 'relative' not in base:
+            print(f"{key:<60} {result['ms_per_page']:>10.3f}ms  ( 기준값 없음 )")
+            continue
+        ratio = result['relative'] / base['relative']
+        is_slower = ratio > 1 + tolerance
+        is_passed = is_passed and not is_slower
+        print(f"{key:<60} {result['ms_per_page']:>10.3f}ms  기준 작업 대비 {result['relative']:>8.3f}  "
+              f"기준값 {base['relative']:>8.3f}  x{ratio:.2f}{'  느려짐' if is_slower else ''}")
+    return is_passed
+
+
+def main(output: str | None, baseline_path: str | None, tolerance: float, min_seconds: float):
+    logging.disable(logging.CRITICAL)  # 추출 실패 로그 ( 기록된 페이지의 건너뛰는 옵션 등 ) 출력 시간은 측정에서 제외
+    measurement = run(min_seconds)
+    results = measurement['results']
+    report = {
+        'environment': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'html_parser': HTML_PARSER,
+            'reference_ms': measurement['reference_ms']
+        },
+        'results': results
+    }
+
+    if output is not None:
+        with open(output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2, ensure_ascii=False)
+            output_file.write('\n')
+
+    if baseline_path is None:
+        for key, result in results.items():
+            print(f"{key:<60} {result['ms_per_page']:>10.3f}ms/page {result['ms_per_mb']:>10.3f}ms/MB")
+        return
+
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+    if compare(results, baseline, tolerance) is False:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Time the search and detail extractors over recorded Airbnb pages.")
+    parser.add_argument("--output", help="write the results as a JSON baseline to this path")
+    parser.add_argument("--baseline", help="compare against this JSON baseline and exit 1 on a regression")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown of the time relative to the reference workload over the baseline")
+    parser.add_argument("--min-seconds", type=float, default=1.0, help="minimum time spent measuring each extractor")
+    args = parser.parse_args()
+    main(args.output, args.baseline, args.tolerance, args.min_seconds)
@@ -0,0 +1,31 @@
+import argparse
+import asyncio
+from config import parent_dir  # 상위 디렉터리를 sys.path 에 추가
+from playwright.async_api import async_playwright
+from app.config import CHROME_PATH
+from app.constants import BROWSER_SERVER_PORT
+from app.lib.browser import serve_browser
+from app.logger import init_logger
+
+"""
+수집 실행(main.py --browser-endpoint)들이 연결하여 사용하는 브라우저 서버를 띄워 둡니다.
+python ./script/browser_server.py --headless
+"""
+
+
+async def main(port: int, headless: bool):
+    async with async_playwright() as playwright:
+        await serve_browser(playwright, port, headless, CHROME_PATH or None)
+
+
+if __name__ == '__main__':
+    init_logger()
+    parser = argparse.ArgumentParser(description="Keep a browser running for collector runs to connect to.")
+    parser.add_argument("--port", type=int, default=BROWSER_SERVER_PORT, help="remote debugging (CDP) port")
+    parser.add_argument("--headless", action="store_true", help="run the browser without a window")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.port, args.headless))
+    except KeyboardInterrupt:
+        pass
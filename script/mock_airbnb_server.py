@@ -0,0 +1,41 @@
+import argparse
+from config import parent_dir  # 상위 디렉터리를 sys.path 에 추가
+from app.constants import MOCK_SERVER_PORT
+from app.lib.mock_airbnb import MockAirbnb, MockAirbnbServer, load_density_map
+from app.logger import init_logger, get_logger
+
+"""
+부하 테스트용 로컬 에어비앤비 서버를 띄웁니다. 수집기는 AIRBNB_BASE_URL 로 이 서버를 지정합니다.
+python ./script/mock_airbnb_server.py --port 8080 --latency-ms 300 --jitter-ms 200
+AIRBNB_BASE_URL=http://127.0.0.1:8080 python main.py --request '{...}' --concurrency 4
+"""
+
+logger = get_logger('app')
+
+
+def main(host: str, port: int, density_map_path: str | None, latency_ms: int, jitter_ms: int):
+    mock = MockAirbnb.from_density_map(load_density_map(density_map_path), latency_ms / 1000, jitter_ms / 1000)
+    server = MockAirbnbServer((host, port), mock)
+    logger.info(f"mock 에어비앤비 서버 시작 - 주소: {server.base_url}, 숙소: {len(mock.listing_list)}개")
+    print(f"AIRBNB_BASE_URL={server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"mock 에어비앤비 서버 종료 - 처리한 요청: {dict(mock.request_counter)}")
+
+
+if __name__ == '__main__':
+    init_logger()
+    parser = argparse.ArgumentParser(description="Serve synthetic Airbnb search, StaysSearch, listing and review "
+                                                 "responses for offline load tests.")
+    parser.add_argument("--host", default='127.0.0.1', help="address to bind")
+    parser.add_argument("--port", type=int, default=MOCK_SERVER_PORT, help="port to bind")
+    parser.add_argument("--density-map", help="JSON file with a seed and cells of {sw_lat, sw_lng, ne_lat, ne_lng, "
+                                              "count}, defaults to a built-in Daejeon map")
+    parser.add_argument("--latency-ms", type=int, default=0, help="delay added to every response")
+    parser.add_argument("--jitter-ms", type=int, default=0, help="random extra delay of up to this many ms")
+    args = parser.parse_args()
+    main(args.host, args.port, args.density_map, args.latency_ms, args.jitter_ms)
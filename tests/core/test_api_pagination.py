@@ -0,0 +1,125 @@
+import json
+import os
+import pytest
+from app.core import list as list_module
+from app.core.list import request_listing_list_data_by_cursor, extract_page_cursors, \
+    fetch_remaining_listing_list_by_api, extract_listing_list_for_next_page
+from app.lib.model import ListingId
+from tests.fakes import FakePage, FakeResponse, FakeRequestContext
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+STAYS_SEARCH_URL = 'https://www.airbnb.co.kr/api/v3/StaysSearch/abc?operationName=StaysSearch'
+
+
+def _read_stays_search():
+    with open(os.path.join(DATA_DIR, 'stays_search.json'), encoding='utf-8') as data_file:
+        return json.load(data_file)
+
+
+def _create_capture_request(page_cursors=None):
+    body = {
+        'operationName': 'StaysSearch',
+        'variables': {
+            'staysSearchRequest': {'cursor': 'eyJwIjoxfQ==', 'requestedPageType': 'STAYS_SEARCH'},
+            'staysMapSearchRequestV2': {'cursor': 'eyJwIjoxfQ==', 'requestedPageType': 'STAYS_SEARCH'}
+        }
+    }
+    capture_request = {
+        'url': STAYS_SEARCH_URL,
+        'headers': {'Content-Type': 'application/json', 'Content-Length': '120', 'Cookie': 'bev=1',
+                    'X-Airbnb-Api-Key': 'key'},
+        'post_data': json.dumps(body)
+    }
+    if page_cursors is not None:
+        capture_request['page_cursors'] = page_cursors
+    return capture_request
+
+
+def create_stays_search_page(responses):
+    """
+    page.request 로 보낸 StaysSearch 요청에 cursor 별로 지정한 응답을 반환하는 page
+    """
+    def respond(method, url, data):
+        return responses[json.loads(data)['variables']['staysSearchRequest']['cursor']]
+
+    return FakePage(FakeRequestContext(respond))
+
+
+def _posted(page):
+    return [(url, headers, json.loads(data)) for method, url, headers, data in page.request.requested]
+
+
+def test_extract_page_cursors():
+    assert extract_page_cursors(_read_stays_search()) == ['eyJwIjoxfQ==', 'eyJwIjoyfQ==', 'eyJwIjozfQ==']
+    assert extract_page_cursors({'data': {}}) == []
+    assert extract_page_cursors(None) == []
+
+
+@pytest.mark.asyncio
+async def test_request_listing_list_data_by_cursor_replaces_cursor():
+    stays_search = _read_stays_search()
+    page = create_stays_search_page({'eyJwIjozfQ==': FakeResponse(stays_search)})
+
+    data = await request_listing_list_data_by_cursor(page, _create_capture_request(), 'eyJwIjozfQ==')
+
+    assert data == stays_search
+    url, headers, body = _posted(page)[0]
+    assert url == STAYS_SEARCH_URL
+    # 다시 계산되거나 page.request 가 채우는 헤더는 제외
+    assert headers == {'Content-Type': 'application/json', 'X-Airbnb-Api-Key': 'key'}
+    assert body['variables']['staysSearchRequest']['cursor'] == 'eyJwIjozfQ=='
+    assert body['variables']['staysMapSearchRequestV2']['cursor'] == 'eyJwIjozfQ=='
+    assert body['variables']['staysSearchRequest']['requestedPageType'] == 'STAYS_SEARCH'
+
+
+@pytest.mark.asyncio
+async def test_request_listing_list_data_by_cursor_returns_none_on_error():
+    page = create_stays_search_page({'eyJwIjozfQ==': FakeResponse({}, status=429)})
+
+    assert await request_listing_list_data_by_cursor(page, _create_capture_request(), 'eyJwIjozfQ==') is None
+    assert await request_listing_list_data_by_cursor(page, {'url': STAYS_SEARCH_URL}, 'eyJwIjozfQ==') is None
+
+
+def _fake_next_page(listing_list, capture_request_data):
+    async def fetch_listing_list_next_page(page, capture_request=None):
+        if capture_request is not None:
+            capture_request.update(capture_request_data)
+        return listing_list
+
+    return fetch_listing_list_next_page
+
+
+@pytest.mark.asyncio
+async def test_fetch_remaining_listing_list_by_api_requests_from_third_page(monkeypatch):
+    second_page = [ListingId('2-1', (37.5, 127.0))]
+    page_cursors = [f"cursor-{page_num}" for page_num in range(1, 16)]
+    monkeypatch.setattr(list_module, 'fetch_listing_list_next_page',
+                        _fake_next_page(second_page, _create_capture_request(page_cursors)))
+    stays_search = _read_stays_search()
+    page = create_stays_search_page({cursor: FakeResponse(stays_search) for cursor in page_cursors})
+
+    listing_list, is_completed = await fetch_remaining_listing_list_by_api(page)
+
+    assert is_completed is True
+    # pageCursors[i] 는 i + 1 페이지의 cursor 이므로 3 ~ 15 페이지만 요청
+    assert sorted(body['variables']['staysSearchRequest']['cursor'] for _, _, body in _posted(page)) == \
+        sorted(page_cursors[2:])
+    assert set(listing_list) == set(second_page) | set(extract_listing_list_for_next_page(stays_search))
+
+
+@pytest.mark.asyncio
+async def test_fetch_remaining_listing_list_by_api_without_capture(monkeypatch):
+    second_page = [ListingId('2-1', (37.5, 127.0))]
+    monkeypatch.setattr(list_module, 'fetch_listing_list_next_page', _fake_next_page(second_page, {}))
+    page = create_stays_search_page({})
+
+    # 요청 정보를 캡처하지 못하면 2페이지까지만 수집하고 버튼 클릭으로 이어서 수집
+    assert await fetch_remaining_listing_list_by_api(page) == (second_page, False)
+    assert page.request.requested == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_remaining_listing_list_by_api_without_next_page(monkeypatch):
+    monkeypatch.setattr(list_module, 'fetch_listing_list_next_page', _fake_next_page(None, {}))
+
+    assert await fetch_remaining_listing_list_by_api(create_stays_search_page({})) == ([], True)
@@ -0,0 +1,46 @@
+import json
+from app.core.batch import load_job_list, split_page_option
+from app.lib.model import CollectOption
+
+
+def test_load_job_list(tmp_path):
+    job_path = tmp_path / 'jobs.json'
+    job_path.write_text(json.dumps([
+        {"country": "대한민국", "sido": "대전광역시", "ne_lat": "36.50", "ne_lng": "127.56",
+         "sw_lat": "36.18", "sw_lng": "127.24"},
+        {"sido": "서울특별시", "ne_lat": 37.701, "ne_lng": 127.176, "sw_lat": 37.432, "sw_lng": 126.772, "priority": 2,
+         "region_name": "서울"}
+    ]), encoding='utf-8')
+
+    job_list = load_job_list(str(job_path), '대한민국')
+
+    assert [job.request.sido for job in job_list] == ['대전광역시', '서울특별시']
+    assert [job.priority for job in job_list] == [0, 2]
+    assert job_list[0].request.ne_lat == 36.50
+    assert job_list[1].request.country == '대한민국'
+    assert [job.region_name for job in job_list] == [None, '서울']
+
+
+def test_load_job_list_from_geojson(tmp_path):
+    job_path = tmp_path / 'region.geojson'
+    job_path.write_text(json.dumps({'type': 'FeatureCollection', 'features': [{
+        'type': 'Feature',
+        'properties': {'CTP_KOR_NM': '세종특별자치시'},
+        'geometry': {'type': 'Polygon', 'coordinates': [[[127.0, 36.4], [127.4, 36.4], [127.4, 36.7], [127.0, 36.4]]]}
+    }]}), encoding='utf-8')
+
+    job_list = load_job_list(str(job_path), '대한민국')
+
+    request = job_list[0].request
+    assert request.sido == '세종특별자치시'
+    assert (request.ne_lat, request.ne_lng, request.sw_lat, request.sw_lng) == (36.7, 127.4, 36.4, 127.0)
+
+
+def test_split_page_option():
+    option = CollectOption(concurrency=4, detail_concurrency=2, region_name='kulsgr')
+
+    region_option = split_page_option(option, 2)
+
+    assert (region_option.concurrency, region_option.detail_concurrency) == (2, 1)
+    assert split_page_option(option, 4).detail_concurrency == 1  # 지역 당 최소 1개
+    assert split_page_option(CollectOption(concurrency=4), 3).detail_concurrency == 0  # 상세 정보는 그대로 바로 수집
@@ -0,0 +1,169 @@
+import asyncio
+import pytest
+from app.core import list as list_module
+from app.core.list import get_listing_list, collect_box_listing, finish_search_box
+from app.core.pipeline import DetailBatch
+from app.core.context import CrawlContext
+from app.core.split import BoxSplitter
+from app.lib.model import ListingListRequest, ListingId, CollectOption, FrontierBox
+from app.constants import DIVIDE_THRESHOLD
+
+REQUEST = ListingListRequest(sido='테스트', ne_lat=37.7, ne_lng=127.2, sw_lat=37.4, sw_lng=126.8)
+
+
+class FakeSearch:
+    """
+    검색 페이지 대신 페이지 마다 18개의 숙소를 반환하고, 요청된 페이지 번호를 기록합니다.
+    """
+
+    def __init__(self, searched_count: int, page_count: int):
+        self.searched_count = searched_count
+        self.page_count = page_count
+        self.fetched_pages = []
+
+    def _listing_list(self, page_num: int):
+        return [ListingId(f"{page_num}-{index}", (37.5, 127.0)) for index in range(18)]
+
+    async def fetch_listing_page(self, page, request):
+        self.fetched_pages.append(1)
+        return self._listing_list(1), self.searched_count
+
+    async def fetch_listing_list_next_page(self, page):
+        page_num = len(self.fetched_pages) + 1
+        if page_num > self.page_count:
+            return None
+        self.fetched_pages.append(page_num)
+        return self._listing_list(page_num)
+
+
+@pytest.fixture()
+def fake_search(monkeypatch):
+    def install(searched_count: int, page_count: int = 15) -> FakeSearch:
+        search = FakeSearch(searched_count, page_count)
+        monkeypatch.setattr(list_module, 'fetch_listing_page', search.fetch_listing_page)
+        monkeypatch.setattr(list_module, 'fetch_listing_list_next_page', search.fetch_listing_list_next_page)
+        return search
+
+    original_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, 'sleep', lambda delay: original_sleep(0))  # page 마다 딜레이 제외
+    return install
+
+
+@pytest.fixture()
+def collected_details(monkeypatch):
+    collected = []
+
+    async def collect_listing_detail(session, page, listing_list, sido, **kwargs):
+        collected.extend(listing_list)
+
+    monkeypatch.setattr(list_module, 'collect_listing_detail', collect_listing_detail)
+    return collected
+
+
+@pytest.mark.asyncio
+async def test_early_divide_stops_after_first_page(fake_search):
+    search = fake_search(DIVIDE_THRESHOLD)
+
+    listing_list, searched_count = await get_listing_list(None, REQUEST, early_divide=True)
+
+    assert search.fetched_pages == [1]
+    assert len(listing_list) == 18
+    assert searched_count == DIVIDE_THRESHOLD
+
+
+@pytest.mark.asyncio
+async def test_early_divide_collects_all_pages_of_leaf_box(fake_search):
+    search = fake_search(DIVIDE_THRESHOLD - 1, page_count=14)
+
+    listing_list, searched_count = await get_listing_list(None, REQUEST, early_divide=True)
+
+    assert search.fetched_pages == list(range(1, 15))
+    assert len(listing_list) == 14 * 18
+    assert searched_count == DIVIDE_THRESHOLD - 1
+
+
+@pytest.mark.asyncio
+async def test_without_early_divide_collects_all_pages(fake_search):
+    search = fake_search(1000)
+
+    listing_list, _ = await get_listing_list(None, REQUEST)
+
+    assert search.fetched_pages == list(range(1, 16))
+    assert len(listing_list) == 15 * 18
+
+
+@pytest.mark.asyncio
+async def test_collect_box_listing_skips_detail_of_box_to_divide(fake_search, collected_details):
+    search = fake_search(1000)
+    crawl = CrawlContext(CollectOption(early_divide=True), BoxSplitter())
+
+    assert await collect_box_listing(None, None, REQUEST, crawl) == (True, 1000)
+    assert search.fetched_pages == [1]
+    # 분할될 박스의 숙소는 하위 박스에서 다시 수집되므로 상세 정보를 수집하지 않음
+    assert collected_details == []
+
+
+@pytest.mark.asyncio
+async def test_collect_box_listing_collects_detail_of_leaf_box(fake_search, collected_details):
+    fake_search(100, page_count=6)
+    crawl = CrawlContext(CollectOption(early_divide=True), BoxSplitter())
+
+    assert await collect_box_listing(None, None, REQUEST, crawl) == (False, 100)
+    assert len(collected_details) == 6 * 18
+
+
+@pytest.mark.asyncio
+async def test_collect_box_listing_without_early_divide_collects_detail_of_box_to_divide(fake_search,
+                                                                                           collected_details):
+    fake_search(1000)
+    crawl = CrawlContext(CollectOption(), BoxSplitter())
+
+    assert await collect_box_listing(None, None, REQUEST, crawl) == (True, 1000)
+    assert len(collected_details) == 15 * 18
+
+
+class FakeSessionFactory:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+class FakeWriter:
+    def __init__(self, events):
+        self.events = events
+
+    async def flush(self):
+        self.events.append('flush')
+
+
+@pytest.mark.asyncio
+async def test_finish_search_box_after_details_are_saved(monkeypatch):
+    events = []
+
+    async def complete_search_box(session, box, worker_id, searched_count, children):
+        events.append('complete')
+        return True
+
+    monkeypatch.setattr(list_module, 'session_factory', FakeSessionFactory)
+    monkeypatch.setattr(list_module, 'complete_search_box', complete_search_box)
+    crawl = CrawlContext(CollectOption(frontier=True, detail_concurrency=1, write_batch_size=100), BoxSplitter())
+    crawl.writer = FakeWriter(events)
+    detail_batch = DetailBatch()
+    detail_batch.add()
+    renew_task = asyncio.create_task(asyncio.Event().wait())
+    box = FrontierBox(id=1, ne_lat=37.7, ne_lng=127.2, sw_lat=37.4, sw_lng=126.8, depth=0)
+
+    finishing_task = asyncio.create_task(finish_search_box(box, 'worker-1', crawl, detail_batch, renew_task, 100, []))
+    await asyncio.sleep(0.01)
+
+    # 상세 정보가 처리되기 전에는 임대를 유지하고 완료 처리하지 않음
+    assert events == []
+    assert renew_task.done() is False
+
+    detail_batch.finish()
+    await finishing_task
+
+    assert events == ['flush', 'complete']
+    assert renew_task.cancelled() is True
@@ -0,0 +1,112 @@
+import pytest
+import pytest_asyncio
+import uuid
+from sqlalchemy import delete
+from app.core import list as list_module
+from app.core.list import find_existing_listing_ids, load_collected_listing_ids, cache_existing_listing
+from app.lib.entity import Listing, create_tables
+from app.lib.database import session_factory, async_engine
+from app.lib.model import ListingId
+
+COLLECT_DATE = '2024-05-01'
+
+
+@pytest_asyncio.fixture()
+async def collected_sido():
+    """
+    실제 Postgres 에 테스트 전용 sido 로 숙소를 저장하고, 테스트 후 삭제합니다.
+    DB 에 연결할 수 없는 환경에서는 건너뜁니다.
+    """
+    try:
+        await create_tables()
+    except (OSError, ConnectionError) as e:
+        await async_engine.dispose()
+        pytest.skip(f"Postgres 에 연결할 수 없습니다. - {e}")
+
+    sido = f"test-{uuid.uuid4().hex[:8]}"
+    async with session_factory() as session:
+        async with session.begin():
+            session.add_all([
+                Listing(id=f"{sido}-1", collect_date=COLLECT_DATE, sido=sido),
+                Listing(id=f"{sido}-2", collect_date=COLLECT_DATE, sido=sido),
+                Listing(id=f"{sido}-3", collect_date='2024-04-30', sido=sido),  # 이전 날짜
+                Listing(id=f"{sido}-4", collect_date=COLLECT_DATE, sido=f"{sido}-other")  # 다른 sido
+            ])
+
+    yield sido
+
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(delete(Listing).where(Listing.sido.in_([sido, f"{sido}-other"])))
+    await async_engine.dispose()
+
+
+class FakeResult:
+    def __init__(self, ids):
+        self.ids = ids
+
+    def scalars(self):
+        return iter(self.ids)
+
+
+class FakeSession:
+    """
+    질의 횟수를 세고, 전달된 listing id 중 저장된 id 만 반환합니다.
+    """
+
+    def __init__(self, saved_ids):
+        self.saved_ids = set(saved_ids)
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        ids = statement.compile().params['ids']
+        return FakeResult([listing_id for listing_id in ids if listing_id in self.saved_ids])
+
+
+@pytest.fixture()
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(list_module, 'cache', set())
+    return list_module
+
+
+@pytest.mark.asyncio
+async def test_find_existing_listing_ids(collected_sido):
+    listing_id_list = [f"{collected_sido}-{index}" for index in range(1, 6)]
+    async with session_factory() as session:
+        existing = await find_existing_listing_ids(session, listing_id_list, COLLECT_DATE)
+
+    # 같은 날짜에 저장된 숙소만 ( sido 와 관계없음 )
+    assert existing == {f"{collected_sido}-1", f"{collected_sido}-2", f"{collected_sido}-4"}
+
+
+@pytest.mark.asyncio
+async def test_load_collected_listing_ids(collected_sido):
+    async with session_factory() as session:
+        collected = await load_collected_listing_ids(session, collected_sido, COLLECT_DATE)
+
+    assert collected == {f"{collected_sido}-1", f"{collected_sido}-2"}
+
+
+@pytest.mark.asyncio
+async def test_cache_existing_listing_queries_once(empty_cache):
+    empty_cache.cache.add('1')
+    session = FakeSession(['2', '3'])
+    listing_list = [ListingId(str(index), (37.5, 127.0)) for index in range(1, 5)] + [ListingId('2', (37.5, 127.0))]
+
+    await cache_existing_listing(session, listing_list, COLLECT_DATE)
+
+    # 캐시에 없는 숙소 id 를 중복 없이 한번의 질의로 확인
+    assert len(session.statements) == 1
+    assert sorted(session.statements[0].compile().params['ids']) == ['2', '3', '4']
+    assert empty_cache.cache == {'1', '2', '3'}
+
+
+@pytest.mark.asyncio
+async def test_cache_existing_listing_skips_query_when_all_cached(empty_cache):
+    empty_cache.cache.update({'1', '2'})
+    session = FakeSession([])
+
+    await cache_existing_listing(session, [ListingId('1', (37.5, 127.0)), ListingId('2', (37.5, 127.0))], COLLECT_DATE)
+
+    assert session.statements == []
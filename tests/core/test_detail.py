@@ -1,7 +1,18 @@
+import json
 import time
 
 from tests.core.fixtures import play_wright_page
 from app.core.detail import _request_all_review, _extract_foreigner_review_count
+from app.core.detail import _extract_deferred_state, _extract_listing_info_from_state
+from app.core.detail import _create_review_api_template, _build_review_url, _request_review_list, _get_json
+from app.core.detail import fetch_listing_info_by_http
+from app.core import detail
+from app.lib.model import ListingRequest
+from app.lib.http_client import HttpClient
+from tests.fakes import FakeResponse, FakeRequestContext
+from functools import partial
+from urllib.parse import urlsplit, parse_qs
+import base64
 import pytest
 
 
@@ -26,4 +37,207 @@ async def test_request_all_review(setUp):
         print(review_list)
 
         foreigner_review_count = _extract_foreigner_review_count(review_list)
-        print(foreigner_review_count)
\ No newline at end of file
+        print(foreigner_review_count)
+
+
+def _build_listing_html(sections, calendar_months=None):
+    niobe_data = [['StaysPdpSections:1', {'data': {'presentation': {'stayProductDetailPage': {
+        'sections': {'sections': [{'sectionId': key, 'section': value} for key, value in sections.items()]}
+    }}}}]]
+    if calendar_months is not None:
+        niobe_data.append(['PdpAvailabilityCalendar:1', {'data': {'merlin': {'pdpAvailabilityCalendar': {
+            'calendarMonths': calendar_months
+        }}}}])
+    state = json.dumps({'niobeMinimalClientData': niobe_data})
+    return f'<html><body><script id="data-deferred-state-0" type="application/json">{state}</script></body></html>'
+
+
+LISTING_SECTIONS = {
+    'TITLE_DEFAULT': {'title': '바다 전망 숙소'},
+    'REVIEWS_DEFAULT': {'overallRating': 4.87, 'overallCount': 31,
+                        'reviews': [{'comments': '좋아요'}, {'comments': 'Great stay'}]},
+    'AMENITIES_DEFAULT': {'previewAmenitiesGroups': [{'amenities': [
+        {'title': '와이파이', 'available': True},
+        {'title': '주방', 'available': True},
+        {'title': '세탁기', 'available': False}
+    ]}]}
+}
+
+
+def test_extract_listing_info_from_state():
+    calendar_months = [{'days': [
+        {'calendarDate': '2024-11-03', 'available': False},
+        {'calendarDate': '2024-11-04', 'available': False},
+        {'calendarDate': '2024-11-05', 'available': True},
+        {'calendarDate': '2024-12-05', 'available': False}
+    ]}]
+    state = _extract_deferred_state(_build_listing_html(LISTING_SECTIONS, calendar_months))
+
+    listing_info = _extract_listing_info_from_state(state, '2024-11-04')
+
+    assert listing_info['title'] == '바다 전망 숙소'
+    assert listing_info['rating'] == 4.87
+    assert listing_info['review_count'] == 31
+    assert listing_info['foreigner_review_count'] == 1
+    assert sorted(listing_info['option_list']) == ['와이파이', '주방']
+    assert listing_info['reserved_count'] == 1
+
+
+def test_extract_listing_info_from_state_without_calendar():
+    state = _extract_deferred_state(_build_listing_html(LISTING_SECTIONS))
+
+    assert _extract_listing_info_from_state(state, '2024-11-04')['reserved_count'] == -1
+
+
+def test_extract_listing_info_from_state_missing_section():
+    sections = {key: value for key, value in LISTING_SECTIONS.items() if key != 'REVIEWS_DEFAULT'}
+    state = _extract_deferred_state(_build_listing_html(sections))
+
+    assert _extract_listing_info_from_state(state, '2024-11-04') is None
+
+
+def test_extract_deferred_state_without_script():
+    assert _extract_deferred_state('<html><body></body></html>') is None
+
+
+REVIEW_API_URL = 'https://www.airbnb.co.kr/api/v3/StaysPdpReviewsQuery/abc123'
+
+
+def _build_review_api_url(listing_id, offset):
+    variables = {
+        'id': base64.b64encode(f"StayListing:{listing_id}".encode()).decode(),
+        'pdpReviewsRequest': {'fieldSelector': 'for_p3_translation_only', 'limit': 24, 'offset': str(offset)}
+    }
+    return f"{REVIEW_API_URL}?operationName=StaysPdpReviewsQuery&locale=ko&variables={json.dumps(variables)}"
+
+
+def _parse_review_variables(url):
+    return json.loads(parse_qs(urlsplit(url).query)['variables'][0])
+
+
+def create_review_request_context(review_list, failed_offset_list=(), html=''):
+    """
+    상세 페이지 요청에는 html 을, 리뷰 API 요청에는 review_list 의 offset 부터 limit 개를 반환합니다.
+    """
+    def respond(method, url, data):
+        if '/rooms/' in url:
+            return FakeResponse(html)
+        reviews_request = _parse_review_variables(url)['pdpReviewsRequest']
+        offset = int(reviews_request['offset'])
+        if offset in failed_offset_list:
+            return FakeResponse(None, status=500)
+        reviews = [{'comments': comment} for comment in review_list[offset:offset + reviews_request['limit']]]
+        return FakeResponse({'data': {'presentation': {'stayProductDetailPage': {'reviews': {
+            'reviews': reviews, 'metadata': {'reviewsCount': len(review_list)}
+        }}}}})
+
+    return FakeRequestContext(respond)
+
+
+def _requested_offset_list(request_context):
+    return sorted(int(_parse_review_variables(url)['pdpReviewsRequest']['offset'])
+                  for _, url, _, _ in request_context.requested if '/rooms/' not in url)
+
+
+def _create_http_client(review_list, failed_offset_list=(), concurrency=4):
+    request_context = create_review_request_context(review_list, failed_offset_list,
+                                                    html=_build_listing_html(LISTING_SECTIONS))
+    return HttpClient(request_context, concurrency, 10)
+
+
+def test_create_review_api_template():
+    template = _create_review_api_template(_build_review_api_url('1186562601711001653', 0),
+                                           {'x-airbnb-api-key': 'key', 'cookie': 'session', 'host': 'airbnb'})
+
+    assert template.url == REVIEW_API_URL
+    assert template.params == {'operationName': 'StaysPdpReviewsQuery', 'locale': 'ko'}
+    assert template.headers == {'x-airbnb-api-key': 'key'}
+    assert template.listing_id == '1186562601711001653'
+    assert (template.offset, template.limit) == (0, 24)
+
+
+def test_build_review_url_for_other_listing():
+    template = _create_review_api_template(_build_review_api_url('1', 0), {})
+
+    variables = _parse_review_variables(_build_review_url(template, '2', 48))
+
+    assert base64.b64decode(variables['id']).decode() == 'StayListing:2'
+    assert variables['pdpReviewsRequest']['offset'] == '48'
+    assert template.variables['pdpReviewsRequest']['offset'] == '0'
+
+
+@pytest.mark.asyncio
+async def test_request_review_list():
+    template = _create_review_api_template(_build_review_api_url('1', 0), {})
+    review_list = [f"review {index}" for index in range(60)]
+    request_context = create_review_request_context(review_list)
+
+    result = await _request_review_list(partial(_get_json, request_context), template, '1', 24, len(review_list))
+
+    assert _requested_offset_list(request_context) == [24, 48]
+    assert result == review_list[24:]
+
+
+@pytest.mark.asyncio
+async def test_request_review_list_all_failed():
+    template = _create_review_api_template(_build_review_api_url('1', 0), {})
+    request_context = create_review_request_context(['review'] * 30, failed_offset_list=[0, 24])
+
+    assert await _request_review_list(partial(_get_json, request_context), template, '1', 0, 30) is None
+
+
+@pytest.mark.asyncio
+async def test_request_review_list_partially_failed():
+    template = _create_review_api_template(_build_review_api_url('1', 0), {})
+    review_list = [f"review {index}" for index in range(60)]
+
+    # 일부 페이지만 실패해도 외국인 리뷰 개수를 적게 세지 않도록 None ( HTTP 수집은 브라우저로 다시 수집 )
+    get_json = partial(_get_json, create_review_request_context(review_list, failed_offset_list=[24]))
+    assert await _request_review_list(get_json, template, '1', 0, 60) is None
+    # 브라우저 수집은 가져온 리뷰만 사용
+    assert await _request_review_list(get_json, template, '1', 0, 60, allow_partial=True) == \
+        review_list[:24] + review_list[48:]
+
+
+@pytest.mark.asyncio
+async def test_fetch_listing_info_by_http_falls_back_when_review_page_fails(monkeypatch):
+    monkeypatch.setattr(detail, 'review_api_template', _create_review_api_template(_build_review_api_url('1', 0), {}))
+    review_list = ['좋아요'] * 21 + ['Great stay'] * 10
+    client = _create_http_client(review_list, failed_offset_list=[24])
+
+    assert await fetch_listing_info_by_http(client, ListingRequest('2', '(37.5, 127.0)', '2024-11-04')) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_listing_info_by_http_falls_back_before_review_template(monkeypatch):
+    # 페이지에는 31개 중 2개의 리뷰만 포함되어 있으므로, 리뷰 API 요청 정보가 없으면 브라우저로 수집
+    monkeypatch.setattr(detail, 'review_api_template', None)
+    client = _create_http_client([])
+
+    assert await fetch_listing_info_by_http(client, ListingRequest('2', '(37.5, 127.0)', '2024-11-04')) is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_listing_info_by_http_counts_all_reviews(monkeypatch):
+    monkeypatch.setattr(detail, 'review_api_template', _create_review_api_template(_build_review_api_url('1', 0), {}))
+    review_list = ['좋아요'] * 21 + ['Great stay'] * 10
+    client = _create_http_client(review_list)
+
+    listing = await fetch_listing_info_by_http(client, ListingRequest('2', '(37.5, 127.0)', '2024-11-04'))
+
+    assert listing.review_count == 31
+    assert listing.foreigner_review_count == 10
+
+
+@pytest.mark.asyncio
+async def test_fetch_listing_info_by_http_limits_review_requests_by_client(monkeypatch):
+    monkeypatch.setattr(detail, 'review_api_template', _create_review_api_template(_build_review_api_url('1', 0), {}))
+    review_list = ['좋아요'] * 21 + ['Great stay'] * 10
+    client = _create_http_client(review_list, concurrency=1)
+
+    listing = await fetch_listing_info_by_http(client, ListingRequest('2', '(37.5, 127.0)', '2024-11-04'))
+
+    # 리뷰 API 요청도 상세 페이지 요청과 같은 client 의 동시 요청 개수 제한을 받음
+    assert _requested_offset_list(client.request_context) == [0, 24]
+    assert client.request_context.max_in_flight == 1
+    assert listing.foreigner_review_count == 10
@@ -0,0 +1,45 @@
+import os
+import pytest
+from app.core.detail import _extract_listing_info, _extract_deferred_state
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+RECORDED_PAGE_LIST = ['rooms_banner.html', 'rooms_heading.html']
+
+
+def _read_page(file_name):
+    with open(os.path.join(DATA_DIR, file_name), encoding='utf-8') as page_file:
+        return page_file.read()
+
+
+def _normalize(listing_info):
+    return {**listing_info, 'option_list': sorted(listing_info['option_list'])}
+
+
+@pytest.mark.parametrize('parser', ['lxml', 'selectolax'])
+@pytest.mark.parametrize('file_name', RECORDED_PAGE_LIST)
+def test_parser_parity(parser, file_name):
+    pytest.importorskip(parser)  # 선택 설치 패키지
+    html = _read_page(file_name)
+
+    expected = _extract_listing_info(html, '2024-05-01', 'html.parser')
+    assert _normalize(_extract_listing_info(html, '2024-05-01', parser)) == _normalize(expected)
+    assert _extract_deferred_state(html, parser) == _extract_deferred_state(html, 'html.parser')
+
+
+def test_extract_listing_info_from_recorded_page():
+    listing_info = _extract_listing_info(_read_page('rooms_banner.html'), '2024-05-01', 'html.parser')
+
+    assert listing_info['title'] == '해운대 오션뷰 & 루프탑 아파트'
+    assert listing_info['rating'] == 4.93
+    assert listing_info['review_count'] == 128
+    assert listing_info['reserved_count'] == 4  # 30일 이후 날짜와 예약 가능한 날짜는 제외
+    assert sorted(listing_info['option_list']) == ['건물 내 무료 주차', '무선 인터넷', '바다 전망', '에어컨', '주방']
+
+
+def test_extract_listing_info_from_heading():
+    listing_info = _extract_listing_info(_read_page('rooms_heading.html'), '2024-05-01', 'html.parser')
+
+    assert listing_info['title'] == 'Cozy Studio near Hongdae (Line 2)'
+    assert listing_info['rating'] == 4.85
+    assert listing_info['review_count'] == 42
+    assert sorted(listing_info['option_list']) == ['Wifi', '세탁기', '헤어드라이어']
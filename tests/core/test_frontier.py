@@ -0,0 +1,105 @@
+import pytest
+import pytest_asyncio
+import uuid
+from datetime import timedelta
+from sqlalchemy import delete, select, update
+from app.util import generate_now_date
+from app.lib.model import ListingListRequest
+from app.lib.entity import SearchBox, BoxStatus, create_tables
+from app.lib.database import session_factory, async_engine
+from app.core.frontier import seed_frontier, lease_search_box, renew_search_box_lease, complete_search_box
+from app.constants import FRONTIER_LEASE_TIMEOUT
+
+COLLECT_DATE = '2024-05-01'
+CHILDREN = [((37.7, 127.2), (37.55, 127.0)), ((37.55, 127.0), (37.4, 126.8))]
+
+
+@pytest_asyncio.fixture()
+async def frontier_request():
+    """
+    실제 Postgres 에 테스트 전용 sido 로 frontier 를 만들고, 테스트 후 삭제합니다.
+    DB 에 연결할 수 없는 환경에서는 건너뜁니다.
+    """
+    try:
+        await create_tables()
+    except (OSError, ConnectionError) as e:
+        await async_engine.dispose()
+        pytest.skip(f"Postgres 에 연결할 수 없습니다. - {e}")
+
+    request = ListingListRequest(sido=f"test-{uuid.uuid4().hex[:8]}", ne_lat=37.7, ne_lng=127.2, sw_lat=37.4, sw_lng=126.8)
+    async with session_factory() as session:
+        await seed_frontier(session, request, COLLECT_DATE)
+
+    yield request
+
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(delete(SearchBox).where(SearchBox.sido == request.sido))
+    await async_engine.dispose()
+
+
+async def expire_lease(box_id: int):
+    async with session_factory() as session:
+        async with session.begin():
+            await session.execute(
+                update(SearchBox)
+                .where(SearchBox.id == box_id)
+                .values(leased_at=generate_now_date() - timedelta(seconds=FRONTIER_LEASE_TIMEOUT + 1))
+            )
+
+
+async def find_boxes(sido: str):
+    async with session_factory() as session:
+        result = await session.execute(select(SearchBox).where(SearchBox.sido == sido).order_by(SearchBox.id))
+        return result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_lease_pending_box_once(frontier_request):
+    async with session_factory() as session:
+        box = await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-1')
+    async with session_factory() as session:
+        other = await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-2')
+
+    assert box is not None and box.depth == 0
+    # 임대 중인 박스는 다른 워커가 받지 않음
+    assert other is None
+
+
+@pytest.mark.asyncio
+async def test_lease_expired_box_again(frontier_request):
+    async with session_factory() as session:
+        box = await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-1')
+    await expire_lease(box.id)
+
+    async with session_factory() as session:
+        released = await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-2')
+
+    assert released.id == box.id
+    assert (await find_boxes(frontier_request.sido))[0].leased_by == 'worker-2'
+
+
+@pytest.mark.asyncio
+async def test_stale_lease_cannot_complete_box(frontier_request):
+    async with session_factory() as session:
+        box = await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-1')
+    await expire_lease(box.id)
+    async with session_factory() as session:
+        await lease_search_box(session, frontier_request.sido, COLLECT_DATE, 'worker-2')
+
+    # 임대를 잃은 워커의 완료 처리와 갱신은 무시되고 하위 박스도 추가되지 않음
+    async with session_factory() as session:
+        assert await renew_search_box_lease(session, box, 'worker-1') is False
+    async with session_factory() as session:
+        assert await complete_search_box(session, box, 'worker-1', 900, CHILDREN) is False
+
+    boxes = await find_boxes(frontier_request.sido)
+    assert len(boxes) == 1
+    assert boxes[0].status == BoxStatus.LEASED.value
+
+    async with session_factory() as session:
+        assert await complete_search_box(session, box, 'worker-2', 900, CHILDREN) is True
+
+    boxes = await find_boxes(frontier_request.sido)
+    assert [b.status for b in boxes] == [BoxStatus.DONE.value, BoxStatus.PENDING.value, BoxStatus.PENDING.value]
+    assert all(b.depth == 1 for b in boxes[1:])
@@ -0,0 +1,37 @@
+import os
+from app.core.list import extract_listing_page, extract_listing_list, get_searched_listing_total_count, \
+    scan_listing_page
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+def _read_search_page():
+    with open(os.path.join(DATA_DIR, 'search_page.html'), encoding='utf-8') as page_file:
+        return page_file.read()
+
+
+def test_extract_listing_page():
+    listing_list, searched_count = extract_listing_page(_read_search_page())
+
+    assert searched_count == 1024  # script 안의 같은 data-testid 는 무시
+    assert len(listing_list) == 18
+    assert sum(1 for listing in listing_list if listing.review_count is not None) == 17  # 신규 숙소 1개 제외
+
+
+def test_extract_listing_list_and_count_separately():
+    html = _read_search_page()
+
+    assert set(extract_listing_list(html)) == set(extract_listing_page(html)[0])
+    assert get_searched_listing_total_count(html) == 1024
+
+
+def test_scan_listing_page_with_nested_heading():
+    html = ("<div><h1 class='x' data-testid='stays-page-heading'><span>숙소</span> <span><b>1,000</b>개 이상</span>"
+            "</h1><span>2,000</span></div>")
+
+    assert scan_listing_page(html) == (None, 1000)
+
+
+def test_scan_listing_page_without_heading_and_script():
+    assert scan_listing_page('<html><body><h1>검색 결과</h1></body></html>') == (None, 0)
+    assert extract_listing_page('') == ([], 0)
@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from app.core.pipeline import DetailPipeline, DetailBatch
+from app.lib.browser import PagePool
+from app.lib.model import ListingId
+from tests.fakes import FakeContextFactory
+
+
+async def create_fake_page_pool(size: int):
+    return await PagePool.create(FakeContextFactory(), size)
+
+
+@pytest.mark.asyncio
+async def test_detail_pipeline_drains_queue_on_close():
+    collected = []
+
+    async def handler(session, page, listing_list, sido):
+        await asyncio.sleep(0.01)
+        collected.extend(listing.id for listing in listing_list)
+
+    pipeline = DetailPipeline(create_fake_page_pool, worker_count=2, queue_size=3, handler=handler)
+    await pipeline.start()
+    for num in range(10):
+        await pipeline.put(ListingId(id=str(num), coordinate=(0, 0)), '대전광역시')
+        assert pipeline.queue.qsize() <= 3  # queue 크기 이상으로 쌓이지 않음
+    await pipeline.close()
+
+    assert sorted(collected, key=int) == [str(num) for num in range(10)]
+
+
+@pytest.mark.asyncio
+async def test_detail_pipeline_keeps_working_after_handler_error():
+    collected = []
+
+    async def handler(session, page, listing_list, sido):
+        if listing_list[0].id == '0':
+            raise ValueError('fetch failed')
+        collected.append(listing_list[0].id)
+
+    pipeline = DetailPipeline(create_fake_page_pool, worker_count=1, queue_size=10, handler=handler)
+    await pipeline.start()
+    for num in range(3):
+        await pipeline.put(ListingId(id=str(num), coordinate=(0, 0)), '대전광역시')
+    await pipeline.close()
+
+    assert collected == ['1', '2']
+
+
+@pytest.mark.asyncio
+async def test_detail_batch_waits_for_its_listings():
+    release = asyncio.Event()
+    collected = []
+
+    async def handler(session, page, listing_list, sido):
+        if listing_list[0].id == '1':
+            raise ValueError('fetch failed')
+        await release.wait()
+        collected.append(listing_list[0].id)
+
+    pipeline = DetailPipeline(create_fake_page_pool, worker_count=2, queue_size=10, handler=handler)
+    await pipeline.start()
+    batch = DetailBatch()
+    for num in range(3):
+        await pipeline.put(ListingId(id=str(num), coordinate=(0, 0)), '대전광역시', batch)
+    await pipeline.put(ListingId(id='other', coordinate=(0, 0)), '대전광역시')
+    await asyncio.sleep(0.01)
+
+    assert batch.finished.is_set() is False
+
+    release.set()
+    await asyncio.wait_for(batch.wait(), timeout=1)
+
+    # 실패한 숙소도 처리가 끝난 것으로 셈
+    assert {'0', '2'} <= set(collected)
+    await pipeline.close()
@@ -0,0 +1,53 @@
+from app.core.plan import CrawlPlan
+
+ROOT = (37.7, 127.2, 37.4, 126.8)
+QUADRANTS = [
+    (37.7, 127.2, 37.55, 127.0),
+    (37.7, 127.0, 37.55, 126.8),
+    (37.55, 127.0, 37.4, 126.8),
+    (37.55, 127.2, 37.4, 127.0),
+]
+
+
+def test_leaves_exclude_divided_boxes():
+    plan = CrawlPlan()
+    plan.record_search(ROOT, 900)
+    plan.record_division(ROOT, QUADRANTS)
+    for quadrant in QUADRANTS:
+        plan.record_search(quadrant, 200)
+
+    leaves = plan.get_leaves()
+    assert sorted(box for box, _, _ in leaves) == sorted(QUADRANTS)
+    assert all(parent == ROOT for _, parent, _ in leaves)
+
+
+def test_sparse_siblings_are_merged_into_parent():
+    # 이전 계획의 리프 박스로 시작한 수집에서 형제 박스들의 검색 개수가 적어진 경우
+    plan = CrawlPlan(parents={quadrant: ROOT for quadrant in QUADRANTS})
+    for quadrant in QUADRANTS:
+        plan.record_search(quadrant, 10)
+
+    assert plan.get_leaves() == [(ROOT, None, 40)]
+
+
+def test_siblings_are_not_merged_when_one_is_divided():
+    plan = CrawlPlan(parents={quadrant: ROOT for quadrant in QUADRANTS})
+    for quadrant in QUADRANTS:
+        plan.record_search(quadrant, 10)
+    plan.record_division(QUADRANTS[0], [(37.7, 127.2, 37.6, 127.1)])
+    plan.record_search((37.7, 127.2, 37.6, 127.1), 5)
+
+    assert ROOT not in [box for box, _, _ in plan.get_leaves()]
+
+
+def test_unvisited_boxes_stay_in_plan():
+    # 시간 예산이 끝나 하위 박스 일부를 검색하지 못한 경우
+    plan = CrawlPlan()
+    plan.record_search(ROOT, 900)
+    plan.record_division(ROOT, QUADRANTS)
+    plan.record_search(QUADRANTS[0], 300)
+    for quadrant in QUADRANTS:
+        plan.record_unvisited(quadrant, 200)
+
+    leaves = {box: searched_count for box, _, searched_count in plan.get_leaves()}
+    assert leaves == {QUADRANTS[0]: 300, QUADRANTS[1]: 200, QUADRANTS[2]: 200, QUADRANTS[3]: 200}
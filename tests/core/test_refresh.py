@@ -0,0 +1,101 @@
+import pytest
+from app.lib.entity import Listing
+from app.lib.model import ListingId
+from app.core import list as list_module
+from app.core.list import extract_listing_data, extract_rating_and_review_count, is_unchanged_listing, \
+    enqueue_listing_detail
+
+
+def create_search_result(**fields):
+    return {
+        'listing': {
+            'id': '123',
+            'coordinate': {'latitude': 36.3, 'longitude': 127.4}
+        },
+        **fields
+    }
+
+
+def create_snapshot(rating=4.87, review_count=31, collect_date='2024-05-01', detail_collect_date=None):
+    return Listing(id='123', collect_date=collect_date, title='숙소', rating=rating, review_count=review_count,
+                   foreigner_review_count=3, option_list="['와이파이']", reserved_count=10,
+                   detail_collect_date=detail_collect_date)
+
+
+def test_extract_rating_and_review_count():
+    assert extract_rating_and_review_count({'avgRatingLocalized': '4.87 (1,031)'}) == (4.87, 1031)
+    assert extract_rating_and_review_count({
+        'avgRatingLocalized': '신규',
+        'avgRatingA11yLabel': '평균 평점 5.0점(5점 만점), 후기 3개'
+    }) == (5.0, 3)
+    assert extract_rating_and_review_count({'avgRatingLocalized': '신규'}) == (None, None)
+    assert extract_rating_and_review_count({}) == (None, None)
+
+
+def test_extract_listing_data_keeps_identity_on_id_and_coordinate():
+    listing = extract_listing_data(create_search_result(avgRatingLocalized='4.87 (31)'))
+
+    assert listing.rating == 4.87
+    assert listing.review_count == 31
+    assert listing == ListingId('123', (36.3, 127.4))
+    assert len({listing, ListingId('123', (36.3, 127.4))}) == 1
+
+
+def test_is_unchanged_listing():
+    listing = ListingId('123', (36.3, 127.4), rating=4.87, review_count=31)
+
+    assert is_unchanged_listing(listing, create_snapshot(), '2024-05-02', refresh_ttl=7) is True
+    # 리뷰가 추가되었거나 평점이 바뀐 숙소
+    assert is_unchanged_listing(listing, create_snapshot(review_count=30), '2024-05-02', refresh_ttl=7) is False
+    assert is_unchanged_listing(listing, create_snapshot(rating=4.9), '2024-05-02', refresh_ttl=7) is False
+    # 검색 결과에 평점이 없는 숙소
+    assert is_unchanged_listing(ListingId('123', (36.3, 127.4)), create_snapshot(), '2024-05-02', refresh_ttl=7) is False
+
+
+def test_is_unchanged_listing_expires_by_detail_collect_date():
+    listing = ListingId('123', (36.3, 127.4), rating=4.87, review_count=31)
+
+    # 이전 정보를 이어받은 숙소는 상세 정보를 실제로 수집한 날짜 기준
+    snapshot = create_snapshot(collect_date='2024-05-07', detail_collect_date='2024-05-01')
+    assert is_unchanged_listing(listing, snapshot, '2024-05-07', refresh_ttl=7) is True
+    assert is_unchanged_listing(listing, snapshot, '2024-05-08', refresh_ttl=7) is False
+
+
+class FakePipeline:
+    def __init__(self):
+        self.queued = []
+
+    async def put(self, listing, sido, batch=None):
+        self.queued.append(listing.id)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_listing_detail_loads_snapshots_once(monkeypatch):
+    snapshot_queries, saved = [], []
+
+    async def find_existing_listing_ids(session, listing_id_list, collect_date):
+        return set()
+
+    async def find_previous_listing_snapshots(session, listing_id_list, collect_date):
+        snapshot_queries.append(sorted(listing_id_list))
+        return {'1': create_snapshot(), '2': create_snapshot(review_count=20)}
+
+    async def save_listing(session, **fields):
+        saved.append(fields)
+
+    monkeypatch.setattr(list_module, 'cache', set())
+    monkeypatch.setattr(list_module, 'generate_now_date_to_string', lambda: '2024-05-02')
+    monkeypatch.setattr(list_module, 'find_existing_listing_ids', find_existing_listing_ids)
+    monkeypatch.setattr(list_module, 'find_previous_listing_snapshots', find_previous_listing_snapshots)
+    monkeypatch.setattr(list_module, 'save_listing', save_listing)
+    pipeline = FakePipeline()
+    listing_list = [ListingId(listing_id, (36.3, 127.4), rating=4.87, review_count=31) for listing_id in '123']
+
+    await enqueue_listing_detail(None, pipeline, listing_list, '대전광역시', refresh_ttl=7)
+
+    # 검색 페이지의 숙소 전체에 대해 이전 저장 정보를 한번만 질의
+    assert snapshot_queries == [['1', '2', '3']]
+    # 변경되지 않은 숙소는 queue 에 넣지 않고 이전 정보를 이어받아 저장
+    assert [fields['id'] for fields in saved] == ['1']
+    assert saved[0]['detail_collect_date'] == '2024-05-01'
+    assert pipeline.queued == ['2', '3']
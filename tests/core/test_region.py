@@ -0,0 +1,24 @@
+from app.core.region import load_region
+from app.lib.model import ListingListRequest, ListingId
+
+
+def test_load_region():
+    assert load_region('부산광역시') is not None
+    assert load_region('kulsgr') is not None
+    assert load_region('없는지역') is None
+
+
+def test_filter_request_list():
+    region = load_region('부산광역시')
+    inside = ListingListRequest(sido='부산광역시', ne_lat=35.2, ne_lng=129.1, sw_lat=35.1, sw_lng=129.0)
+    sea = ListingListRequest(sido='부산광역시', ne_lat=34.8, ne_lng=129.5, sw_lat=34.7, sw_lng=129.4)
+
+    assert region.filter_request_list([inside, sea]) == [inside]
+
+
+def test_filter_listing_list():
+    region = load_region('부산광역시')
+    inside = ListingId(id='1', coordinate=(35.15, 129.05))
+    seoul = ListingId(id='2', coordinate=(37.55, 126.98))
+
+    assert region.filter_listing_list([inside, seoul]) == [inside]
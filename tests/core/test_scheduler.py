@@ -0,0 +1,42 @@
+from app.core.scheduler import BoxScheduler, get_score
+from app.lib.model import ListingListRequest
+
+
+def _request(ne_lat, ne_lng, sw_lat, sw_lng):
+    return ListingListRequest(sido='대전광역시', ne_lat=ne_lat, ne_lng=ne_lng, sw_lat=sw_lat, sw_lng=sw_lng)
+
+
+def test_score_prefers_stale_and_dense_boxes():
+    assert get_score(100, 1.0) > get_score(100, 0.1)
+    assert get_score(200, 1.0) > get_score(10, 1.0)  # 페이지 비용 대비 숙소가 많은 박스
+    assert get_score(500, 1.0, divide_page_count=1) > get_score(500, 1.0, divide_page_count=15)
+
+
+def test_children_share_parent_count_by_history_density():
+    history_id_list = [str(num) for num in range(10)]
+    history_coordinates = [(0.75, 0.75)] * 9 + [(0.25, 0.25)]
+    scheduler = BoxScheduler(60, history_id_list, history_coordinates, lambda listing_id: False)
+
+    parent = _request(1, 1, 0, 0)
+    dense_child, sparse_child = _request(1, 1, 0.5, 0.5), _request(0.5, 0.5, 0, 0)
+    scheduler.push_children(parent, 200, [sparse_child, dense_child])
+
+    first, second = scheduler.pop(), scheduler.pop()
+    assert first.request == dense_child
+    assert first.expected_count == 180
+    assert second.expected_count == 20
+    assert scheduler.pop() is None
+
+
+def test_boxes_collected_today_are_scheduled_last():
+    history_id_list = ['1', '2']
+    history_coordinates = [(0.75, 0.75), (0.25, 0.25)]
+    collected_id_set = {'1'}
+    scheduler = BoxScheduler(60, history_id_list, history_coordinates, lambda listing_id: listing_id in collected_id_set)
+
+    collected_box, stale_box = _request(1, 1, 0.5, 0.5), _request(0.5, 0.5, 0, 0)
+    scheduler.push_start_request(collected_box)
+    scheduler.push_start_request(stale_box)
+
+    assert scheduler.pop().request == stale_box
+    assert scheduler.is_expired() is False
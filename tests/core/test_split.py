@@ -0,0 +1,64 @@
+from app.core.split import BoxSplitter, get_split_factor, estimate_quadtree_search_count
+from app.util import divide_into_grid, divide_by_density
+
+
+def _area(box):
+    (ne_lat, ne_lng), (sw_lat, sw_lng) = box
+    return (ne_lat - sw_lat) * (ne_lng - sw_lng)
+
+
+def test_get_split_factor():
+    assert get_split_factor(250) == 2
+    assert get_split_factor(1000) == 3
+    assert get_split_factor(4000) == 5
+    assert get_split_factor(100000) == 6  # MAX_SPLIT_FACTOR
+
+
+def test_estimate_quadtree_search_count():
+    assert estimate_quadtree_search_count(100) == 0
+    assert estimate_quadtree_search_count(300) == 4
+    assert estimate_quadtree_search_count(4000) == 4 + 16 + 64
+
+
+def test_divide_into_grid_covers_box():
+    boxes = divide_into_grid(37.7, 127.2, 37.4, 126.8, 3)
+    assert len(boxes) == 9
+    assert abs(sum(_area(box) for box in boxes) - _area(((37.7, 127.2), (37.4, 126.8)))) < 1e-9
+
+
+def test_divide_by_density_balances_coordinates():
+    # 북동쪽 구석에 좌표가 몰려 있는 경우
+    coordinates = [(37.69 - i * 0.0001, 127.19 - i * 0.0001) for i in range(90)] + [(37.45, 126.85)] * 10
+    boxes = divide_by_density(37.7, 127.2, 37.4, 126.8, coordinates, 3)
+
+    assert len(boxes) == 9
+    assert abs(sum(_area(box) for box in boxes) - _area(((37.7, 127.2), (37.4, 126.8)))) < 1e-9
+    # 좌표가 몰린 북동쪽 박스는 중앙점 기준 분할보다 작아야 함
+    assert _area(boxes[0]) < _area(((37.7, 127.2), (37.6, 127.0666)))
+
+
+def test_box_splitter_quadrant_mode():
+    boxes = BoxSplitter().divide(37.7, 127.2, 37.4, 126.8, 4000)
+    assert len(boxes) == 4
+
+
+def test_box_splitter_adaptive_mode_counts_saved_requests():
+    splitter = BoxSplitter(adaptive=True)
+    boxes = splitter.divide(37.7, 127.2, 37.4, 126.8, 4000)
+    assert len(boxes) == 25
+    assert splitter.quadtree_box_count - splitter.searched_box_count == 84 - 25
+
+
+def test_box_splitter_counts_quadtree_estimate_once_per_root():
+    splitter = BoxSplitter(adaptive=True)
+    boxes = splitter.divide(37.7, 127.2, 37.4, 126.8, 4000)
+    (ne_lat, ne_lng), (sw_lat, sw_lng) = boxes[0]
+    # 예상보다 숙소가 많아 하위 박스를 다시 분할한 경우, 루트의 4분면 분할 추정에 이미 포함됨
+    splitter.divide(ne_lat, ne_lng, sw_lat, sw_lng, 300)
+
+    assert splitter.quadtree_box_count == 84
+    assert splitter.searched_box_count == 25 + 4
+
+    # 다른 루트 박스는 따로 추정
+    splitter.divide(36.5, 127.56, 36.18, 127.24, 300)
+    assert splitter.quadtree_box_count == 84 + 4
@@ -0,0 +1,111 @@
+import asyncio
+import json
+
+"""
+fakes.py
+브라우저, HTTP 요청 없이 테스트하기 위한 playwright 객체 대역 ( 여러 테스트 파일에서 공유 )
+"""
+
+
+class FakeMainFrame:
+    pass
+
+
+class FakePage:
+    """
+    responsive 가 False 이면 evaluate 가 실패합니다. ( 응답하지 않는 page )
+    navigate() 로 page 이동 이벤트를 발생시킵니다.
+    """
+
+    def __init__(self, request=None):
+        """
+        :param request: page.request 로 사용할 FakeRequestContext
+        """
+        self.main_frame = FakeMainFrame()
+        self.handlers = {}
+        self.responsive = True
+        self.request = request
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def is_closed(self):
+        return False
+
+    async def evaluate(self, expression):
+        if self.responsive is False:
+            raise RuntimeError('Target crashed')
+        return 1
+
+    def navigate(self):
+        self.handlers['framenavigated'](self.main_frame)
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeContextFactory:
+    """
+    PagePool 에 전달하는 context 생성 함수 대역 ( 만든 context 를 기록 )
+    """
+
+    def __init__(self):
+        self.created = []
+
+    async def __call__(self):
+        context = FakeContext()
+        self.created.append(context)
+        return context
+
+
+class FakeResponse:
+    def __init__(self, data, status=200):
+        """
+        :param data: 응답 JSON ( str 이면 응답 본문 )
+        """
+        self.data = data
+        self.status = status
+        self.ok = 200 <= status < 300
+
+    async def json(self):
+        return self.data
+
+    async def body(self):
+        return (self.data if isinstance(self.data, str) else json.dumps(self.data)).encode('utf-8')
+
+
+class FakeRequestContext:
+    """
+    APIRequestContext ( page.request ) 대역
+    요청을 기록하고 respond(method, url, data) 가 반환한 FakeResponse 를 돌려주며, 동시에 진행 중인 요청 개수를 기록합니다.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requested = []  # (method, url, headers, data)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, url, headers=None, timeout=None):
+        return await self._request('GET', url, headers, None)
+
+    async def post(self, url, headers=None, data=None, timeout=None):
+        return await self._request('POST', url, headers, data)
+
+    async def _request(self, method, url, headers, data):
+        self.requested.append((method, url, headers, data))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return self.respond(method, url, data)
+        finally:
+            self.in_flight -= 1
@@ -0,0 +1,191 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import pytest
+from app.lib.browser import PagePool, BrowserLauncher, serve_browser, get_process_tree_rss, get_browser_rss
+from tests.fakes import FakeContext, FakeContextFactory
+
+
+@pytest.mark.asyncio
+async def test_page_pool_recycles_after_max_navigations():
+    new_context = FakeContextFactory()
+    page_pool = await PagePool.create(new_context, 1, max_navigation_count=2)
+
+    for _ in range(2):
+        async with page_pool.acquire() as page:
+            page.navigate()
+    assert len(new_context.created) == 2
+    assert new_context.created[0].closed is True
+
+    async with page_pool.acquire() as page:
+        page.navigate()
+    assert len(new_context.created) == 2  # 새 context 는 이동 횟수가 초기화됨
+
+
+@pytest.mark.asyncio
+async def test_page_pool_replaces_unresponsive_page():
+    new_context = FakeContextFactory()
+    page_pool = await PagePool.create(new_context, 1)
+
+    async with page_pool.acquire() as page:
+        page.responsive = False
+
+    async with page_pool.acquire() as page:
+        assert page.responsive is True
+    assert len(new_context.created) == 2
+
+
+def test_process_tree_rss():
+    if not os.path.isdir('/proc'):
+        pytest.skip('/proc 이 없는 OS')
+    assert get_process_tree_rss(os.getpid()) > 0
+
+
+@pytest.mark.asyncio
+async def test_page_pool_refreshes_rss_after_memory_recycle():
+    new_context = FakeContextFactory()
+    page_pool = await PagePool.create(new_context, 2, max_rss_bytes=100)
+    rss_list = [150, 50]  # 교체 전 측정, 교체 후 측정
+    page_pool.measure_rss = lambda: rss_list.pop(0)
+
+    async with page_pool.acquire() as first_page:
+        async with page_pool.acquire() as second_page:
+            first_page.navigate()
+            second_page.navigate()
+
+    # 첫 번째 교체 후 다시 측정한 값이 기준보다 작으므로 두 번째 page 는 교체하지 않음
+    assert len(new_context.created) == 3
+    assert page_pool.rss_bytes == 50
+
+
+def test_browser_rss_excludes_non_browser_children():
+    if not os.path.isdir('/proc'):
+        pytest.skip('/proc 이 없는 OS')
+    sleep_code = 'import time; time.sleep(10)'
+    driver_code = f"import subprocess, sys, time; subprocess.Popen([sys.executable, '-c', {sleep_code!r}]); time.sleep(10)"
+    # parser pool worker 와 같은 하위 프로세스, 브라우저를 띄운 playwright driver
+    worker = subprocess.Popen([sys.executable, '-c', sleep_code])
+    driver = subprocess.Popen([sys.executable, '-c', driver_code, 'run-driver'])
+    try:
+        for _ in range(50):
+            if get_browser_rss() > 0:
+                break
+            time.sleep(0.1)
+        browser_rss = get_browser_rss()
+
+        assert browser_rss > 0
+        assert browser_rss < get_process_tree_rss(driver.pid)  # driver 자신과 다른 하위 프로세스는 제외
+    finally:
+        worker.kill()
+        driver.kill()
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.contexts = []
+        self.handlers = {}
+
+    def is_connected(self):
+        return self.connected
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    async def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+    def crash(self):
+        self.connected = False
+        self.handlers['disconnected'](self)
+
+
+class FakeChromium:
+    """
+    playwright.chromium 대신 연결, 실행 요청을 기록합니다. reachable 이 False 이면 브라우저 서버에 연결하지 못함
+    """
+
+    def __init__(self, reachable: bool = True):
+        self.reachable = reachable
+        self.connected = []
+        self.launched = []
+
+    async def connect_over_cdp(self, endpoint):
+        if self.reachable is False:
+            raise ConnectionRefusedError(f"connect ECONNREFUSED {endpoint}")
+        browser = FakeBrowser()
+        self.connected.append(browser)
+        return browser
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append((browser, options))
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self, reachable: bool = True):
+        self.chromium = FakeChromium(reachable)
+
+
+@pytest.mark.asyncio
+async def test_browser_launcher_reuses_browser_server():
+    playwright = FakePlaywright()
+    launcher = BrowserLauncher(playwright, True, None, {}, endpoint='http://127.0.0.1:9222')
+
+    await launcher.new_context()
+    await launcher.new_context()
+
+    # 한번 연결한 브라우저 서버에서 context 를 만들고, 브라우저는 띄우지 않음
+    assert len(playwright.chromium.connected) == 1
+    assert len(playwright.chromium.connected[0].contexts) == 2
+    assert playwright.chromium.launched == []
+
+    playwright.chromium.connected[0].connected = False
+    await launcher.new_context()
+
+    assert len(playwright.chromium.connected) == 2  # 연결이 끊어지면 다시 연결
+
+
+@pytest.mark.asyncio
+async def test_browser_launcher_launches_when_server_is_unreachable():
+    playwright = FakePlaywright(reachable=False)
+    launcher = BrowserLauncher(playwright, True, None, {}, endpoint='http://127.0.0.1:9222')
+
+    await launcher.new_context()
+    await launcher.new_context()
+
+    assert len(playwright.chromium.launched) == 1
+    assert playwright.chromium.launched[0][1]['headless'] is True
+
+
+@pytest.mark.asyncio
+async def test_serve_browser_relaunches_crashed_browser(monkeypatch):
+    playwright = FakePlaywright()
+    original_sleep = asyncio.sleep
+    monkeypatch.setattr(asyncio, 'sleep', lambda delay: original_sleep(0))  # 다시 띄우기 전 딜레이 제외
+    task = asyncio.create_task(serve_browser(playwright, 9222, True, None))
+    try:
+        while len(playwright.chromium.launched) == 0:
+            await original_sleep(0)
+        browser, options = playwright.chromium.launched[0]
+        assert '--remote-debugging-port=9222' in options['args']
+
+        browser.crash()
+        while len(playwright.chromium.launched) == 1:
+            await original_sleep(0)
+
+        assert playwright.chromium.launched[1][0].is_connected() is True
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    # 서버를 종료하면 띄워 둔 브라우저도 닫음
+    assert playwright.chromium.launched[1][0].is_connected() is False
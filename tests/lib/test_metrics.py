@@ -0,0 +1,23 @@
+import asyncio
+import pytest
+from app.lib import metrics
+
+
+@pytest.mark.asyncio
+async def test_metrics_scope_counts_each_region_separately():
+    total_before = metrics.counter['test.saved']
+
+    async def collect(count):
+        with metrics.scope():
+            for _ in range(count):
+                metrics.increase('test.saved')
+                await asyncio.sleep(0)
+            # scope 안에서 만든 task 의 값도 같은 범위로 셈
+            await asyncio.create_task(increase_later())
+            return metrics.get('test.saved')
+
+    async def increase_later():
+        metrics.increase('test.saved')
+
+    assert await asyncio.gather(collect(2), collect(5)) == [3, 6]
+    assert metrics.get('test.saved') == total_before + 9  # scope 밖에서는 프로세스 전체 값
@@ -0,0 +1,95 @@
+import json
+import threading
+import urllib.request
+from urllib.parse import urlencode, quote
+import pytest
+from app.lib.mock_airbnb import MockAirbnb, MockAirbnbServer
+from app.core.list import extract_listing_page, extract_listing_list_for_next_page
+from app.core.detail import _extract_listing_info, _extract_listing_info_from_html, _create_review_api_template, \
+    _build_review_url, _extract_review_page
+from app.util import generate_now_date_to_string
+
+DENSITY_MAP = {
+    'seed': 1,
+    'cells': [
+        {'sw_lat': 36.0, 'sw_lng': 127.0, 'ne_lat': 36.1, 'ne_lng': 127.1, 'count': 400},
+        {'sw_lat': 36.5, 'sw_lng': 127.5, 'ne_lat': 36.6, 'ne_lng': 127.6, 'count': 10}
+    ]
+}
+DENSE_BOX = {'ne_lat': 36.1, 'ne_lng': 127.1, 'sw_lat': 36.0, 'sw_lng': 127.0}
+SPARSE_BOX = {'ne_lat': 36.6, 'ne_lng': 127.6, 'sw_lat': 36.5, 'sw_lng': 127.5}
+SEARCH_PATH = f"/s/{quote('대한민국-대전광역시')}/homes"
+
+
+@pytest.fixture(scope='module')
+def server():
+    mock_server = MockAirbnbServer(('127.0.0.1', 0), MockAirbnb.from_density_map(DENSITY_MAP))
+    thread = threading.Thread(target=mock_server.serve_forever, daemon=True)
+    thread.start()
+    yield mock_server
+    mock_server.shutdown()
+    mock_server.server_close()
+
+
+def _get(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read().decode('utf-8')
+
+
+def _post_stays_search(server, cursor, box):
+    raw_params = [{'filterName': name, 'filterValues': [str(value)]} for name, value in box.items()]
+    body = json.dumps({'variables': {'staysSearchRequest': {'cursor': cursor, 'rawParams': raw_params}}}).encode()
+    request = urllib.request.Request(f"{server.base_url}/api/v3/StaysSearch/mock?operationName=StaysSearch",
+                                     data=body, headers={'content-type': 'application/json'})
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def test_search_pages_are_capped(server):
+    html = _get(f"{server.base_url}{SEARCH_PATH}?{urlencode(DENSE_BOX)}")
+    listing_list, searched_count = extract_listing_page(html)
+
+    assert searched_count == 400  # 헤더에는 박스 안의 전체 개수
+    assert len(listing_list) == 18
+
+    state = json.loads(html.split('type="application/json">')[1].split('</script>')[0])
+    cursor_list = state['niobeMinimalClientData'][0][1]['data']['presentation']['staysSearch']['results'][
+        'paginationInfo']['pageCursors']
+    assert len(cursor_list) == 15
+
+    id_set = {listing.id for listing in listing_list}
+    for cursor in cursor_list[1:]:
+        id_set.update(listing.id for listing in
+                      extract_listing_list_for_next_page(_post_stays_search(server, cursor, DENSE_BOX)))
+    assert len(id_set) == 270  # 15 페이지 * 18 개
+
+
+def test_sparse_search_has_single_page(server):
+    html = _get(f"{server.base_url}{SEARCH_PATH}?{urlencode(SPARSE_BOX)}")
+
+    assert extract_listing_page(html)[1] == 10
+    assert "aria-label=\"다음\" disabled" in html
+
+
+def test_room_page_and_review_api(server):
+    listing = next(listing for listing in server.mock.listing_list if listing.review_count > 30)
+    html = _get(f"{server.base_url}/rooms/{listing.id}?translate_ugc=false")
+    base_date = generate_now_date_to_string()
+
+    dom_info = _extract_listing_info(html, base_date, 'html.parser')
+    state_info = _extract_listing_info_from_html(html, base_date)
+    for listing_info in (dom_info, state_info):
+        assert listing_info['title'] == listing.title
+        assert listing_info['rating'] == listing.rating
+        assert listing_info['review_count'] == listing.review_count
+        assert sorted(listing_info['option_list']) == sorted(listing.amenity_list)
+    assert dom_info['reserved_count'] == state_info['reserved_count']
+
+    variables = {'id': 'U3RheUxpc3Rpbmc6MQ==', 'pdpReviewsRequest': {'offset': '0', 'limit': 24}}
+    template = _create_review_api_template(
+        f"{server.base_url}/api/v3/StaysPdpReviewsQuery/mock?operationName=StaysPdpReviewsQuery&"
+        f"{urlencode({'variables': json.dumps(variables)})}", {}
+    )
+    review_list, total_count = _extract_review_page(json.loads(_get(_build_review_url(template, listing.id, 24))))
+    assert total_count == listing.review_count
+    assert len(review_list) == min(24, listing.review_count - 24)
@@ -0,0 +1,44 @@
+import json
+import pytest
+from app.lib import parser_pool
+from app.lib.model import ListingId
+from app.core.list import extract_listing_list, get_searched_listing_total_count
+
+
+def _build_search_html():
+    search_result = {
+        'listing': {'id': '123', 'coordinate': {'latitude': 36.3, 'longitude': 127.4}},
+        'avgRatingLocalized': '4.87 (31)'
+    }
+    state = {
+        'niobeMinimalClientData': [
+            ['StaysSearch', {'data': {'presentation': {'staysSearch': {'results': {'searchResults': [search_result]}}}}}]
+        ]
+    }
+    return ('<html><body><h1 data-testid="stays-page-heading">숙소 1,024개</h1>'
+            f'<script id="data-deferred-state-0" type="application/json">{json.dumps(state)}</script></body></html>')
+
+
+@pytest.mark.asyncio
+async def test_parse_inline_without_pool():
+    assert parser_pool.executor is None
+    assert await parser_pool.parse(get_searched_listing_total_count, _build_search_html()) == 1024
+
+
+@pytest.mark.asyncio
+async def test_parse_in_process_pool():
+    html = _build_search_html()
+    parser_pool.open_parser_pool(1)
+    parser_pool.open_parser_pool(1)  # 다른 지역 수집이 같은 pool 을 공유
+    try:
+        listing_list = await parser_pool.parse(extract_listing_list, html)
+        searched_count = await parser_pool.parse(get_searched_listing_total_count, html)
+    finally:
+        parser_pool.close_parser_pool(1)
+        assert parser_pool.executor is not None
+        parser_pool.close_parser_pool(1)
+
+    assert parser_pool.executor is None
+    assert listing_list == extract_listing_list(html) == [ListingId('123', (36.3, 127.4))]
+    assert listing_list[0].review_count == 31
+    assert searched_count == 1024
@@ -0,0 +1,47 @@
+from app.lib.resource_filter import ResourceFilter, get_page_type
+from app.constants import BLOCKED_RESOURCE_LIST, ALLOWED_DOMAIN_LIST
+
+
+class FakeFrame:
+    def __init__(self, url):
+        self.url = url
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type, frame_url='https://www.airbnb.co.kr/rooms/1', is_navigation=False):
+        self.url = url
+        self.resource_type = resource_type
+        self.frame = FakeFrame(frame_url)
+        self.is_navigation = is_navigation
+
+    def is_navigation_request(self):
+        return self.is_navigation
+
+
+def test_block_reason():
+    resource_filter = ResourceFilter(BLOCKED_RESOURCE_LIST, ALLOWED_DOMAIN_LIST)
+
+    assert resource_filter._get_block_reason(FakeRequest('https://a0.muscache.com/im/1.jpg', 'image')) == 'image'
+    assert resource_filter._get_block_reason(FakeRequest('https://a0.muscache.com/airbnb/app.js', 'script')) is None
+    assert resource_filter._get_block_reason(
+        FakeRequest('https://www.airbnb.co.kr/api/v3/StaysSearch/abc', 'fetch')) is None
+    assert resource_filter._get_block_reason(
+        FakeRequest('https://www.googletagmanager.com/gtm.js', 'script')) == 'third-party'
+    assert resource_filter._get_block_reason(
+        FakeRequest('https://www.airbnb.co.kr/rooms/1', 'document', is_navigation=True)) is None
+
+
+def test_measure_only():
+    resource_filter = ResourceFilter([], ALLOWED_DOMAIN_LIST)
+
+    assert resource_filter._get_block_reason(FakeRequest('https://a0.muscache.com/im/1.jpg', 'image')) is None
+    assert resource_filter._get_block_reason(FakeRequest('https://www.googletagmanager.com/gtm.js', 'script')) is None
+
+
+def test_page_type():
+    assert get_page_type(FakeRequest('https://a0.muscache.com/im/1.jpg', 'image')) == 'detail'
+    assert get_page_type(FakeRequest('https://a0.muscache.com/im/1.jpg', 'image',
+                                     frame_url='https://www.airbnb.co.kr/s/homes')) == 'search'
+    # 이동 중인 요청은 이동할 url 기준
+    assert get_page_type(FakeRequest('https://www.airbnb.co.kr/s/homes', 'document',
+                                     is_navigation=True)) == 'search'
@@ -0,0 +1,96 @@
+from app.lib.seen_index import SeenIndex
+
+
+def test_seen_index_add_and_contains(tmp_path):
+    index = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    index.add('1186562601711001653')
+    index.update(['1186562601711001654', '53112233'])
+
+    assert '1186562601711001653' in index
+    assert '1186562601711001654' in index
+    assert '1186562601711001655' not in index  # 19자리 id 의 마지막 자리만 다른 경우도 구분
+    assert len(index) == 3
+    index.close()
+
+
+def test_seen_index_is_shared_and_persistent(tmp_path):
+    writer = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    reader = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    writer.add('1186562601711001653')
+
+    assert '1186562601711001653' in reader  # 같은 파일을 연 다른 인스턴스( 프로세스 )에서 보임
+    writer.close()
+    reader.close()
+
+    reopened = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    assert '1186562601711001653' in reopened
+    assert len(reopened) == 1
+    reopened.close()
+
+    other_date = SeenIndex.open('2024-08-21', directory=str(tmp_path), capacity=1024)
+    assert '1186562601711001653' not in other_date
+    other_date.close()
+
+
+def test_seen_index_discard_keeps_probe_chain(tmp_path):
+    index = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=8)
+    listing_ids = [str(num) for num in range(1, 6)]
+    index.update(listing_ids)
+    index.discard('1')
+
+    assert '1' not in index
+    assert all(listing_id in index for listing_id in listing_ids[1:])
+    index.close()
+
+
+def test_seen_index_falls_back_for_non_numeric_and_full_table(tmp_path):
+    index = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=4)
+    index.update(['U3RheUxpc3Rpbmc6MTIz', '1', '2', '3', '4'])
+
+    assert 'U3RheUxpc3Rpbmc6MTIz' in index
+    assert all(listing_id in index for listing_id in ['1', '2', '3', '4'])
+    assert len(index.fallback) == 2  # 숫자가 아닌 id, 최대 적재율을 넘은 id
+    index.close()
+
+
+def test_seen_index_pending_ids_are_persisted_after_flush(tmp_path):
+    writer = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    reader = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    writer.add_pending('1186562601711001653')
+    writer.add_pending('1186562601711001654')
+
+    # 저장 전에는 같은 프로세스에서만 보임
+    assert '1186562601711001653' in writer
+    assert '1186562601711001653' not in reader
+
+    writer.persist(['1186562601711001653'])
+    writer.discard_pending(['1186562601711001654'])  # 저장 실패
+
+    assert '1186562601711001653' in reader
+    assert '1186562601711001654' not in writer
+    assert len(writer.pending) == 0
+    writer.close()
+    reader.close()
+
+
+def test_seen_index_size_is_shared(tmp_path):
+    first = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    second = SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=1024)
+    first.add('1')
+    second.add('2')
+    second.add('1')  # 다른 인스턴스가 이미 추가한 id
+
+    assert first.size == second.size == 2
+    second.discard('2')
+    assert first.size == 1
+    first.close()
+    second.close()
+
+
+def test_seen_index_removes_previous_date_files(tmp_path):
+    SeenIndex.open('2024-08-19', directory=str(tmp_path), capacity=8).close()
+    (tmp_path / 'other.bin').write_bytes(b'')
+
+    SeenIndex.open('2024-08-20', directory=str(tmp_path), capacity=8).close()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['other.bin', 'seen-2024-08-20.bin']
@@ -0,0 +1,131 @@
+import asyncio
+import pytest
+from app.lib.writer import ListingWriter
+from app.constants import MAX_BIND_PARAMETERS
+
+
+class FakeListingWriter(ListingWriter):
+    """
+    DB 대신 저장 요청된 행을 기록하고, 지정한 횟수만큼 저장에 실패합니다.
+    """
+
+    def __init__(self, *args, failure_count=0, insert_started=None, insert_released=None, **kwargs):
+        super().__init__(*args, retry_delay=0, **kwargs)
+        self.failure_count = failure_count
+        self.inserted = []
+        self.attempt_count = 0
+        self.insert_started = insert_started  # 주어지면 저장을 시작할 때 set
+        self.insert_released = insert_released  # 주어지면 set 될 때까지 저장이 끝나지 않음
+
+    async def _insert(self, rows):
+        self.attempt_count += 1
+        if self.insert_started is not None:
+            self.insert_started.set()
+        if self.insert_released is not None:
+            await self.insert_released.wait()
+        if self.failure_count > 0:
+            self.failure_count -= 1
+            raise ConnectionError('connection lost')
+        self.inserted.append([row['id'] for row in rows])
+        return len(rows)
+
+
+def create_row(listing_id):
+    return {'id': listing_id, 'collect_date': '2024-05-01'}
+
+
+@pytest.mark.asyncio
+async def test_flush_when_batch_is_full():
+    writer = FakeListingWriter(2, 60)
+    await writer.add(create_row('1'))
+    assert writer.inserted == []
+
+    await writer.add(create_row('2'))
+    await writer.add(create_row('3'))
+
+    assert writer.inserted == [['1', '2']]
+    assert len(writer.buffer) == 1
+
+
+@pytest.mark.asyncio
+async def test_flush_periodically_and_drain_on_close():
+    flushed = []
+    writer = FakeListingWriter(100, 0.01, on_flushed=lambda rows: flushed.extend(row['id'] for row in rows))
+    await writer.start()
+    await writer.add(create_row('1'))
+    await asyncio.sleep(0.05)
+
+    assert writer.inserted == [['1']]
+
+    await writer.add(create_row('2'))
+    await writer.close()
+
+    assert writer.inserted == [['1'], ['2']]
+    assert flushed == ['1', '2']
+    assert writer.flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_retry_failed_flush():
+    failed = []
+    writer = FakeListingWriter(10, 60, failure_count=2, on_failed=failed.extend)
+    await writer.add(create_row('1'))
+    await writer.close()
+
+    assert writer.attempt_count == 3
+    assert writer.inserted == [['1']]
+    assert failed == []
+
+
+@pytest.mark.asyncio
+async def test_give_up_after_max_retry():
+    failed, flushed = [], []
+    writer = FakeListingWriter(10, 60, failure_count=10, max_retry=2, on_failed=failed.extend, on_flushed=flushed.extend)
+    await writer.add(create_row('1'))
+    await writer.add(create_row('2'))
+    await writer.close()
+
+    assert writer.attempt_count == 3
+    assert [row['id'] for row in failed] == ['1', '2']
+    assert flushed == []
+
+
+def test_batch_size_is_clamped_by_bind_parameter_limit():
+    writer = FakeListingWriter(100000, 60)
+
+    assert writer.batch_size == MAX_BIND_PARAMETERS // 12  # listing 컬럼 12개
+    assert FakeListingWriter(500, 60).batch_size == 500
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_flush_in_progress():
+    insert_started, insert_released = asyncio.Event(), asyncio.Event()
+    writer = FakeListingWriter(100, 0.01, insert_started=insert_started, insert_released=insert_released)
+    await writer.start()
+    await writer.add(create_row('1'))
+    await insert_started.wait()  # 주기적 저장이 INSERT 를 기다리는 중
+
+    close_task = asyncio.create_task(writer.close())
+    await asyncio.sleep(0.02)
+    await writer.add(create_row('2'))
+    insert_released.set()
+    await close_task
+
+    # 진행 중인 저장을 취소하지 않고, 그 사이 추가된 행도 저장
+    assert writer.inserted == [['1'], ['2']]
+    assert writer.buffer == []
+
+
+@pytest.mark.asyncio
+async def test_cancelled_flush_returns_rows_to_buffer():
+    insert_started = asyncio.Event()
+    writer = FakeListingWriter(100, 60, insert_started=insert_started, insert_released=asyncio.Event())
+    await writer.add(create_row('1'))
+    flush_task = asyncio.create_task(writer.flush())
+    await insert_started.wait()
+    await writer.add(create_row('2'))
+
+    flush_task.cancel()
+    await asyncio.gather(flush_task, return_exceptions=True)
+
+    assert [row['id'] for row in writer.buffer] == ['1', '2']
@@ -0,0 +1,40 @@
+import asyncio
+import pytest
+from app.util import calculate_zoom_level, is_in_box, gather_or_cancel
+
+
+def test_calculate_zoom_level():
+    # 에어비앤비 지도 검색 샘플 url 의 박스 ( zoom=12.345531387076726 )
+    zoom = calculate_zoom_level(36.41115578705275, 127.45687393351176, 36.27164403580622, 127.28961938990949)
+    assert 12 <= zoom <= 13
+
+    # 박스가 작아질수록 zoom 이 커짐
+    assert calculate_zoom_level(36.3, 127.3, 36.29, 127.29) > zoom
+    assert calculate_zoom_level(36.3, 127.3, 36.3, 127.3) == 20
+
+
+def test_is_in_box():
+    assert is_in_box((36.3, 127.3), 36.4, 127.4, 36.2, 127.2)
+    assert not is_in_box((36.5, 127.3), 36.4, 127.4, 36.2, 127.2)
+
+
+@pytest.mark.asyncio
+async def test_gather_or_cancel_waits_for_cancelled_siblings():
+    finished = []
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError('fail')
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        finally:
+            finished.append('work')  # 정리 작업
+
+    with pytest.raises(ValueError):
+        await gather_or_cancel(fail(), work(), work())
+
+    # 예외가 전달되기 전에 나머지 task 가 취소되고 정리까지 끝남
+    assert finished == ['work', 'work']
+    assert await gather_or_cancel(asyncio.sleep(0, 'a'), asyncio.sleep(0, 'b')) == ['a', 'b']